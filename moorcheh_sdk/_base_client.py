@@ -1,6 +1,9 @@
+import importlib.util
 import random
 import ssl
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any, cast
 
 import httpx
@@ -10,6 +13,25 @@ from .utils.logging import setup_logging
 
 logger = setup_logging(__name__)
 
+# Idle connections are kept long enough to be reused across bursts of requests,
+# so repeated calls skip the TCP/TLS handshake.
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=32, keepalive_expiry=60.0
+)
+
+# httpx only speaks HTTP/2 when the optional h2 package is installed.
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+def _resolve_http2(http2: bool) -> bool:
+    if http2 and not HAS_H2:
+        logger.warning(
+            "http2 was requested but the h2 package is not installed. Falling back"
+            " to HTTP/1.1."
+        )
+        return False
+    return http2
+
 
 class SyncAPIClient:
     _client: httpx.Client
@@ -23,6 +45,7 @@ class SyncAPIClient:
         http_client: httpx.Client | None = None,
         custom_headers: Headers | None = None,
         max_retries: int = 3,
+        http2: bool = False,
     ) -> None:
         if http_client is not None:
             self._client = http_client
@@ -42,6 +65,8 @@ class SyncAPIClient:
                 base_url=base_url,
                 headers=headers,
                 timeout=timeout,
+                limits=DEFAULT_CONNECTION_LIMITS,
+                http2=_resolve_http2(http2),
                 verify=ssl.create_default_context(),  # Bypasses certifi overhead
             )
 
@@ -81,19 +106,51 @@ class SyncAPIClient:
             **cast(Any, kwargs),
         )
 
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: Any = None,
+        json: Body | None = None,
+        headers: Headers | None = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Sends a request under the same retry policy as `request` and yields the
+        response with its body still unread. The response is closed on exit.
+        """
+        kwargs: dict[str, Any] = {"json": json, "headers": headers}
+        if content is not None:
+            kwargs["content"] = content
+        response = self._retry_request(method=method, url=path, stream=True, **kwargs)
+        try:
+            yield response
+        finally:
+            response.close()
+
     def _retry_request(
         self,
         method: str,
         url: str,
+        stream: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
         retries = 0
         while True:
             try:
-                response = self._client.request(method=method, url=url, **kwargs)
+                if stream:
+                    response = self._client.send(
+                        self._client.build_request(method=method, url=url, **kwargs),
+                        stream=True,
+                    )
+                else:
+                    response = self._client.request(method=method, url=url, **kwargs)
                 if response.status_code == 429 or response.status_code >= 500:
                     if retries >= self._max_retries:
                         return response
+                    if stream:
+                        response.close()
 
                     retry_after = response.headers.get("Retry-After")
                     if retry_after:
@@ -160,6 +217,7 @@ class AsyncAPIClient:
         http_client: httpx.AsyncClient | None = None,
         custom_headers: Headers | None = None,
         max_retries: int = 3,
+        http2: bool = False,
     ) -> None:
         if http_client is not None:
             self._client = http_client
@@ -179,6 +237,8 @@ class AsyncAPIClient:
                 base_url=base_url,
                 headers=headers,
                 timeout=timeout,
+                limits=DEFAULT_CONNECTION_LIMITS,
+                http2=_resolve_http2(http2),
                 verify=ssl.create_default_context(),  # Bypasses certifi overhead
             )
 
@@ -218,10 +278,36 @@ class AsyncAPIClient:
             **cast(Any, kwargs),
         )
 
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        *,
+        content: Any = None,
+        json: Body | None = None,
+        headers: Headers | None = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Sends a request under the same retry policy as `request` and yields the
+        response with its body still unread. The response is closed on exit.
+        """
+        kwargs: dict[str, Any] = {"json": json, "headers": headers}
+        if content is not None:
+            kwargs["content"] = content
+        response = await self._retry_request(
+            method=method, url=path, stream=True, **kwargs
+        )
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
     async def _retry_request(
         self,
         method: str,
         url: str,
+        stream: bool = False,
         **kwargs: Any,
     ) -> httpx.Response:
         import asyncio
@@ -229,10 +315,20 @@ class AsyncAPIClient:
         retries = 0
         while True:
             try:
-                response = await self._client.request(method=method, url=url, **kwargs)
+                if stream:
+                    response = await self._client.send(
+                        self._client.build_request(method=method, url=url, **kwargs),
+                        stream=True,
+                    )
+                else:
+                    response = await self._client.request(
+                        method=method, url=url, **kwargs
+                    )
                 if response.status_code == 429 or response.status_code >= 500:
                     if retries >= self._max_retries:
                         return response
+                    if stream:
+                        await response.aclose()
 
                     retry_after = response.headers.get("Retry-After")
                     if retry_after:
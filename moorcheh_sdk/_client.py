@@ -1,4 +1,6 @@
+import asyncio
 import os
+from collections.abc import AsyncIterator, Iterator
 from functools import cached_property
 from typing import Any, cast
 
@@ -27,11 +29,20 @@ from .resources import (
     Vectors,
 )
 from .types import Body, Query, Timeout
+from .utils.cache import TTLCache
 from .utils.constants import DEFAULT_BASE_URL
 from .utils.logging import setup_logging
+from .utils.serialization import HAS_ORJSON, json_dumps, json_loads
+from .utils.sse import SSEDecoder
 
 logger = setup_logging(__name__)
 
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+_SSE_ACCEPT = {"Accept": "text/event-stream"}
+_SSE_JSON_HEADERS = {**_SSE_ACCEPT, **_JSON_CONTENT_TYPE}
+_SSE_DONE = "[DONE]"
+_SSE_CONTENT_TYPE = "text/event-stream"
+
 
 class MoorchehClient(SyncAPIClient, LegacyClientMixin):
     """
@@ -63,6 +74,13 @@ class MoorchehClient(SyncAPIClient, LegacyClientMixin):
         base_url: str | None = None,
         timeout: Timeout = 30.0,
         max_retries: int = 3,
+        answer_cache_size: int = 0,
+        answer_cache_ttl: float = 300.0,
+        search_cache_size: int = 0,
+        search_cache_ttl: float = 60.0,
+        namespace_list_ttl: float = 0.0,
+        fast_json: bool = False,
+        http2: bool = False,
     ):
         """
         Initializes the MoorchehClient.
@@ -80,6 +98,25 @@ class MoorchehClient(SyncAPIClient, LegacyClientMixin):
                 the `MOORCHEH_BASE_URL` environment variable, otherwise uses
                 the default production URL.
             timeout: Request timeout in seconds for HTTP requests. Defaults to 30.0.
+            answer_cache_size: Maximum number of deterministic (temperature 0)
+                answers kept in an exact-match cache. Disabled (0) by default,
+                since answers change as namespace contents are updated.
+            answer_cache_ttl: Time-to-live of cached answers in seconds.
+                Defaults to 300.0.
+            search_cache_size: Maximum number of search responses kept in an
+                exact-match cache keyed by the full request. Disabled (0) by
+                default, since results change as namespaces are updated.
+            search_cache_ttl: Time-to-live of cached search responses in
+                seconds. Defaults to 60.0.
+            namespace_list_ttl: Seconds for which `namespaces.list()` results
+                are reused. Creating or deleting a namespace through this
+                client clears the cached list. Defaults to 0.0 (disabled).
+            fast_json: Encode request bodies and decode responses with orjson
+                (install the `fast` extra). Ignored with a warning if orjson is
+                not installed. Defaults to False.
+            http2: Negotiate HTTP/2 so concurrent requests are multiplexed over
+                a single connection (install the `http2` extra). Ignored with a
+                warning if h2 is not installed. Defaults to False.
 
         Raises:
             AuthenticationError: If the API key is not provided either as a
@@ -96,6 +133,21 @@ class MoorchehClient(SyncAPIClient, LegacyClientMixin):
             base_url or os.environ.get("MOORCHEH_BASE_URL") or DEFAULT_BASE_URL
         ).rstrip("/")
         self.timeout = timeout
+        self._answer_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+            maxsize=answer_cache_size, ttl=answer_cache_ttl
+        )
+        self._search_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+            maxsize=search_cache_size, ttl=search_cache_ttl
+        )
+        self._namespace_list_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=1 if namespace_list_ttl > 0 else 0, ttl=namespace_list_ttl
+        )
+        if fast_json and not HAS_ORJSON:
+            logger.warning(
+                "fast_json was requested but orjson is not installed. Falling back"
+                " to the standard json module."
+            )
+        self._fast_json = fast_json and HAS_ORJSON
 
         from . import __version__ as sdk_version
 
@@ -105,6 +157,7 @@ class MoorchehClient(SyncAPIClient, LegacyClientMixin):
             timeout=self.timeout,
             custom_headers={"User-Agent": f"moorcheh-python-sdk/{sdk_version}"},
             max_retries=max_retries,
+            http2=http2,
         )
 
         logger.info(
@@ -148,12 +201,21 @@ class MoorchehClient(SyncAPIClient, LegacyClientMixin):
             endpoint = "/" + endpoint
 
         try:
-            response = self.request(
-                method=method,
-                path=endpoint,
-                json=json_data,
-                params=params,
-            )
+            if self._fast_json and json_data is not None:
+                response = self.request(
+                    method=method,
+                    path=endpoint,
+                    content=json_dumps(json_data),
+                    headers=_JSON_CONTENT_TYPE,
+                    params=params,
+                )
+            else:
+                response = self.request(
+                    method=method,
+                    path=endpoint,
+                    json=json_data,
+                    params=params,
+                )
             logger.debug(f"Received response with status code: {response.status_code}")
 
             return self._process_response(
@@ -185,6 +247,72 @@ class MoorchehClient(SyncAPIClient, LegacyClientMixin):
             )
             raise MoorchehError(f"An unexpected error occurred: {e}") from e
 
+    def _request_stream(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Body | None = None,
+    ) -> Iterator[str | dict[str, Any] | bytes | None]:
+        """
+        Internal helper that performs a streaming request and yields the data of
+        each Server-Sent Event until the stream ends or sends `[DONE]`. The
+        request is retried like `_request` until the response starts. A
+        response that is not an event stream is yielded once, decoded as by
+        `_request`.
+        """
+        if not endpoint.startswith("/"):
+            endpoint = "/" + endpoint
+
+        if self._fast_json and json_data is not None:
+            body: dict[str, Any] = {
+                "content": json_dumps(json_data),
+                "headers": _SSE_JSON_HEADERS,
+            }
+        else:
+            body = {"json": json_data, "headers": _SSE_ACCEPT}
+
+        try:
+            with self.stream(method, endpoint, **body) as response:
+                logger.debug(
+                    f"Received streaming response with status code: {response.status_code}"
+                )
+                if response.status_code != 200:
+                    response.read()
+                    self._handle_error_response(response, endpoint)
+
+                content_type = response.headers.get("content-type", "").lower()
+                if not content_type.startswith(_SSE_CONTENT_TYPE):
+                    # The server answered without streaming; yield the decoded body.
+                    response.read()
+                    yield self._process_response(response, endpoint, 200, None)
+                    return
+
+                decoder = SSEDecoder()
+                for line in response.iter_lines():
+                    data = decoder.decode(line)
+                    if data is None:
+                        continue
+                    if data == _SSE_DONE:
+                        return
+                    yield data
+                data = decoder.flush()
+                if data is not None and data != _SSE_DONE:
+                    yield data
+
+        except httpx.TimeoutException as timeout_e:
+            logger.error(
+                f"Streaming request to {endpoint} timed out after {self.timeout} seconds.",
+                exc_info=True,
+            )
+            raise MoorchehError(
+                f"Request timed out after {self.timeout} seconds."
+            ) from timeout_e
+        except httpx.RequestError as req_e:
+            logger.error(
+                f"Network or request error for {endpoint}: {req_e}", exc_info=True
+            )
+            raise MoorchehError(f"Network or request error: {req_e}") from req_e
+
     def _process_response(
         self,
         response: httpx.Response,
@@ -220,7 +348,9 @@ class MoorchehClient(SyncAPIClient, LegacyClientMixin):
                 if not response.content:
                     logger.debug("Response content is empty, returning empty dict.")
                     return {}
-                json_response = response.json()
+                json_response = (
+                    json_loads(response.content) if self._fast_json else response.json()
+                )
                 logger.debug(f"Decoded JSON response: {json_response}")
                 return cast(dict[str, Any], json_response)
             except Exception as json_e:
@@ -318,6 +448,13 @@ class AsyncMoorchehClient(AsyncAPIClient):
         base_url: str | None = None,
         timeout: Timeout = 30.0,
         max_retries: int = 3,
+        answer_cache_size: int = 0,
+        answer_cache_ttl: float = 300.0,
+        search_cache_size: int = 0,
+        search_cache_ttl: float = 60.0,
+        namespace_list_ttl: float = 0.0,
+        fast_json: bool = False,
+        http2: bool = False,
     ):
         self.api_key = api_key or os.environ.get("MOORCHEH_API_KEY")
         if not self.api_key:
@@ -330,6 +467,22 @@ class AsyncMoorchehClient(AsyncAPIClient):
             base_url or os.environ.get("MOORCHEH_BASE_URL") or DEFAULT_BASE_URL
         ).rstrip("/")
         self.timeout = timeout
+        self._answer_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+            maxsize=answer_cache_size, ttl=answer_cache_ttl
+        )
+        self._search_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+            maxsize=search_cache_size, ttl=search_cache_ttl
+        )
+        self._namespace_list_cache: TTLCache[str, dict[str, Any]] = TTLCache(
+            maxsize=1 if namespace_list_ttl > 0 else 0, ttl=namespace_list_ttl
+        )
+        self._answer_inflight: dict[bytes, asyncio.Future[dict[str, Any]]] = {}
+        if fast_json and not HAS_ORJSON:
+            logger.warning(
+                "fast_json was requested but orjson is not installed. Falling back"
+                " to the standard json module."
+            )
+        self._fast_json = fast_json and HAS_ORJSON
 
         from . import __version__ as sdk_version
 
@@ -339,6 +492,7 @@ class AsyncMoorchehClient(AsyncAPIClient):
             timeout=self.timeout,
             custom_headers={"User-Agent": f"moorcheh-python-sdk/{sdk_version}"},
             max_retries=max_retries,
+            http2=http2,
         )
 
         logger.info(
@@ -382,12 +536,21 @@ class AsyncMoorchehClient(AsyncAPIClient):
             endpoint = "/" + endpoint
 
         try:
-            response = await self.request(
-                method=method,
-                path=endpoint,
-                json=json_data,
-                params=params,
-            )
+            if self._fast_json and json_data is not None:
+                response = await self.request(
+                    method=method,
+                    path=endpoint,
+                    content=json_dumps(json_data),
+                    headers=_JSON_CONTENT_TYPE,
+                    params=params,
+                )
+            else:
+                response = await self.request(
+                    method=method,
+                    path=endpoint,
+                    json=json_data,
+                    params=params,
+                )
             logger.debug(f"Received response with status code: {response.status_code}")
 
             return self._process_response(
@@ -419,6 +582,72 @@ class AsyncMoorchehClient(AsyncAPIClient):
             )
             raise MoorchehError(f"An unexpected error occurred: {e}") from e
 
+    async def _request_stream(
+        self,
+        method: str,
+        endpoint: str,
+        json_data: Body | None = None,
+    ) -> AsyncIterator[str | dict[str, Any] | bytes | None]:
+        """
+        Internal helper that performs a streaming request and yields the data of
+        each Server-Sent Event until the stream ends or sends `[DONE]`. The
+        request is retried like `_request` until the response starts. A
+        response that is not an event stream is yielded once, decoded as by
+        `_request`.
+        """
+        if not endpoint.startswith("/"):
+            endpoint = "/" + endpoint
+
+        if self._fast_json and json_data is not None:
+            body: dict[str, Any] = {
+                "content": json_dumps(json_data),
+                "headers": _SSE_JSON_HEADERS,
+            }
+        else:
+            body = {"json": json_data, "headers": _SSE_ACCEPT}
+
+        try:
+            async with self.stream(method, endpoint, **body) as response:
+                logger.debug(
+                    f"Received streaming response with status code: {response.status_code}"
+                )
+                if response.status_code != 200:
+                    await response.aread()
+                    self._handle_error_response(response, endpoint)
+
+                content_type = response.headers.get("content-type", "").lower()
+                if not content_type.startswith(_SSE_CONTENT_TYPE):
+                    # The server answered without streaming; yield the decoded body.
+                    await response.aread()
+                    yield self._process_response(response, endpoint, 200, None)
+                    return
+
+                decoder = SSEDecoder()
+                async for line in response.aiter_lines():
+                    data = decoder.decode(line)
+                    if data is None:
+                        continue
+                    if data == _SSE_DONE:
+                        return
+                    yield data
+                data = decoder.flush()
+                if data is not None and data != _SSE_DONE:
+                    yield data
+
+        except httpx.TimeoutException as timeout_e:
+            logger.error(
+                f"Streaming request to {endpoint} timed out after {self.timeout} seconds.",
+                exc_info=True,
+            )
+            raise MoorchehError(
+                f"Request timed out after {self.timeout} seconds."
+            ) from timeout_e
+        except httpx.RequestError as req_e:
+            logger.error(
+                f"Network or request error for {endpoint}: {req_e}", exc_info=True
+            )
+            raise MoorchehError(f"Network or request error: {req_e}") from req_e
+
     def _process_response(
         self,
         response: httpx.Response,
@@ -454,7 +683,9 @@ class AsyncMoorchehClient(AsyncAPIClient):
                 if not response.content:
                     logger.debug("Response content is empty, returning empty dict.")
                     return {}
-                json_response = response.json()
+                json_response = (
+                    json_loads(response.content) if self._fast_json else response.json()
+                )
                 logger.debug(f"Decoded JSON response: {json_response}")
                 return cast(dict[str, Any], json_response)
             except Exception as json_e:
@@ -1,22 +1,193 @@
+import asyncio
+import copy
+import logging
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, cast
 
 from ..exceptions import APIError, InvalidInputError
-from ..types import AnswerResponse, ChatHistoryItem
+from ..types import AnswerResponse, AnswerStreamChunk, ChatHistoryItem
+from ..utils.cache import payload_cache_key
+from ..utils.concurrency import gather_bounded, map_concurrently
+from ..utils.constants import DEFAULT_MAX_CONCURRENCY, NUMERIC_TYPES
 from ..utils.decorators import required_args
 from ..utils.logging import setup_logging
+from ..utils.serialization import json_loads
+from ..utils.validators import check_required
 from .base import AsyncBaseResource, BaseResource
 
 logger = setup_logging(__name__)
 
+DEFAULT_AI_MODEL = "anthropic.claude-sonnet-4-6"
+
+# Payload fields sent with every namespace-scoped request; `top_k` is
+# overridden when the caller provides one.
+_NAMESPACE_PAYLOAD_DEFAULTS: dict[str, Any] = {
+    "type": "text",  # Hardcoded as per API design
+    "top_k": 5,
+}
+_DEFAULT_KIOSK_THRESHOLD = 0.25
+
+
+class _AbandonedRequest(Exception):
+    """Set on a shared in-flight answer request whose sender was cancelled."""
+
+
+def _answer_cache_key(payload: dict[str, Any]) -> bytes | None:
+    """
+    Returns the exact-match cache key for an answer payload.
+
+    Only deterministic requests (temperature 0) are cacheable; None is returned
+    for every other payload.
+    """
+    if payload["temperature"] != 0:
+        return None
+    return payload_cache_key(payload)
+
+
+def _build_answer_payload(
+    query: str,
+    namespace: str | None = None,
+    top_k: int | None = None,
+    ai_model: str = DEFAULT_AI_MODEL,
+    chat_history: list[ChatHistoryItem] | None = None,
+    temperature: float = 0.7,
+    header_prompt: str | None = None,
+    footer_prompt: str | None = None,
+    threshold: float | None = None,
+    kiosk_mode: bool = False,
+    structured_response: dict | None = None,
+) -> dict[str, Any]:
+    """
+    Validates the arguments of an answer request and builds its payload.
+
+    Shared by the sync and async `generate`, `stream` and `generate_many`
+    methods. The public methods check their signature through `required_args`;
+    batch requests arrive as keyword dictionaries, so the checks are repeated
+    here for them.
+    """
+    check_required("query", query, str)
+    if namespace is None or not isinstance(namespace, str):
+        raise InvalidInputError("Argument 'namespace' must be a string.")
+    if namespace:
+        if top_k is not None:
+            if not isinstance(top_k, int) or top_k <= 0:
+                raise InvalidInputError("'top_k' must be a positive integer.")
+        if threshold is not None:
+            if not isinstance(threshold, NUMERIC_TYPES) or not 0 <= threshold <= 1:
+                raise InvalidInputError(
+                    "'threshold' must be a number between 0 and 1, or None."
+                )
+            if not kiosk_mode:
+                logger.warning(
+                    "'threshold' is set but 'kiosk_mode' is disabled. 'threshold' will be ignored."
+                )
+        logger.info(
+            "Attempting to get generative answer for query in namespace '%s'...",
+            namespace,
+        )
+    else:
+        if top_k is not None:
+            logger.warning(
+                "'top_k' was provided with an empty 'namespace' and will be ignored."
+            )
+        if kiosk_mode:
+            logger.warning(
+                "'kiosk_mode' was enabled with an empty 'namespace' and will be ignored."
+            )
+        if threshold is not None:
+            logger.warning(
+                "'threshold' was provided with an empty 'namespace' and will be ignored."
+            )
+        logger.info(
+            "Attempting to get generative answer for query without namespace..."
+        )
+    if not ai_model:
+        raise InvalidInputError("Argument 'ai_model' cannot be empty.")
+
+    if not isinstance(temperature, NUMERIC_TYPES) or not 0 <= temperature <= 2:
+        raise InvalidInputError("'temperature' must be a number between 0.0 and 2.0.")
+
+    if structured_response is not None and not isinstance(structured_response, dict):
+        raise InvalidInputError("'structured_response' must be a dict or None.")
+
+    payload: dict[str, Any] = {
+        "namespace": namespace,
+        "query": query,
+        "aiModel": ai_model,
+        "chatHistory": [] if chat_history is None else chat_history,
+        "temperature": temperature,
+        "headerPrompt": header_prompt or "",
+        "footerPrompt": footer_prompt or "",
+    }
+    if structured_response is not None:
+        payload["structuredResponse"] = structured_response
+    if namespace:
+        payload.update(_NAMESPACE_PAYLOAD_DEFAULTS)
+        if top_k is not None:
+            payload["top_k"] = top_k
+        payload["kiosk_mode"] = kiosk_mode
+        if kiosk_mode:
+            payload["threshold"] = (
+                _DEFAULT_KIOSK_THRESHOLD if threshold is None else threshold
+            )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Generative answer payload: %s", payload)
+    return payload
+
+
+def _build_answer_payloads(queries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Validates every request of a batch before any of them is sent."""
+    payloads = []
+    for i, query_kwargs in enumerate(queries):
+        if not isinstance(query_kwargs, dict):
+            raise InvalidInputError(
+                f"Item at index {i} in 'queries' is not a dictionary."
+            )
+        try:
+            payloads.append(_build_answer_payload(**query_kwargs))
+        except TypeError as e:
+            raise InvalidInputError(str(e)) from e
+    return payloads
+
+
+def _check_answer_response(response_data: Any) -> dict[str, Any]:
+    if not isinstance(response_data, dict):
+        logger.error("Generative answer response was not a dictionary.")
+        raise APIError(
+            message="Unexpected response format from generative answer endpoint."
+        )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Answer generation completed successfully. Answer length: %d",
+            len(response_data.get("answer", "")),
+        )
+    return response_data
+
+
+def _parse_stream_frame(data: str) -> dict[str, Any]:
+    """
+    Decodes one streamed answer event.
+
+    JSON objects are returned as-is; any other payload is treated as a plain
+    text delta.
+    """
+    try:
+        frame = json_loads(data)
+    except ValueError:
+        return {"delta": data}
+    return frame if isinstance(frame, dict) else {"delta": str(frame)}
+
 
 class Answer(BaseResource):
+    __slots__ = ()
+
     @required_args(["query"], types={"query": str})
     def generate(
         self,
         query: str,
         namespace: str | None = None,
         top_k: int | None = None,
-        ai_model: str = "anthropic.claude-sonnet-4-6",
+        ai_model: str = DEFAULT_AI_MODEL,
         chat_history: list[ChatHistoryItem] | None = None,
         temperature: float = 0.7,
         header_prompt: str | None = None,
@@ -68,97 +239,213 @@ class Answer(BaseResource):
             APIError: For other API errors (e.g., 500).
             MoorchehError: For network or connection issues.
         """
-        if namespace is None or not isinstance(namespace, str):
-            raise InvalidInputError("Argument 'namespace' must be a string.")
-        if namespace:
-            if top_k is not None:
-                if not isinstance(top_k, int) or top_k <= 0:
-                    raise InvalidInputError("'top_k' must be a positive integer.")
-            if threshold is not None:
-                if not isinstance(threshold, (int, float)) or not (0 <= threshold <= 1):
-                    raise InvalidInputError(
-                        "'threshold' must be a number between 0 and 1, or None."
-                    )
-                if not kiosk_mode:
-                    logger.warning(
-                        "'threshold' is set but 'kiosk_mode' is disabled. 'threshold' will be ignored."
-                    )
-            logger.info(
-                "Attempting to get generative answer for query in namespace"
-                f" '{namespace}'..."
-            )
-        else:
-            if top_k is not None:
-                logger.warning(
-                    "'top_k' was provided with an empty 'namespace' and will be ignored."
-                )
-            if kiosk_mode:
-                logger.warning(
-                    "'kiosk_mode' was enabled with an empty 'namespace' and will be ignored."
-                )
-            if threshold is not None:
-                logger.warning(
-                    "'threshold' was provided with an empty 'namespace' and will be ignored."
-                )
-            logger.info(
-                "Attempting to get generative answer for query without namespace..."
-            )
-        if not ai_model:
-            raise InvalidInputError("Argument 'ai_model' cannot be empty.")
+        payload = _build_answer_payload(
+            query=query,
+            namespace=namespace,
+            top_k=top_k,
+            ai_model=ai_model,
+            chat_history=chat_history,
+            temperature=temperature,
+            header_prompt=header_prompt,
+            footer_prompt=footer_prompt,
+            threshold=threshold,
+            kiosk_mode=kiosk_mode,
+            structured_response=structured_response,
+        )
+        return self._post_answer(payload)
 
-        if not isinstance(temperature, (int, float)) or not (0 <= temperature <= 2):
-            raise InvalidInputError(
-                "'temperature' must be a number between 0.0 and 2.0."
-            )
+    @required_args(["queries"], types={"queries": list})
+    def generate_many(
+        self,
+        queries: list[dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[AnswerResponse]:
+        """
+        Generates answers for several independent queries concurrently.
 
-        if structured_response is not None and not isinstance(
-            structured_response, dict
-        ):
-            raise InvalidInputError("'structured_response' must be a dict or None.")
-
-        payload: dict[str, Any] = {
-            "namespace": namespace,
-            "query": query,
-            "aiModel": ai_model,
-            "chatHistory": chat_history if chat_history is not None else [],
-            "temperature": temperature,
-            "headerPrompt": header_prompt if header_prompt is not None else "",
-            "footerPrompt": footer_prompt if footer_prompt is not None else "",
-        }
-        if structured_response is not None:
-            payload["structuredResponse"] = structured_response
-        if namespace:
-            payload["type"] = "text"  # Hardcoded as per API design
-            payload["top_k"] = top_k if top_k is not None else 5
-            payload["kiosk_mode"] = kiosk_mode
-            if kiosk_mode:
-                payload["threshold"] = threshold if threshold is not None else 0.25
-        logger.debug(f"Generative answer payload: {payload}")
-
-        response_data = self._client._request(
-            method="POST", endpoint="/answer", json_data=payload, expected_status=200
+        Every request is validated before any of them is sent. The requests are
+        then issued from a thread pool so that their network round trips overlap.
+
+        Args:
+            queries: A list of dictionaries, each holding the keyword arguments
+                of a single `generate` call (e.g. `{"query": ..., "namespace": ...}`).
+            max_concurrency: The maximum number of requests in flight at once.
+                Defaults to 8.
+
+        Returns:
+            A list of answer dictionaries, in the same order as `queries`.
+
+        Raises:
+            InvalidInputError: If any request is invalid or if the API returns
+                a 400 Bad Request.
+            NamespaceNotFound: If a namespace does not exist (404).
+            AuthenticationError: If authentication fails (401/403).
+            APIError: For other API errors (e.g., 500).
+            MoorchehError: For network or connection issues.
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise InvalidInputError("'max_concurrency' must be a positive integer.")
+        payloads = _build_answer_payloads(queries)
+
+        logger.info("Generating %d answers concurrently...", len(payloads))
+        return map_concurrently(self._post_answer, payloads, max_concurrency)
+
+    @required_args(["queries"], types={"queries": list})
+    def generate_batch(
+        self,
+        queries: list[str],
+        namespace: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **options: Any,
+    ) -> list[AnswerResponse]:
+        """
+        Generates answers for several questions that share the same settings.
+
+        A convenience wrapper around `generate_many` for fan-out workloads such as
+        sub-questions of a single RAG request. The queries are sent as concurrent
+        `/answer` requests.
+
+        Args:
+            queries: The questions to answer.
+            namespace: The name of the text-based namespace to search within.
+            max_concurrency: The maximum number of requests in flight at once.
+                Defaults to 8.
+            **options: Any other keyword argument accepted by `generate`
+                (e.g. `top_k`, `ai_model`, `temperature`), applied to every query.
+
+        Returns:
+            A list of answer dictionaries, in the same order as `queries`.
+
+        Raises:
+            InvalidInputError: If any request is invalid.
+            NamespaceNotFound: If the namespace does not exist (404).
+            AuthenticationError: If authentication fails (401/403).
+            APIError: For other API errors.
+            MoorchehError: For network issues.
+        """
+        return self.generate_many(
+            [{**options, "query": q, "namespace": namespace} for q in queries],
+            max_concurrency=max_concurrency,
+        )
+
+    @required_args(["query"], types={"query": str})
+    def stream(
+        self,
+        query: str,
+        namespace: str | None = None,
+        top_k: int | None = None,
+        ai_model: str = DEFAULT_AI_MODEL,
+        chat_history: list[ChatHistoryItem] | None = None,
+        temperature: float = 0.7,
+        header_prompt: str | None = None,
+        footer_prompt: str | None = None,
+        threshold: float | None = None,
+        kiosk_mode: bool = False,
+        structured_response: dict | None = None,
+    ) -> Iterator[AnswerStreamChunk]:
+        """
+        Generates an AI answer, streaming it as it is produced.
+
+        Accepts the same arguments as `generate`. The answer is requested as a
+        Server-Sent Events stream so the first tokens arrive before generation
+        completes. A cached deterministic answer is yielded as a single final
+        chunk.
+
+        Yields:
+            Incremental chunks `{"delta": str, "done": False}`, followed by a final
+            chunk holding the complete answer and its metadata with `"done": True`.
+
+        Raises:
+            InvalidInputError: If parameters are invalid or the API returns a
+                400 Bad Request.
+            NamespaceNotFound: If the namespace does not exist (404).
+            AuthenticationError: If authentication fails (401/403).
+            APIError: For other API errors.
+            MoorchehError: For network issues.
+        """
+        payload = _build_answer_payload(
+            query=query,
+            namespace=namespace,
+            top_k=top_k,
+            ai_model=ai_model,
+            chat_history=chat_history,
+            temperature=temperature,
+            header_prompt=header_prompt,
+            footer_prompt=footer_prompt,
+            threshold=threshold,
+            kiosk_mode=kiosk_mode,
+            structured_response=structured_response,
         )
 
-        if not isinstance(response_data, dict):
-            logger.error("Generative answer response was not a dictionary.")
-            raise APIError(
-                message="Unexpected response format from generative answer endpoint."
+        cache_key = _answer_cache_key(payload)
+        if cache_key is not None:
+            cached = self._client._answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached answer for identical request.")
+                yield cast(AnswerStreamChunk, {**copy.deepcopy(cached), "done": True})
+                return
+
+        payload["stream"] = True
+        parts: list[str] = []
+        final: dict[str, Any] | None = None
+        for data in self._client._request_stream("POST", "/answer", json_data=payload):
+            if not isinstance(data, str):
+                # The server sent the whole answer as a plain JSON response.
+                final = _check_answer_response(data)
+                continue
+            frame = _parse_stream_frame(data)
+            if "answer" in frame:  # The final event carries the full answer
+                final = frame
+                continue
+            delta = str(frame.get("delta", ""))
+            if delta:
+                parts.append(delta)
+                yield {"delta": delta, "done": False}
+
+        if final is None:
+            final = {"answer": "".join(parts)}
+        final.pop("done", None)
+        if cache_key is not None:
+            self._client._answer_cache.set(cache_key, copy.deepcopy(final))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Answer streaming completed successfully. Answer length: %d",
+                len(final.get("answer", "")),
             )
+        yield cast(AnswerStreamChunk, {**final, "done": True})
 
-        logger.info(
-            f"Answer generation completed successfully. Answer length: {len(response_data.get('answer', ''))}"
+    def _post_answer(self, payload: dict[str, Any]) -> AnswerResponse:
+        cache_key = _answer_cache_key(payload)
+        if cache_key is not None:
+            cached = self._client._answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached answer for identical request.")
+                return cast(AnswerResponse, copy.deepcopy(cached))
+
+        response_data = _check_answer_response(
+            self._request(
+                method="POST",
+                endpoint="/answer",
+                json_data=payload,
+                expected_status=200,
+            )
         )
+
+        if cache_key is not None:
+            self._client._answer_cache.set(cache_key, copy.deepcopy(response_data))
         return cast(AnswerResponse, response_data)
 
 
 class AsyncAnswer(AsyncBaseResource):
+    __slots__ = ()
+
     @required_args(["query"], types={"query": str})
     async def generate(
         self,
         query: str,
         namespace: str | None = None,
         top_k: int | None = None,
-        ai_model: str = "anthropic.claude-sonnet-4-6",
+        ai_model: str = DEFAULT_AI_MODEL,
         chat_history: list[ChatHistoryItem] | None = None,
         temperature: float = 0.7,
         header_prompt: str | None = None,
@@ -215,87 +502,232 @@ class AsyncAnswer(AsyncBaseResource):
             APIError: For other API errors.
             MoorchehError: For network issues.
         """
+        payload = _build_answer_payload(
+            query=query,
+            namespace=namespace,
+            top_k=top_k,
+            ai_model=ai_model,
+            chat_history=chat_history,
+            temperature=temperature,
+            header_prompt=header_prompt,
+            footer_prompt=footer_prompt,
+            threshold=threshold,
+            kiosk_mode=kiosk_mode,
+            structured_response=structured_response,
+        )
+        return await self._post_answer(payload)
 
-        if namespace is None or not isinstance(namespace, str):
-            raise InvalidInputError("Argument 'namespace' must be a string.")
-        if namespace:
-            if top_k is not None:
-                if not isinstance(top_k, int) or top_k <= 0:
-                    raise InvalidInputError("'top_k' must be a positive integer.")
-            if threshold is not None:
-                if not isinstance(threshold, (int, float)) or not (0 <= threshold <= 1):
-                    raise InvalidInputError(
-                        "'threshold' must be a number between 0 and 1, or None."
-                    )
-                if not kiosk_mode:
-                    logger.warning(
-                        "'threshold' is set but 'kiosk_mode' is disabled. 'threshold' will be ignored."
-                    )
-            logger.info(
-                f"Attempting to generate answer for query '{query}' in namespace"
-                f" '{namespace}' (model={ai_model})..."
-            )
-        else:
-            if top_k is not None:
-                logger.warning(
-                    "'top_k' was provided with an empty 'namespace' and will be ignored."
-                )
-            if kiosk_mode:
-                logger.warning(
-                    "'kiosk_mode' was enabled with an empty 'namespace' and will be ignored."
-                )
-            if threshold is not None:
-                logger.warning(
-                    "'threshold' was provided with an empty 'namespace' and will be ignored."
-                )
-            logger.info(
-                f"Attempting to generate answer for query '{query}' without namespace"
-                f" (model={ai_model})..."
-            )
+    @required_args(["queries"], types={"queries": list})
+    async def generate_many(
+        self,
+        queries: list[dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[AnswerResponse]:
+        """
+        Generates answers for several independent queries concurrently.
 
-        if not ai_model:
-            raise InvalidInputError("Argument 'ai_model' cannot be empty.")
-        if not isinstance(temperature, (int, float)) or not (0 <= temperature <= 2):
-            raise InvalidInputError("'temperature' must be between 0.0 and 2.0.")
+        Every request is validated before any of them is sent. The requests are
+        then awaited together so that their network round trips overlap.
 
-        if structured_response is not None and not isinstance(
-            structured_response, dict
-        ):
-            raise InvalidInputError("'structured_response' must be a dict or None.")
-
-        payload: dict[str, Any] = {
-            "namespace": namespace,
-            "query": query,
-            "aiModel": ai_model,
-            "chatHistory": chat_history if chat_history is not None else [],
-            "temperature": temperature,
-            "headerPrompt": header_prompt if header_prompt is not None else "",
-            "footerPrompt": footer_prompt if footer_prompt is not None else "",
-        }
-        if structured_response is not None:
-            payload["structuredResponse"] = structured_response
-        if namespace:
-            payload["type"] = "text"  # Hardcoded as per API design
-            payload["top_k"] = top_k if top_k is not None else 5
-            payload["kiosk_mode"] = kiosk_mode
-            if kiosk_mode:
-                payload["threshold"] = threshold if threshold is not None else 0.25
-        logger.debug(f"Generative answer payload: {payload}")
-
-        response_data = await self._client._request(
-            method="POST",
-            endpoint="/answer",
-            json_data=payload,
-            expected_status=200,
+        Args:
+            queries: A list of dictionaries, each holding the keyword arguments
+                of a single `generate` call (e.g. `{"query": ..., "namespace": ...}`).
+            max_concurrency: The maximum number of requests in flight at once.
+                Defaults to 8.
+
+        Returns:
+            A list of answer dictionaries, in the same order as `queries`.
+
+        Raises:
+            InvalidInputError: If any request is invalid.
+            NamespaceNotFound: If a namespace does not exist (404).
+            AuthenticationError: If authentication fails (401/403).
+            APIError: For other API errors.
+            MoorchehError: For network issues.
+        """
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise InvalidInputError("'max_concurrency' must be a positive integer.")
+        payloads = _build_answer_payloads(queries)
+
+        logger.info("Generating %d answers concurrently...", len(payloads))
+        return await gather_bounded(self._post_answer, payloads, max_concurrency)
+
+    @required_args(["queries"], types={"queries": list})
+    async def generate_batch(
+        self,
+        queries: list[str],
+        namespace: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **options: Any,
+    ) -> list[AnswerResponse]:
+        """
+        Generates answers for several questions that share the same settings.
+
+        A convenience wrapper around `generate_many` for fan-out workloads such as
+        sub-questions of a single RAG request. The queries are sent as concurrent
+        `/answer` requests.
+
+        Args:
+            queries: The questions to answer.
+            namespace: The name of the text-based namespace to search within.
+            max_concurrency: The maximum number of requests in flight at once.
+                Defaults to 8.
+            **options: Any other keyword argument accepted by `generate`
+                (e.g. `top_k`, `ai_model`, `temperature`), applied to every query.
+
+        Returns:
+            A list of answer dictionaries, in the same order as `queries`.
+
+        Raises:
+            InvalidInputError: If any request is invalid.
+            NamespaceNotFound: If the namespace does not exist (404).
+            AuthenticationError: If authentication fails (401/403).
+            APIError: For other API errors.
+            MoorchehError: For network issues.
+        """
+        return await self.generate_many(
+            [{**options, "query": q, "namespace": namespace} for q in queries],
+            max_concurrency=max_concurrency,
         )
 
-        if not isinstance(response_data, dict):
-            logger.error("Generative answer response was not a dictionary.")
-            raise APIError(
-                message="Unexpected response format from generative answer endpoint."
+    @required_args(["query"], types={"query": str})
+    async def stream(
+        self,
+        query: str,
+        namespace: str | None = None,
+        top_k: int | None = None,
+        ai_model: str = DEFAULT_AI_MODEL,
+        chat_history: list[ChatHistoryItem] | None = None,
+        temperature: float = 0.7,
+        header_prompt: str | None = None,
+        footer_prompt: str | None = None,
+        threshold: float | None = None,
+        kiosk_mode: bool = False,
+        structured_response: dict | None = None,
+    ) -> AsyncIterator[AnswerStreamChunk]:
+        """
+        Generates an AI answer asynchronously, streaming it as it is produced.
+
+        Accepts the same arguments as `generate`. The answer is requested as a
+        Server-Sent Events stream so the first tokens arrive before generation
+        completes. A cached deterministic answer is yielded as a single final
+        chunk.
+
+        Yields:
+            Incremental chunks `{"delta": str, "done": False}`, followed by a final
+            chunk holding the complete answer and its metadata with `"done": True`.
+
+        Raises:
+            InvalidInputError: If parameters are invalid or the API returns a
+                400 Bad Request.
+            NamespaceNotFound: If the namespace does not exist (404).
+            AuthenticationError: If authentication fails (401/403).
+            APIError: For other API errors.
+            MoorchehError: For network issues.
+        """
+        payload = _build_answer_payload(
+            query=query,
+            namespace=namespace,
+            top_k=top_k,
+            ai_model=ai_model,
+            chat_history=chat_history,
+            temperature=temperature,
+            header_prompt=header_prompt,
+            footer_prompt=footer_prompt,
+            threshold=threshold,
+            kiosk_mode=kiosk_mode,
+            structured_response=structured_response,
+        )
+
+        cache_key = _answer_cache_key(payload)
+        if cache_key is not None:
+            cached = self._client._answer_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached answer for identical request.")
+                yield cast(AnswerStreamChunk, {**copy.deepcopy(cached), "done": True})
+                return
+
+        payload["stream"] = True
+        parts: list[str] = []
+        final: dict[str, Any] | None = None
+        async for data in self._client._request_stream(
+            "POST", "/answer", json_data=payload
+        ):
+            if not isinstance(data, str):
+                # The server sent the whole answer as a plain JSON response.
+                final = _check_answer_response(data)
+                continue
+            frame = _parse_stream_frame(data)
+            if "answer" in frame:  # The final event carries the full answer
+                final = frame
+                continue
+            delta = str(frame.get("delta", ""))
+            if delta:
+                parts.append(delta)
+                yield {"delta": delta, "done": False}
+
+        if final is None:
+            final = {"answer": "".join(parts)}
+        final.pop("done", None)
+        if cache_key is not None:
+            self._client._answer_cache.set(cache_key, copy.deepcopy(final))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Answer streaming completed successfully. Answer length: %d",
+                len(final.get("answer", "")),
             )
+        yield cast(AnswerStreamChunk, {**final, "done": True})
 
-        logger.info(
-            f"Answer generation completed successfully. Answer length: {len(response_data.get('answer', ''))}"
+    async def _post_answer(self, payload: dict[str, Any]) -> AnswerResponse:
+        cache_key = _answer_cache_key(payload)
+        if cache_key is None:
+            return cast(AnswerResponse, await self._send_answer(payload))
+
+        cached = self._client._answer_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Returning cached answer for identical request.")
+            return cast(AnswerResponse, copy.deepcopy(cached))
+
+        # Identical deterministic requests issued concurrently share one round trip.
+        inflight = self._client._answer_inflight
+        while (pending := inflight.get(cache_key)) is not None:
+            logger.info("Awaiting identical in-flight answer request.")
+            try:
+                # shield() keeps a cancelled waiter from cancelling the shared request.
+                shared = await asyncio.shield(pending)
+            except _AbandonedRequest:
+                # The caller that sent the request was cancelled; take it over.
+                continue
+            return cast(AnswerResponse, copy.deepcopy(shared))
+
+        future: asyncio.Future[dict[str, Any]] = (
+            asyncio.get_running_loop().create_future()
         )
+        inflight[cache_key] = future
+        try:
+            response_data = await self._send_answer(payload)
+        except asyncio.CancelledError:
+            # The waiters were not cancelled themselves, so they retry instead.
+            future.set_exception(_AbandonedRequest())
+            future.exception()  # Mark as retrieved when there are no waiters
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark as retrieved when there are no waiters
+            raise
+        finally:
+            del inflight[cache_key]
+
+        self._client._answer_cache.set(cache_key, copy.deepcopy(response_data))
+        future.set_result(copy.deepcopy(response_data))
         return cast(AnswerResponse, response_data)
+
+    async def _send_answer(self, payload: dict[str, Any]) -> dict[str, Any]:
+        return _check_answer_response(
+            await self._request(
+                method="POST",
+                endpoint="/answer",
+                json_data=payload,
+                expected_status=200,
+            )
+        )
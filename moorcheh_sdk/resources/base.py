@@ -12,6 +12,8 @@ class BaseResource:
     ensuring they have access to the main client instance.
     """
 
+    __slots__ = ("_client", "_request")
+
     def __init__(self, client: "MoorchehClient") -> None:
         """
         Initialize the resource with a client instance.
@@ -20,9 +22,12 @@ class BaseResource:
             client: The MoorchehClient instance to use for requests.
         """
         self._client = client
+        # Bound once so the request hot path skips the client attribute lookup.
+        self._request = client._request
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(client={self._client})"
+        client = self._client
+        return f"{type(self).__name__}(client=<{type(client).__name__} at {id(client):#x}>)"
 
 
 class AsyncBaseResource:
@@ -30,6 +35,8 @@ class AsyncBaseResource:
     Base class for all Async Moorcheh SDK resources.
     """
 
+    __slots__ = ("_client", "_request")
+
     def __init__(self, client: "AsyncMoorchehClient") -> None:
         """
         Initialize the resource with a client instance.
@@ -38,6 +45,9 @@ class AsyncBaseResource:
             client: The AsyncMoorchehClient instance to use for requests.
         """
         self._client = client
+        # Bound once so the request hot path skips the client attribute lookup.
+        self._request = client._request
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(client={self._client})"
+        client = self._client
+        return f"{type(self).__name__}(client=<{type(client).__name__} at {id(client):#x}>)"
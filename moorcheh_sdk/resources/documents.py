@@ -1,5 +1,8 @@
 import asyncio
+import logging
 import os
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import BinaryIO, cast
 
@@ -20,27 +23,102 @@ from ..types import (
     FileUploadResponse,
 )
 from ..utils.batching import chunk_iterable
-from ..utils.constants import INVALID_ID_CHARS
+from ..utils.concurrency import gather_bounded, map_concurrently
+from ..utils.constants import DEFAULT_MAX_CONCURRENCY, INVALID_ID_CHARS
 from ..utils.decorators import required_args
 from ..utils.logging import setup_logging
+from ..utils.urls import namespace_path
 from .base import AsyncBaseResource, BaseResource
 
 logger = setup_logging(__name__)
 
+# frozenset.isdisjoint iterates the ID string in C and stops at the first hit.
+_INVALID_ID_CHARSET = frozenset(INVALID_ID_CHARS)
+
+UPLOAD_BATCH_SIZE = 100
+
+
+@lru_cache(maxsize=128)
+def _document_endpoints(namespace_name: str) -> tuple[str, str, str]:
+    """Returns the (upload, get, delete) document endpoints for a namespace."""
+    base = f"{namespace_path(namespace_name)}/documents"
+    return base, f"{base}/get", f"{base}/delete"
+
+
+def _validate_document(index: int, doc: object) -> None:
+    if not isinstance(doc, dict):
+        raise InvalidInputError(
+            f"Item at index {index} in 'documents' is not a dictionary."
+        )
+    # Single lookups: a missing key and an empty value are rejected alike.
+    doc_id = doc.get("id")
+    if not doc_id:
+        raise InvalidInputError(
+            f"Item at index {index} in 'documents' is missing required key 'id' or it is empty."
+        )
+    if isinstance(doc_id, str) and not _INVALID_ID_CHARSET.isdisjoint(doc_id):
+        raise InvalidInputError(
+            f"Item at index {index} in 'documents' has an invalid ID. Invalid characters: {INVALID_ID_CHARS!r}"
+        )
+    text = doc.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise InvalidInputError(
+            f"Item at index {index} in 'documents' is missing required key 'text' or it is not a non-empty string."
+        )
+
+
+def _check_id_chars(ids: list[str | int]) -> None:
+    # Screen all string IDs in a single C-level pass; only walk the IDs one by
+    # one to name the offender when the screen fails.
+    joined = "".join([doc_id for doc_id in ids if isinstance(doc_id, str)])
+    if _INVALID_ID_CHARSET.isdisjoint(joined):
+        return
+    for doc_id in ids:
+        if isinstance(doc_id, str) and not _INVALID_ID_CHARSET.isdisjoint(doc_id):
+            raise InvalidInputError(
+                f"Invalid characters in document ID: '{doc_id}'."
+                f" Invalid characters: {INVALID_ID_CHARS!r}"
+            )
+
+
+def _validated_batches(
+    documents: list[Document], size: int = UPLOAD_BATCH_SIZE
+) -> list[list[Document]]:
+    """
+    Validates documents, then slices them into upload batches.
+
+    This takes two passes. Every document is checked before any batch is built,
+    so an invalid document aborts the upload before the concurrently sent
+    batches start. The batches are list slices, so they hold references to the
+    documents rather than copies.
+    """
+    for i, doc in enumerate(documents):
+        _validate_document(i, doc)
+    return list(chunk_iterable(documents, size))
+
 
 class Documents(BaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespace_name", "documents"],
         types={"namespace_name": str, "documents": list},
     )
     def upload(
-        self, namespace_name: str, documents: list[Document]
+        self,
+        namespace_name: str,
+        documents: list[Document],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> DocumentUploadResponse:
         """
         Uploads text documents to a text-based namespace.
 
         This process is asynchronous. Documents are queued for embedding and indexing.
 
+        Documents are sent in batches of 100. If a batch fails, batches that
+        have not been sent yet are cancelled and the error is raised. Batches
+        sent before the failure may already have been accepted by the server.
+
         Args:
             namespace_name: The name of the target text-based namespace.
             documents: A list of dictionaries representing the documents.
@@ -48,6 +126,10 @@ class Documents(BaseResource):
                 - "id" (str | int): Unique identifier for the document.
                 - "text" (str): The text content to embed.
                 - "metadata" (dict, optional): Additional metadata.
+            max_concurrency: The maximum number of 100-document batches sent
+                at once. Defaults to 8. Batches reuse the client's keep-alive
+                connections; values above the pool's keep-alive limit (32 by
+                default) open extra connections for each call.
 
         Returns:
             A dictionary confirming the documents were queued.
@@ -67,45 +149,25 @@ class Documents(BaseResource):
         """
 
         logger.info(
-            f"Attempting to upload {len(documents)} documents to namespace"
-            f" '{namespace_name}'..."
+            "Attempting to upload %d documents to namespace '%s'...",
+            len(documents),
+            namespace_name,
         )
 
-        for i, doc in enumerate(documents):
-            if not isinstance(doc, dict):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' is not a dictionary."
-                )
-            if "id" not in doc or not doc["id"]:
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' is missing required key 'id' or it is empty."
-                )
-            if isinstance(doc["id"], str) and any(
-                char in doc["id"] for char in INVALID_ID_CHARS
-            ):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' has an invalid ID. Invalid characters: {INVALID_ID_CHARS!r}"
-                )
-            if (
-                "text" not in doc
-                or not isinstance(doc["text"], str)
-                or not doc["text"].strip()
-            ):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' is missing required key 'text' or it is not a non-empty string."
-                )
+        batches = _validated_batches(documents)
 
-        endpoint = f"/namespaces/{namespace_name}/documents"
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise InvalidInputError("'max_concurrency' must be a positive integer.")
 
-        all_submitted_ids = []
+        endpoint = _document_endpoints(namespace_name)[0]
+        request = self._request
 
-        for batch in chunk_iterable(documents, 100):
-            payload = {"documents": batch}
-            logger.debug(f"Uploading batch of {len(batch)} documents...")
+        def upload_batch(batch: list[Document]) -> list[str | int]:
+            logger.debug("Uploading batch of %d documents...", len(batch))
 
             # Expecting 202 Accepted
-            response_data = self._client._request(
-                "POST", endpoint, json_data=payload, expected_status=202
+            response_data = request(
+                "POST", endpoint, json_data={"documents": batch}, expected_status=202
             )
 
             if not isinstance(response_data, dict):
@@ -113,12 +175,20 @@ class Documents(BaseResource):
                 raise APIError(
                     message="Unexpected response format after uploading documents."
                 )
+            return cast(list[str | int], response_data.get("submitted_ids", []))
 
-            all_submitted_ids.extend(response_data.get("submitted_ids", []))
+        # Batches are independent, so they are sent concurrently; results keep
+        # batch order.
+        all_submitted_ids = list(
+            chain.from_iterable(
+                map_concurrently(upload_batch, batches, max_concurrency)
+            )
+        )
 
         logger.info(
-            f"Successfully queued {len(all_submitted_ids)} documents for upload to"
-            f" '{namespace_name}'."
+            "Successfully queued %d documents for upload to '%s'.",
+            len(all_submitted_ids),
+            namespace_name,
         )
 
         return {"status": "queued", "submitted_ids": all_submitted_ids}
@@ -163,24 +233,18 @@ class Documents(BaseResource):
             raise InvalidInputError(
                 "All items in 'ids' list must be non-empty strings or integers."
             )
-        for doc_id in ids:
-            if isinstance(doc_id, str) and any(
-                char in doc_id for char in INVALID_ID_CHARS
-            ):
-                raise InvalidInputError(
-                    f"Invalid characters in document ID: '{doc_id}'."
-                    f" Invalid characters: {INVALID_ID_CHARS!r}"
-                )
+        _check_id_chars(ids)
 
         logger.info(
-            f"Attempting to get {len(ids)} document(s) from namespace"
-            f" '{namespace_name}'..."
+            "Attempting to get %d document(s) from namespace '%s'...",
+            len(ids),
+            namespace_name,
         )
 
-        endpoint = f"/namespaces/{namespace_name}/documents/get"
+        endpoint = _document_endpoints(namespace_name)[1]
         payload = {"ids": ids}
 
-        response_data = self._client._request(
+        response_data = self._request(
             "POST", endpoint, json_data=payload, expected_status=200
         )
 
@@ -192,8 +256,9 @@ class Documents(BaseResource):
 
         doc_count = len(response_data.get("documents", []))
         logger.info(
-            f"Successfully retrieved {doc_count} document(s) from namespace"
-            f" '{namespace_name}'."
+            "Successfully retrieved %d document(s) from namespace '%s'.",
+            doc_count,
+            namespace_name,
         )
         return cast(DocumentGetResponse, response_data)
 
@@ -228,17 +293,21 @@ class Documents(BaseResource):
             MoorchehError: For network issues.
         """
         logger.info(
-            f"Attempting to delete {len(ids)} document(s) from namespace"
-            f" '{namespace_name}' with IDs: {ids}"
+            "Attempting to delete %d document(s) from namespace '%s'.",
+            len(ids),
+            namespace_name,
         )
+        # The ID list can be large, so it is only rendered at DEBUG level.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("IDs: %r", ids)
         if not all(isinstance(item_id, (str, int)) and item_id for item_id in ids):
             raise InvalidInputError(
                 "All items in 'ids' list must be non-empty strings or integers."
             )
 
-        response_data = self._client._request(
+        response_data = self._request(
             method="POST",
-            endpoint=f"/namespaces/{namespace_name}/documents/delete",
+            endpoint=_document_endpoints(namespace_name)[2],
             json_data={"ids": ids},
             expected_status=200,
             alt_success_status=207,
@@ -253,13 +322,15 @@ class Documents(BaseResource):
         deleted_count = len(response_data.get("deleted_ids", []))
         error_count = len(response_data.get("errors", []))
         logger.info(
-            f"Delete documents from '{namespace_name}' completed. Status:"
-            f" {response_data.get('status')}, Deleted: {deleted_count}, Errors:"
-            f" {error_count}"
+            "Delete documents from '%s' completed. Status: %s, Deleted: %d, Errors: %d",
+            namespace_name,
+            response_data.get("status"),
+            deleted_count,
+            error_count,
         )
         if error_count > 0:
             logger.warning(
-                f"Delete documents encountered errors: {response_data.get('errors')}"
+                "Delete documents encountered errors: %s", response_data.get("errors")
             )
         return cast(DocumentDeleteResponse, response_data)
 
@@ -387,15 +458,17 @@ class Documents(BaseResource):
             should_close = False
 
         logger.info(
-            f"Attempting to upload file '{file_name}' ({file_size} bytes) to namespace"
-            f" '{namespace_name}'..."
+            "Attempting to upload file '%s' (%s bytes) to namespace '%s'...",
+            file_name,
+            file_size,
+            namespace_name,
         )
 
-        endpoint = f"/namespaces/{namespace_name}/upload-url"
+        endpoint = f"{namespace_path(namespace_name)}/upload-url"
 
         try:
             # Request a presigned URL for the upload.
-            response_data = self._client._request(
+            response_data = self._request(
                 method="POST",
                 endpoint=endpoint,
                 json_data={"fileName": file_name},
@@ -421,13 +494,14 @@ class Documents(BaseResource):
                 timeout=self._client.timeout,
             )
 
-            logger.debug(f"Received response with status code: {response.status_code}")
+            logger.debug("Received response with status code: %d", response.status_code)
 
             # Process response
             if response.status_code == 200:
                 logger.info(
-                    f"File '{file_name}' uploaded successfully to namespace"
-                    f" '{namespace_name}' via presigned URL"
+                    "File '%s' uploaded successfully to namespace '%s' via presigned URL",
+                    file_name,
+                    namespace_name,
                 )
                 return cast(
                     FileUploadResponse,
@@ -442,8 +516,10 @@ class Documents(BaseResource):
             else:
                 # Handle error responses
                 logger.warning(
-                    f"Request to {endpoint} failed with status {response.status_code}."
-                    f" Response text: {response.text}"
+                    "Request to %s failed with status %d. Response text: %s",
+                    endpoint,
+                    response.status_code,
+                    response.text,
                 )
 
                 if response.status_code == 400:
@@ -546,13 +622,14 @@ class Documents(BaseResource):
             raise InvalidInputError("file_names must be a list of non-empty strings.")
 
         logger.info(
-            f"Attempting to delete {len(file_names)} file(s) from namespace"
-            f" '{namespace_name}'..."
+            "Attempting to delete %d file(s) from namespace '%s'...",
+            len(file_names),
+            namespace_name,
         )
 
-        endpoint = f"/namespaces/{namespace_name}/delete-file"
+        endpoint = f"{namespace_path(namespace_name)}/delete-file"
 
-        response_data = self._client._request(
+        response_data = self._request(
             method="DELETE",
             endpoint=endpoint,
             json_data={"fileNames": file_names},
@@ -566,17 +643,22 @@ class Documents(BaseResource):
                 message="Unexpected response format from delete file endpoint."
             )
 
-        logger.info(f"File deletion completed for namespace '{namespace_name}'.")
+        logger.info("File deletion completed for namespace '%s'.", namespace_name)
         return cast(FileDeleteResponse, response_data)
 
 
 class AsyncDocuments(AsyncBaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespace_name", "documents"],
         types={"namespace_name": str, "documents": list},
     )
     async def upload(
-        self, namespace_name: str, documents: list[Document]
+        self,
+        namespace_name: str,
+        documents: list[Document],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> DocumentUploadResponse:
         """
         Uploads text documents to a text-based namespace asynchronously.
@@ -584,6 +666,10 @@ class AsyncDocuments(AsyncBaseResource):
         This process is asynchronous (fire-and-forget style on the server),
         so the response confirms queuing, not completion.
 
+        Documents are sent in batches of 100. If a batch fails, batches that
+        have not been sent yet are cancelled and the error is raised. Batches
+        sent before the failure may already have been accepted by the server.
+
         Args:
             namespace_name: The name of the target text-based namespace.
             documents: A list of dictionaries representing the documents.
@@ -591,6 +677,10 @@ class AsyncDocuments(AsyncBaseResource):
                 - "id" (str | int): Unique identifier for the document.
                 - "text" (str): The text content to embed.
                 - "metadata" (dict, optional): Additional metadata.
+            max_concurrency: The maximum number of 100-document batches sent
+                at once. Defaults to 8. Batches reuse the client's keep-alive
+                connections; values above the pool's keep-alive limit (32 by
+                default) open extra connections for each call.
 
         Returns:
             A dictionary confirming the documents were queued.
@@ -609,46 +699,26 @@ class AsyncDocuments(AsyncBaseResource):
             MoorchehError: For network issues.
         """
         logger.info(
-            f"Attempting to upload {len(documents)} documents to namespace"
-            f" '{namespace_name}'..."
+            "Attempting to upload %d documents to namespace '%s'...",
+            len(documents),
+            namespace_name,
         )
 
-        for i, doc in enumerate(documents):
-            if not isinstance(doc, dict):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' is not a dictionary."
-                )
-            if "id" not in doc or not doc["id"]:
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' is missing required key 'id' or it is empty."
-                )
-            if isinstance(doc["id"], str) and any(
-                char in doc["id"] for char in INVALID_ID_CHARS
-            ):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' has an invalid ID. Invalid characters: {INVALID_ID_CHARS!r}"
-                )
-            if (
-                "text" not in doc
-                or not isinstance(doc["text"], str)
-                or not doc["text"].strip()
-            ):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'documents' is missing required key 'text' or it is not a non-empty string."
-                )
+        batches = _validated_batches(documents)
 
-        endpoint = f"/namespaces/{namespace_name}/documents"
+        if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+            raise InvalidInputError("'max_concurrency' must be a positive integer.")
 
-        all_submitted_ids = []
+        endpoint = _document_endpoints(namespace_name)[0]
+        request = self._request
 
-        for batch in chunk_iterable(documents, 100):
-            payload = {"documents": batch}
-            logger.debug(f"Uploading batch of {len(batch)} documents...")
+        async def upload_batch(batch: list[Document]) -> list[str | int]:
+            logger.debug("Uploading batch of %d documents...", len(batch))
 
-            response_data = await self._client._request(
+            response_data = await request(
                 method="POST",
                 endpoint=endpoint,
-                json_data=payload,
+                json_data={"documents": batch},
                 expected_status=202,
             )
 
@@ -657,12 +727,20 @@ class AsyncDocuments(AsyncBaseResource):
                 raise APIError(
                     message="Unexpected response format after uploading documents."
                 )
+            return cast(list[str | int], response_data.get("submitted_ids", []))
 
-            all_submitted_ids.extend(response_data.get("submitted_ids", []))
+        # Batches are independent, so they are sent concurrently; results keep
+        # batch order.
+        all_submitted_ids = list(
+            chain.from_iterable(
+                await gather_bounded(upload_batch, batches, max_concurrency)
+            )
+        )
 
         logger.info(
-            f"Successfully queued {len(all_submitted_ids)} documents for upload to"
-            f" '{namespace_name}'."
+            "Successfully queued %d documents for upload to '%s'.",
+            len(all_submitted_ids),
+            namespace_name,
         )
         return {"status": "queued", "submitted_ids": all_submitted_ids}
 
@@ -712,23 +790,17 @@ class AsyncDocuments(AsyncBaseResource):
         # Check for invalid characters in IDs (client-side validation)
         # Uses shared INVALID_ID_CHARS constant for consistency with sync client.
         # Adjust INVALID_ID_CHARS in utils/constants.py as per API requirements.
-        for doc_id in ids:
-            if isinstance(doc_id, str) and any(
-                char in doc_id for char in INVALID_ID_CHARS
-            ):
-                raise InvalidInputError(
-                    f"Invalid characters in document ID: '{doc_id}'."
-                    f" Invalid characters: {INVALID_ID_CHARS!r}"
-                )
+        _check_id_chars(ids)
 
         logger.info(
-            f"Attempting to retrieve {len(ids)} document(s) from namespace"
-            f" '{namespace_name}'..."
+            "Attempting to retrieve %d document(s) from namespace '%s'...",
+            len(ids),
+            namespace_name,
         )
 
-        response_data = await self._client._request(
+        response_data = await self._request(
             method="POST",
-            endpoint=f"/namespaces/{namespace_name}/documents/get",
+            endpoint=_document_endpoints(namespace_name)[1],
             json_data={"ids": ids},
             expected_status=200,
         )
@@ -740,7 +812,7 @@ class AsyncDocuments(AsyncBaseResource):
             )
 
         retrieved_count = len(response_data.get("documents", []))
-        logger.info(f"Successfully retrieved {retrieved_count} document(s).")
+        logger.info("Successfully retrieved %d document(s).", retrieved_count)
         return cast(DocumentGetResponse, response_data)
 
     @required_args(
@@ -774,17 +846,21 @@ class AsyncDocuments(AsyncBaseResource):
             MoorchehError: For network issues.
         """
         logger.info(
-            f"Attempting to delete {len(ids)} document(s) from namespace"
-            f" '{namespace_name}' with IDs: {ids}"
+            "Attempting to delete %d document(s) from namespace '%s'.",
+            len(ids),
+            namespace_name,
         )
+        # The ID list can be large, so it is only rendered at DEBUG level.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("IDs: %r", ids)
         if not all(isinstance(item_id, (str, int)) and item_id for item_id in ids):
             raise InvalidInputError(
                 "All items in 'ids' list must be non-empty strings or integers."
             )
 
-        response_data = await self._client._request(
+        response_data = await self._request(
             method="POST",
-            endpoint=f"/namespaces/{namespace_name}/documents/delete",
+            endpoint=_document_endpoints(namespace_name)[2],
             json_data={"ids": ids},
             expected_status=200,
             alt_success_status=207,
@@ -797,7 +873,7 @@ class AsyncDocuments(AsyncBaseResource):
             )
 
         logger.info(
-            f"Delete operation completed with status: {response_data.get('status')}"
+            "Delete operation completed with status: %s", response_data.get("status")
         )
         return cast(DocumentDeleteResponse, response_data)
 
@@ -925,15 +1001,17 @@ class AsyncDocuments(AsyncBaseResource):
             should_close = False
 
         logger.info(
-            f"Attempting to upload file '{file_name}' ({file_size} bytes) to namespace"
-            f" '{namespace_name}'..."
+            "Attempting to upload file '%s' (%d bytes) to namespace '%s'...",
+            file_name,
+            file_size,
+            namespace_name,
         )
 
-        endpoint = f"/namespaces/{namespace_name}/upload-url"
+        endpoint = f"{namespace_path(namespace_name)}/upload-url"
 
         try:
             # Request a presigned URL for the upload.
-            response_data = await self._client._request(
+            response_data = await self._request(
                 method="POST",
                 endpoint=endpoint,
                 json_data={"fileName": file_name},
@@ -961,13 +1039,14 @@ class AsyncDocuments(AsyncBaseResource):
                 timeout=self._client.timeout,
             )
 
-            logger.debug(f"Received response with status code: {response.status_code}")
+            logger.debug("Received response with status code: %d", response.status_code)
 
             # Process response
             if response.status_code == 200:
                 logger.info(
-                    f"File '{file_name}' uploaded successfully to namespace"
-                    f" '{namespace_name}' via presigned URL"
+                    "File '%s' uploaded successfully to namespace '%s' via presigned URL",
+                    file_name,
+                    namespace_name,
                 )
                 return cast(
                     FileUploadResponse,
@@ -982,8 +1061,10 @@ class AsyncDocuments(AsyncBaseResource):
             else:
                 # Handle error responses
                 logger.warning(
-                    f"Request to {endpoint} failed with status {response.status_code}."
-                    f" Response text: {response.text}"
+                    "Request to %s failed with status %d. Response text: %s",
+                    endpoint,
+                    response.status_code,
+                    response.text,
                 )
 
                 if response.status_code == 400:
@@ -1086,13 +1167,14 @@ class AsyncDocuments(AsyncBaseResource):
             raise InvalidInputError("file_names must be a list of non-empty strings.")
 
         logger.info(
-            f"Attempting to delete {len(file_names)} file(s) from namespace"
-            f" '{namespace_name}'..."
+            "Attempting to delete %d file(s) from namespace '%s'...",
+            len(file_names),
+            namespace_name,
         )
 
-        endpoint = f"/namespaces/{namespace_name}/delete-file"
+        endpoint = f"{namespace_path(namespace_name)}/delete-file"
 
-        response_data = await self._client._request(
+        response_data = await self._request(
             method="DELETE",
             endpoint=endpoint,
             json_data={"fileNames": file_names},
@@ -1106,5 +1188,5 @@ class AsyncDocuments(AsyncBaseResource):
                 message="Unexpected response format from delete file endpoint."
             )
 
-        logger.info(f"File deletion completed for namespace '{namespace_name}'.")
+        logger.info("File deletion completed for namespace '%s'.", namespace_name)
         return cast(FileDeleteResponse, response_data)
@@ -1,15 +1,21 @@
+import copy
 from typing import Any, cast
 
 from ..exceptions import APIError, InvalidInputError
 from ..types import NamespaceCreateResponse, NamespaceListResponse
 from ..utils.decorators import required_args
 from ..utils.logging import setup_logging
+from ..utils.urls import namespace_path
 from .base import AsyncBaseResource, BaseResource
 
 logger = setup_logging(__name__)
 
+_LIST_CACHE_KEY = "namespaces"
+
 
 class Namespaces(BaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespace_name", "type"], types={"namespace_name": str, "type": str}
     )
@@ -43,7 +49,7 @@ class Namespaces(BaseResource):
             MoorchehError: For network issues.
         """
         logger.info(
-            f"Attempting to create namespace '{namespace_name}' of type '{type}'..."
+            "Attempting to create namespace '%s' of type '%s'...", namespace_name, type
         )
         if type not in ["text", "vector"]:
             raise InvalidInputError("Namespace type must be 'text' or 'vector'.")
@@ -64,7 +70,7 @@ class Namespaces(BaseResource):
         else:
             payload["vector_dimension"] = None  # Explicitly send None if not vector
 
-        response_data = self._client._request(
+        response_data = self._request(
             "POST", "/namespaces", json_data=payload, expected_status=201
         )
 
@@ -74,9 +80,11 @@ class Namespaces(BaseResource):
                 message="Unexpected response format after creating namespace."
             )
 
+        self._client._namespace_list_cache.clear()
         logger.info(
-            f"Successfully created namespace '{namespace_name}'. Response:"
-            f" {response_data}"
+            "Successfully created namespace '%s'. Response: %s",
+            namespace_name,
+            response_data,
         )
         return cast(NamespaceCreateResponse, response_data)
 
@@ -95,13 +103,14 @@ class Namespaces(BaseResource):
             APIError: For other API errors.
             MoorchehError: For network issues.
         """
-        logger.info(f"Attempting to delete namespace '{namespace_name}'...")
+        logger.info("Attempting to delete namespace '%s'...", namespace_name)
 
-        endpoint = f"/namespaces/{namespace_name}"
+        endpoint = namespace_path(namespace_name)
         # API returns 200 with body now, not 204
-        self._client._request("DELETE", endpoint, expected_status=200)
+        self._request("DELETE", endpoint, expected_status=200)
+        self._client._namespace_list_cache.clear()
         # Log success after the request confirms it (no exception raised)
-        logger.info(f"Namespace '{namespace_name}' deleted successfully.")
+        logger.info("Namespace '%s' deleted successfully.", namespace_name)
 
     def list(self) -> NamespaceListResponse:
         """
@@ -129,7 +138,13 @@ class Namespaces(BaseResource):
             MoorchehError: For network issues.
         """
         logger.info("Attempting to list namespaces...")
-        response_data = self._client._request("GET", "/namespaces", expected_status=200)
+        list_cache = self._client._namespace_list_cache
+        cached = list_cache.get(_LIST_CACHE_KEY)
+        if cached is not None:
+            logger.info("Returning cached namespace list.")
+            return cast(NamespaceListResponse, copy.deepcopy(cached))
+
+        response_data = self._request("GET", "/namespaces", expected_status=200)
 
         if not isinstance(response_data, dict):
             logger.error("List namespaces response was not a dictionary.")
@@ -148,12 +163,15 @@ class Namespaces(BaseResource):
             )
 
         count = len(response_data.get("namespaces", []))
-        logger.info(f"Successfully listed {count} namespace(s).")
-        logger.debug(f"List namespaces response data: {response_data}")
+        logger.info("Successfully listed %d namespace(s).", count)
+        logger.debug("List namespaces response data: %s", response_data)
+        list_cache.set(_LIST_CACHE_KEY, copy.deepcopy(response_data))
         return cast(NamespaceListResponse, response_data)
 
 
 class AsyncNamespaces(AsyncBaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespace_name", "type"], types={"namespace_name": str, "type": str}
     )
@@ -182,7 +200,7 @@ class AsyncNamespaces(AsyncBaseResource):
             MoorchehError: For network issues.
         """
         logger.info(
-            f"Attempting to create namespace '{namespace_name}' (type={type})..."
+            "Attempting to create namespace '%s' (type=%s)...", namespace_name, type
         )
 
         if type not in ["text", "vector"]:
@@ -204,14 +222,15 @@ class AsyncNamespaces(AsyncBaseResource):
             "vector_dimension": vector_dimension,
         }
 
-        response_data = await self._client._request(
+        response_data = await self._request(
             method="POST",
             endpoint="/namespaces",
             json_data=payload,
             expected_status=201,
         )
 
-        logger.info(f"Namespace '{namespace_name}' created successfully.")
+        self._client._namespace_list_cache.clear()
+        logger.info("Namespace '%s' created successfully.", namespace_name)
         return cast(NamespaceCreateResponse, response_data)
 
     @required_args(["namespace_name"], types={"namespace_name": str})
@@ -229,15 +248,16 @@ class AsyncNamespaces(AsyncBaseResource):
             APIError: For other API errors.
             MoorchehError: For network issues.
         """
-        logger.info(f"Attempting to delete namespace '{namespace_name}'...")
+        logger.info("Attempting to delete namespace '%s'...", namespace_name)
 
-        await self._client._request(
+        await self._request(
             method="DELETE",
-            endpoint=f"/namespaces/{namespace_name}",
+            endpoint=namespace_path(namespace_name),
             expected_status=200,
         )
+        self._client._namespace_list_cache.clear()
 
-        logger.info(f"Namespace '{namespace_name}' deleted successfully.")
+        logger.info("Namespace '%s' deleted successfully.", namespace_name)
 
     async def list(self) -> NamespaceListResponse:
         """
@@ -252,7 +272,13 @@ class AsyncNamespaces(AsyncBaseResource):
             MoorchehError: For network issues.
         """
         logger.info("Attempting to list namespaces...")
-        response_data = await self._client._request(
+        list_cache = self._client._namespace_list_cache
+        cached = list_cache.get(_LIST_CACHE_KEY)
+        if cached is not None:
+            logger.info("Returning cached namespace list.")
+            return cast(NamespaceListResponse, copy.deepcopy(cached))
+
+        response_data = await self._request(
             method="GET", endpoint="/namespaces", expected_status=200
         )
 
@@ -275,6 +301,7 @@ class AsyncNamespaces(AsyncBaseResource):
             )
 
         logger.info(
-            f"Successfully listed {len(response_data['namespaces'])} namespaces."
+            "Successfully listed %d namespaces.", len(response_data["namespaces"])
         )
+        list_cache.set(_LIST_CACHE_KEY, copy.deepcopy(response_data))
         return cast(NamespaceListResponse, response_data)
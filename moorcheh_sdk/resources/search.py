@@ -1,15 +1,40 @@
+import copy
+import heapq
+import logging
+from itertools import chain
 from typing import Any, cast
 
 from ..exceptions import APIError, InvalidInputError
 from ..types import SearchResponse
+from ..utils.cache import payload_cache_key
+from ..utils.concurrency import gather_bounded
+from ..utils.constants import NUMERIC_TYPES
 from ..utils.decorators import required_args
 from ..utils.logging import setup_logging
+from ..utils.validators import all_instances, is_numeric_vector
 from .base import AsyncBaseResource, BaseResource
 
 logger = setup_logging(__name__)
 
 
+def _merge_search_responses(
+    responses: list[dict[str, Any]], top_k: int
+) -> dict[str, Any]:
+    # nlargest is stable, so equal scores keep namespace order.
+    results = heapq.nlargest(
+        top_k,
+        chain.from_iterable(response.get("results", []) for response in responses),
+        key=lambda result: result.get("score", 0.0),
+    )
+    execution_time = max(
+        (response.get("execution_time", 0.0) for response in responses), default=0.0
+    )
+    return {"results": results, "execution_time": execution_time}
+
+
 class Search(BaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespaces", "query"], types={"namespaces": list, "query": (str, list)}
     )
@@ -54,14 +79,14 @@ class Search(BaseResource):
             APIError: For other API errors.
             MoorchehError: For network issues.
         """
-        if not all(isinstance(ns, str) and ns for ns in namespaces):
+        if not (all_instances(namespaces, (str,)) and all(namespaces)):
             raise InvalidInputError(
                 "All items in 'namespaces' list must be non-empty strings."
             )
         if not isinstance(top_k, int) or top_k <= 0:
             raise InvalidInputError("'top_k' must be a positive integer.")
         if threshold is not None:
-            if not isinstance(threshold, (int, float)) or not (0 <= threshold <= 1):
+            if not isinstance(threshold, NUMERIC_TYPES) or not 0 <= threshold <= 1:
                 raise InvalidInputError(
                     "'threshold' must be a number between 0 and 1, or None."
                 )
@@ -76,16 +101,22 @@ class Search(BaseResource):
                 raise InvalidInputError(
                     "'query' cannot be an empty list for vector search."
                 )
-            if not all(isinstance(x, (int, float)) for x in query):
+            if not is_numeric_vector(query):
                 raise InvalidInputError(
                     "When 'query' is a list (vector search), all elements must be numbers."
                 )
 
         query_type = "vector" if isinstance(query, list) else "text"
-        logger.info(
-            f"Attempting {query_type} search in namespace(s) '{', '.join(namespaces)}'"
-            f" with top_k={top_k}, threshold={threshold}, kiosk={kiosk_mode}..."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Attempting %s search in namespace(s) '%s' with top_k=%s,"
+                " threshold=%s, kiosk=%s...",
+                query_type,
+                ", ".join(namespaces),
+                top_k,
+                threshold,
+                kiosk_mode,
+            )
 
         payload: dict[str, Any] = {
             "namespaces": namespaces,
@@ -97,9 +128,17 @@ class Search(BaseResource):
         if kiosk_mode:
             payload["threshold"] = threshold if threshold is not None else 0.25
 
-        logger.debug(f"Search payload: {payload}")
+        logger.debug("Search payload: %s", payload)
+
+        search_cache = self._client._search_cache
+        cache_key = payload_cache_key(payload) if search_cache.maxsize > 0 else None
+        if cache_key is not None:
+            cached = search_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached search results for identical request.")
+                return cast(SearchResponse, copy.deepcopy(cached))
 
-        response_data = self._client._request(
+        response_data = self._request(
             method="POST", endpoint="/search", json_data=payload, expected_status=200
         )
 
@@ -110,12 +149,18 @@ class Search(BaseResource):
         result_count = len(response_data.get("results", []))
         exec_time = response_data.get("execution_time", "N/A")
         logger.info(
-            f"Search completed successfully. Found {result_count} results. Execution time: {exec_time} seconds."
+            "Search completed successfully. Found %d results. Execution time: %s seconds.",
+            result_count,
+            exec_time,
         )
+        if cache_key is not None:
+            search_cache.set(cache_key, copy.deepcopy(response_data))
         return cast(SearchResponse, response_data)
 
 
 class AsyncSearch(AsyncBaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespaces", "query"], types={"namespaces": list, "query": (str, list)}
     )
@@ -126,6 +171,7 @@ class AsyncSearch(AsyncBaseResource):
         top_k: int = 10,
         threshold: float | None = None,
         kiosk_mode: bool = False,
+        fanout: bool = False,
     ) -> SearchResponse:
         """
         Performs a semantic search across specified namespaces asynchronously.
@@ -136,6 +182,9 @@ class AsyncSearch(AsyncBaseResource):
             top_k: The number of top results to return (default: 10).
             threshold: Minimum similarity score (0-1). Defaults to 0.25.
             kiosk_mode: Whether to enable kiosk mode (default: False).
+            fanout: Send one concurrent request per namespace and merge the
+                results by score client-side, so one slow namespace does not
+                hold up the others (default: False).
 
         Returns:
             A dictionary containing the search results.
@@ -160,14 +209,14 @@ class AsyncSearch(AsyncBaseResource):
             APIError: For other API errors.
             MoorchehError: For network issues.
         """
-        if not all(isinstance(ns, str) and ns for ns in namespaces):
+        if not (all_instances(namespaces, (str,)) and all(namespaces)):
             raise InvalidInputError(
                 "All items in 'namespaces' list must be non-empty strings."
             )
         if not isinstance(top_k, int) or top_k <= 0:
             raise InvalidInputError("'top_k' must be a positive integer.")
         if threshold is not None:
-            if not isinstance(threshold, (int, float)) or not (0 <= threshold <= 1):
+            if not isinstance(threshold, NUMERIC_TYPES) or not 0 <= threshold <= 1:
                 raise InvalidInputError(
                     "'threshold' must be a number between 0 and 1, or None."
                 )
@@ -177,21 +226,29 @@ class AsyncSearch(AsyncBaseResource):
                 )
         if not isinstance(kiosk_mode, bool):
             raise InvalidInputError("'kiosk_mode' must be a boolean.")
+        if not isinstance(fanout, bool):
+            raise InvalidInputError("'fanout' must be a boolean.")
         if isinstance(query, list):
             if not query:
                 raise InvalidInputError(
                     "'query' cannot be an empty list for vector search."
                 )
-            if not all(isinstance(x, (int, float)) for x in query):
+            if not is_numeric_vector(query):
                 raise InvalidInputError(
                     "When 'query' is a list (vector search), all elements must be numbers."
                 )
 
         query_type = "vector" if isinstance(query, list) else "text"
-        logger.info(
-            f"Attempting {query_type} search in namespace(s) '{', '.join(namespaces)}'"
-            f" with top_k={top_k}, threshold={threshold}, kiosk={kiosk_mode}..."
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Attempting %s search in namespace(s) '%s' with top_k=%s,"
+                " threshold=%s, kiosk=%s...",
+                query_type,
+                ", ".join(namespaces),
+                top_k,
+                threshold,
+                kiosk_mode,
+            )
 
         payload: dict[str, Any] = {
             "namespaces": namespaces,
@@ -203,9 +260,31 @@ class AsyncSearch(AsyncBaseResource):
         if kiosk_mode:
             payload["threshold"] = threshold if threshold is not None else 0.25
 
-        logger.debug(f"Search payload: {payload}")
+        logger.debug("Search payload: %s", payload)
+
+        search_cache = self._client._search_cache
+        cache_key = payload_cache_key(payload) if search_cache.maxsize > 0 else None
+        if cache_key is not None:
+            cached = search_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Returning cached search results for identical request.")
+                return cast(SearchResponse, copy.deepcopy(cached))
 
-        response_data = await self._client._request(
+        if fanout and len(namespaces) > 1:
+            response_data = await self._fanout_search(payload)
+        else:
+            response_data = await self._search(payload)
+
+        logger.info(
+            "Search completed successfully. Found %d results.",
+            len(response_data.get("results", [])),
+        )
+        if cache_key is not None:
+            search_cache.set(cache_key, copy.deepcopy(response_data))
+        return cast(SearchResponse, response_data)
+
+    async def _search(self, payload: dict[str, Any]) -> dict[str, Any]:
+        response_data = await self._request(
             method="POST",
             endpoint="/search",
             json_data=payload,
@@ -215,8 +294,13 @@ class AsyncSearch(AsyncBaseResource):
         if not isinstance(response_data, dict):
             logger.error("Search response was not a dictionary.")
             raise APIError(message="Unexpected response format from search endpoint.")
+        return response_data
 
-        logger.info(
-            f"Search completed successfully. Found {len(response_data.get('results', []))} results."
-        )
-        return cast(SearchResponse, response_data)
+    async def _fanout_search(self, payload: dict[str, Any]) -> dict[str, Any]:
+        payloads = [
+            {**payload, "namespaces": [namespace]}
+            for namespace in payload["namespaces"]
+        ]
+        # Every namespace is queried at once; the first failure cancels the rest.
+        responses = await gather_bounded(self._search, payloads, len(payloads))
+        return _merge_search_responses(responses, payload["top_k"])
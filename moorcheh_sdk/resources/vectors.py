@@ -1,26 +1,81 @@
-from typing import cast
+import logging
+from typing import Any, cast
 
 from ..exceptions import APIError, InvalidInputError
 from ..types import Vector, VectorDeleteResponse, VectorUploadResponse
 from ..utils.batching import chunk_iterable
 from ..utils.decorators import required_args
 from ..utils.logging import setup_logging
+from ..utils.urls import namespace_path
+from ..utils.validators import all_instances
 from .base import AsyncBaseResource, BaseResource
 
 logger = setup_logging(__name__)
 
+# Sync uploads at or below this size are sent as a single request.
+UPLOAD_CHUNK_SIZE = 1000
+
+
+def _merge_upload_responses(
+    responses: list[dict[str, Any]],
+) -> VectorUploadResponse:
+    processed_ids: list[str | int] = []
+    errors: list[dict[str, Any]] = []
+    status = "success"
+    for response_data in responses:
+        processed_ids.extend(response_data.get("vector_ids_processed", []))
+        chunk_errors = response_data.get("errors", [])
+        errors.extend(chunk_errors)
+        if chunk_errors or response_data.get("status") != "success":
+            status = "partial"
+    return cast(
+        VectorUploadResponse,
+        {"status": status, "vector_ids_processed": processed_ids, "errors": errors},
+    )
+
+
+def _validate_vector(index: int, vec_item: object) -> None:
+    if not isinstance(vec_item, dict):
+        raise InvalidInputError(
+            f"Item at index {index} in 'vectors' is not a dictionary."
+        )
+    # Single lookups: a missing key is treated like a None value.
+    vec_id = vec_item.get("id")
+    if vec_id is None or vec_id == "":
+        raise InvalidInputError(
+            f"Item at index {index} in 'vectors' is missing required key 'id' or it"
+            " is empty."
+        )
+    vector = vec_item.get("vector")
+    if not isinstance(vector, list):
+        raise InvalidInputError(
+            f"Item at index {index} with id '{vec_id}' is missing required"
+            " key 'vector' or it is not a list."
+        )
+    if not vector:
+        raise InvalidInputError(
+            f"Item at index {index} with id '{vec_id}' has an empty 'vector' list."
+        )
+
 
 class Vectors(BaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespace_name", "vectors"], types={"namespace_name": str, "vectors": list}
     )
     def upload(
-        self, namespace_name: str, vectors: list[Vector]
+        self,
+        namespace_name: str,
+        vectors: list[Vector],
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
     ) -> VectorUploadResponse:
         """
         Uploads pre-computed vectors to a vector-based namespace.
 
-        This process is synchronous.
+        This process is synchronous. Lists longer than `chunk_size` are sent as
+        consecutive requests so that only one chunk is serialized at a time;
+        their responses are merged into a single result.
 
         Args:
             namespace_name: The name of the target vector-based namespace.
@@ -29,6 +84,8 @@ class Vectors(BaseResource):
                 - "id" (str | int): Unique identifier for the vector.
                 - "vector" (list[float]): The vector embedding.
                 - "metadata" (dict, optional): Additional metadata.
+            chunk_size: The maximum number of vectors sent per request.
+                Defaults to 1000.
 
         Returns:
             A dictionary confirming the result of the upload.
@@ -49,59 +106,55 @@ class Vectors(BaseResource):
         """
 
         logger.info(
-            f"Attempting to upload {len(vectors)} vectors to namespace"
-            f" '{namespace_name}'..."
+            "Attempting to upload %d vectors to namespace '%s'...",
+            len(vectors),
+            namespace_name,
         )
 
         for i, vec_item in enumerate(vectors):
-            if not isinstance(vec_item, dict):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'vectors' is not a dictionary."
-                )
-            if "id" not in vec_item or vec_item["id"] is None or vec_item["id"] == "":
-                raise InvalidInputError(
-                    f"Item at index {i} in 'vectors' is missing required key 'id' or it"
-                    " is empty."
-                )
-            if "vector" not in vec_item or not isinstance(vec_item["vector"], list):
-                raise InvalidInputError(
-                    f"Item at index {i} with id '{vec_item['id']}' is missing required"
-                    " key 'vector' or it is not a list."
-                )
-            if not vec_item["vector"]:
-                raise InvalidInputError(
-                    f"Item at index {i} with id '{vec_item['id']}' has an empty 'vector' list."
-                )
+            _validate_vector(i, vec_item)
 
-        endpoint = f"/namespaces/{namespace_name}/vectors"
-        payload = {"vectors": vectors}
-        logger.debug(f"Upload vectors payload size: {len(vectors)}")
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise InvalidInputError("'chunk_size' must be a positive integer.")
 
-        # Expecting 201 Created or 207 Multi-Status
-        response_data = self._client._request(
-            method="POST",
-            endpoint=endpoint,
-            json_data=payload,
-            expected_status=201,
-            alt_success_status=207,
-        )
+        endpoint = f"{namespace_path(namespace_name)}/vectors"
+        responses = []
 
-        if not isinstance(response_data, dict):
-            logger.error("Upload vectors response was not a dictionary.")
-            raise APIError(
-                message="Unexpected response format after uploading vectors."
+        for chunk in chunk_iterable(vectors, chunk_size):
+            logger.debug("Upload vectors payload size: %d", len(chunk))
+
+            # Expecting 201 Created or 207 Multi-Status
+            chunk_response = self._request(
+                method="POST",
+                endpoint=endpoint,
+                json_data={"vectors": chunk},
+                expected_status=201,
+                alt_success_status=207,
             )
 
+            if not isinstance(chunk_response, dict):
+                logger.error("Upload vectors response was not a dictionary.")
+                raise APIError(
+                    message="Unexpected response format after uploading vectors."
+                )
+            responses.append(chunk_response)
+
+        response_data = (
+            responses[0] if len(responses) == 1 else _merge_upload_responses(responses)
+        )
+
         processed_count = len(response_data.get("vector_ids_processed", []))
         error_count = len(response_data.get("errors", []))
         logger.info(
-            f"Upload vectors to '{namespace_name}' completed. Status:"
-            f" {response_data.get('status')}, Processed: {processed_count}, Errors:"
-            f" {error_count}"
+            "Upload vectors to '%s' completed. Status: %s, Processed: %d, Errors: %d",
+            namespace_name,
+            response_data.get("status"),
+            processed_count,
+            error_count,
         )
         if error_count > 0:
             logger.warning(
-                f"Upload vectors encountered errors: {response_data.get('errors')}"
+                "Upload vectors encountered errors: %s", response_data.get("errors")
             )
         return cast(VectorUploadResponse, response_data)
 
@@ -135,22 +188,24 @@ class Vectors(BaseResource):
         """
 
         logger.info(
-            f"Attempting to delete {len(ids)} vector(s) from namespace"
-            f" '{namespace_name}' with IDs: {ids}"
+            "Attempting to delete %d vector(s) from namespace '%s'.",
+            len(ids),
+            namespace_name,
         )
-        if not all(
-            isinstance(item_id, (str, int)) and (item_id or item_id == 0)
-            for item_id in ids
-        ):
+        # The ID list can be large, so it is only rendered at DEBUG level.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("IDs: %r", ids)
+        # Any int is accepted (including 0); strings must be non-empty.
+        if not all_instances(ids, (str, int)) or "" in ids:
             raise InvalidInputError(
                 "All items in 'ids' list must be non-empty strings or integers."
             )
 
-        endpoint = f"/namespaces/{namespace_name}/vectors/delete"
+        endpoint = f"{namespace_path(namespace_name)}/vectors/delete"
         payload = {"ids": ids}
 
         # Expecting 200 OK or 207 Multi-Status
-        response_data = self._client._request(
+        response_data = self._request(
             method="POST",
             endpoint=endpoint,
             json_data=payload,
@@ -165,18 +220,22 @@ class Vectors(BaseResource):
         deleted_count = len(response_data.get("deleted_ids", []))
         error_count = len(response_data.get("errors", []))
         logger.info(
-            f"Delete vectors from '{namespace_name}' completed. Status:"
-            f" {response_data.get('status')}, Deleted: {deleted_count}, Errors:"
-            f" {error_count}"
+            "Delete vectors from '%s' completed. Status: %s, Deleted: %d, Errors: %d",
+            namespace_name,
+            response_data.get("status"),
+            deleted_count,
+            error_count,
         )
         if error_count > 0:
             logger.warning(
-                f"Delete vectors encountered errors: {response_data.get('errors')}"
+                "Delete vectors encountered errors: %s", response_data.get("errors")
             )
         return cast(VectorDeleteResponse, response_data)
 
 
 class AsyncVectors(AsyncBaseResource):
+    __slots__ = ()
+
     @required_args(
         ["namespace_name", "vectors"], types={"namespace_name": str, "vectors": list}
     )
@@ -212,41 +271,23 @@ class AsyncVectors(AsyncBaseResource):
             MoorchehError: For network issues.
         """
         logger.info(
-            f"Attempting to upload {len(vectors)} vectors to namespace"
-            f" '{namespace_name}'..."
+            "Attempting to upload %d vectors to namespace '%s'...",
+            len(vectors),
+            namespace_name,
         )
 
         for i, vec_item in enumerate(vectors):
-            if not isinstance(vec_item, dict):
-                raise InvalidInputError(
-                    f"Item at index {i} in 'vectors' is not a dictionary."
-                )
-            if "id" not in vec_item or vec_item["id"] is None or vec_item["id"] == "":
-                raise InvalidInputError(
-                    f"Item at index {i} in 'vectors' is missing required key 'id' or it"
-                    " is empty."
-                )
-            if "vector" not in vec_item or not isinstance(vec_item["vector"], list):
-                raise InvalidInputError(
-                    f"Item at index {i} with id '{vec_item['id']}' is missing required"
-                    " key 'vector' or it is not a list."
-                )
-            if not vec_item["vector"]:
-                raise InvalidInputError(
-                    f"Item at index {i} with id '{vec_item['id']}' has an empty 'vector' list."
-                )
+            _validate_vector(i, vec_item)
 
-        endpoint = f"/namespaces/{namespace_name}/vectors"
+        endpoint = f"{namespace_path(namespace_name)}/vectors"
 
-        all_processed_ids = []
-        all_errors = []
-        overall_status = "success"
+        responses = []
 
         for batch in chunk_iterable(vectors, 100):
             payload = {"vectors": batch}
-            logger.debug(f"Uploading batch of {len(batch)} vectors...")
+            logger.debug("Uploading batch of %d vectors...", len(batch))
 
-            response_data = await self._client._request(
+            response_data = await self._request(
                 method="POST",
                 endpoint=endpoint,
                 json_data=payload,
@@ -260,26 +301,20 @@ class AsyncVectors(AsyncBaseResource):
                     message="Unexpected response format after uploading vectors."
                 )
 
-            all_processed_ids.extend(response_data.get("vector_ids_processed", []))
-            batch_errors = response_data.get("errors", [])
-            all_errors.extend(batch_errors)
-
-            if batch_errors or response_data.get("status") != "success":
-                overall_status = "partial"
+            responses.append(response_data)
 
+        result = _merge_upload_responses(responses)
         logger.info(
-            f"Upload vectors to '{namespace_name}' completed. Status:"
-            f" {overall_status}, Processed: {len(all_processed_ids)}, Errors:"
-            f" {len(all_errors)}"
+            "Upload vectors to '%s' completed. Status: %s, Processed: %d, Errors: %d",
+            namespace_name,
+            result["status"],
+            len(result["vector_ids_processed"]),
+            len(result["errors"]),
         )
-        if all_errors:
-            logger.warning(f"Upload vectors encountered errors: {all_errors}")
+        if result["errors"]:
+            logger.warning("Upload vectors encountered errors: %s", result["errors"])
 
-        return {
-            "status": overall_status,
-            "vector_ids_processed": all_processed_ids,
-            "errors": all_errors,
-        }
+        return result
 
     @required_args(
         ["namespace_name", "ids"], types={"namespace_name": str, "ids": list}
@@ -312,21 +347,23 @@ class AsyncVectors(AsyncBaseResource):
             MoorchehError: For network issues.
         """
         logger.info(
-            f"Attempting to delete {len(ids)} vector(s) from namespace"
-            f" '{namespace_name}' with IDs: {ids}"
+            "Attempting to delete %d vector(s) from namespace '%s'.",
+            len(ids),
+            namespace_name,
         )
-        if not all(
-            isinstance(item_id, (str, int)) and (item_id or item_id == 0)
-            for item_id in ids
-        ):
+        # The ID list can be large, so it is only rendered at DEBUG level.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("IDs: %r", ids)
+        # Any int is accepted (including 0); strings must be non-empty.
+        if not all_instances(ids, (str, int)) or "" in ids:
             raise InvalidInputError(
                 "All items in 'ids' list must be non-empty strings or integers."
             )
 
-        endpoint = f"/namespaces/{namespace_name}/vectors/delete"
+        endpoint = f"{namespace_path(namespace_name)}/vectors/delete"
         payload = {"ids": ids}
 
-        response_data = await self._client._request(
+        response_data = await self._request(
             method="POST",
             endpoint=endpoint,
             json_data=payload,
@@ -344,12 +381,14 @@ class AsyncVectors(AsyncBaseResource):
         error_count = len(response_data.get("errors", []))
 
         logger.info(
-            f"Delete vectors from '{namespace_name}' completed. Status:"
-            f" {response_data.get('status')}, Deleted: {deleted_count}, Errors:"
-            f" {error_count}"
+            "Delete vectors from '%s' completed. Status: %s, Deleted: %d, Errors: %d",
+            namespace_name,
+            response_data.get("status"),
+            deleted_count,
+            error_count,
         )
         if error_count > 0:
             logger.warning(
-                f"Delete vectors encountered errors: {response_data.get('errors')}"
+                "Delete vectors encountered errors: %s", response_data.get("errors")
             )
         return cast(VectorDeleteResponse, response_data)
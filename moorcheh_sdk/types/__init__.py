@@ -3,7 +3,7 @@ from typing import Any, TypeVar
 
 import httpx
 
-from .answer import AnswerResponse, ChatHistoryItem
+from .answer import AnswerResponse, AnswerStreamChunk, ChatHistoryItem
 from .common import StatusResponse
 from .document import (
     Document,
@@ -53,4 +53,5 @@ __all__ = [
     "SearchResponse",
     "ChatHistoryItem",
     "AnswerResponse",
+    "AnswerStreamChunk",
 ]
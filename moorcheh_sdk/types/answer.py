@@ -13,3 +13,14 @@ class AnswerResponse(TypedDict):
     query: str
     usedContext: bool | None
     structuredData: dict | None
+
+
+class AnswerStreamChunk(TypedDict, total=False):
+    delta: str
+    done: bool
+    answer: str
+    model: str
+    contextCount: int
+    query: str
+    usedContext: bool | None
+    structuredData: dict | None
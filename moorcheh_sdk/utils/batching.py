@@ -15,6 +15,12 @@ def chunk_iterable(iterable: Iterable[T], size: int) -> Generator[list[T], None,
     Yields:
         A list containing 'size' elements from the iterable.
     """
+    if isinstance(iterable, list):
+        # Slicing a list copies item pointers in one step instead of appending
+        # items one by one.
+        for start in range(0, len(iterable), size):
+            yield iterable[start : start + size]
+        return
     chunk = []
     for item in iterable:
         chunk.append(item)
@@ -0,0 +1,80 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Sequence[T], max_concurrency: int
+) -> list[R]:
+    """
+    Applies `func` to every item from a bounded thread pool.
+
+    Results are returned in the order of `items`. A single item is processed
+    inline, without starting a pool. When a call fails, the calls that have not
+    started yet are cancelled. Calls that are already running still complete.
+    The error of the first failed item is then raised.
+
+    Args:
+        func: The function to apply.
+        items: The items to process.
+        max_concurrency: The maximum number of calls running at once.
+
+    Returns:
+        The list of results, in input order.
+    """
+    if len(items) <= 1 or max_concurrency <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+        for future in pending:
+            future.cancel()
+    for future in futures:
+        if not future.cancelled() and future.exception() is not None:
+            future.result()  # Re-raises the first failure in input order
+    return [future.result() for future in futures]
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]], items: Sequence[T], max_concurrency: int
+) -> list[R]:
+    """
+    Awaits `func` for every item with at most `max_concurrency` calls in flight.
+
+    When a call fails, or this coroutine is cancelled, every call still pending
+    is cancelled before the error propagates. The error of the first failed
+    item is then raised.
+
+    Args:
+        func: The coroutine function to apply.
+        items: The items to process.
+        max_concurrency: The maximum number of calls awaited at once.
+
+    Returns:
+        The list of results, in input order.
+    """
+    if len(items) <= 1:
+        return [await func(item) for item in items]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            task.result()  # Re-raises the first failure in input order
+    return [task.result() for task in tasks]
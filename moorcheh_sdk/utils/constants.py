@@ -1,2 +1,9 @@
 DEFAULT_BASE_URL = "https://api.moorcheh.ai/v1"
 INVALID_ID_CHARS = [" "]
+
+# Upper bound on concurrent requests issued by batch helpers (e.g. generate_many).
+# Kept below the client's keep-alive pool size so batches reuse warm connections.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Hoisted so hot-path isinstance checks do not rebuild the tuple on every call.
+NUMERIC_TYPES = (int, float)
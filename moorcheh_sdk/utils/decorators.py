@@ -4,10 +4,22 @@ from functools import wraps
 from typing import ParamSpec, TypeVar
 
 from ..exceptions import InvalidInputError
+from .validators import required_checker
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
+_MISSING = object()
+_EMPTY = inspect.Parameter.empty
+_KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+_VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+_VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+_KEYWORD_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, _KEYWORD_ONLY)
+
 
 def required_args(
     args: Sequence[str],
@@ -25,67 +37,73 @@ def required_args(
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
         is_async = inspect.iscoroutinefunction(func)
-
-        @wraps(func)
-        def wrapper(*func_args: P.args, **func_kwargs: P.kwargs) -> R:
-            sig = inspect.signature(func)
+        # Everything below is resolved once per decorated function, so a call
+        # only reads the required values out of args/kwargs.
+        sig = inspect.signature(func)
+        params = sig.parameters.values()
+        positional = [p.name for p in params if p.kind in _POSITIONAL_KINDS]
+        n_mandatory = sum(
+            1 for p in params if p.kind in _POSITIONAL_KINDS and p.default is _EMPTY
+        )
+        keyword_names = frozenset(p.name for p in params if p.kind in _KEYWORD_KINDS)
+        kw_mandatory = frozenset(
+            p.name for p in params if p.kind is _KEYWORD_ONLY and p.default is _EMPTY
+        )
+        max_positional = (
+            None if any(p.kind is _VAR_POSITIONAL for p in params) else len(positional)
+        )
+        has_var_keyword = any(p.kind is _VAR_KEYWORD for p in params)
+        checks = [
+            (
+                name,
+                positional.index(name) if name in positional else None,
+                _MISSING if param.default is _EMPTY else param.default,
+                required_checker(name, types.get(name) if types else None),
+            )
+            for name in args
+            if (param := sig.parameters.get(name)) is not None
+        ]
+
+        def bind(func_args: tuple, func_kwargs: dict) -> None:
+            # Slow path for malformed calls: let inspect report the problem.
             try:
-                bound = sig.bind(*func_args, **func_kwargs)
+                sig.bind(*func_args, **func_kwargs)
             except TypeError as e:
                 raise InvalidInputError(str(e)) from e
 
-            bound.apply_defaults()
-
-            for arg_name in args:
-                if arg_name not in bound.arguments:
+        def validate(func_args: tuple, func_kwargs: dict) -> None:
+            n_args = len(func_args)
+            if (
+                (max_positional is not None and n_args > max_positional)
+                or (not has_var_keyword and not func_kwargs.keys() <= keyword_names)
+                or not func_kwargs.keys().isdisjoint(positional[:n_args])
+                or any(
+                    name not in func_kwargs for name in positional[n_args:n_mandatory]
+                )
+                or not kw_mandatory <= func_kwargs.keys()
+            ):
+                bind(func_args, func_kwargs)
+
+            for arg_name, position, default, check in checks:
+                if arg_name in func_kwargs:
+                    value = func_kwargs[arg_name]
+                elif position is not None and position < n_args:
+                    value = func_args[position]
+                else:
+                    value = default
+                if value is _MISSING:
                     continue
 
-                val = bound.arguments[arg_name]
-
-                if val is None:
-                    raise InvalidInputError(f"Argument '{arg_name}' cannot be None.")
-
-                if isinstance(val, (str, list, dict, set, tuple)) and not val:
-                    raise InvalidInputError(f"Argument '{arg_name}' cannot be empty.")
-
-                if types and arg_name in types:
-                    expected_type = types[arg_name]
-                    if not isinstance(val, expected_type):
-                        raise InvalidInputError(
-                            f"Argument '{arg_name}' must be of type {expected_type}."
-                        )
+                check(value)
 
+        @wraps(func)
+        def wrapper(*func_args: P.args, **func_kwargs: P.kwargs) -> R:
+            validate(func_args, func_kwargs)
             return func(*func_args, **func_kwargs)
 
         @wraps(func)
         async def async_wrapper(*func_args: P.args, **func_kwargs: P.kwargs) -> R:
-            sig = inspect.signature(func)
-            try:
-                bound = sig.bind(*func_args, **func_kwargs)
-            except TypeError as e:
-                raise InvalidInputError(str(e)) from e
-
-            bound.apply_defaults()
-
-            for arg_name in args:
-                if arg_name not in bound.arguments:
-                    continue
-
-                val = bound.arguments[arg_name]
-
-                if val is None:
-                    raise InvalidInputError(f"Argument '{arg_name}' cannot be None.")
-
-                if isinstance(val, (str, list, dict, set, tuple)) and not val:
-                    raise InvalidInputError(f"Argument '{arg_name}' cannot be empty.")
-
-                if types and arg_name in types:
-                    expected_type = types[arg_name]
-                    if not isinstance(val, expected_type):
-                        raise InvalidInputError(
-                            f"Argument '{arg_name}' must be of type {expected_type}."
-                        )
-
+            validate(func_args, func_kwargs)
             return await func(*func_args, **func_kwargs)  # type: ignore
 
         if is_async:
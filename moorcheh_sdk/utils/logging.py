@@ -1,7 +1,11 @@
 import logging
+from functools import cache
 
 
+@cache
 def setup_logging(name: str) -> logging.Logger:
+    # Cached so re-imports and repeated calls for the same module do not re-inspect
+    # or re-wire handlers.
     logger = logging.getLogger(name)
     if not logger.hasHandlers():
         logger.addHandler(logging.NullHandler())
@@ -0,0 +1,37 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+
+def json_dumps(obj: Any, *, sort_keys: bool = False) -> bytes:
+    """
+    Serializes `obj` to compact UTF-8 JSON bytes.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    With orjson, NumPy arrays are serialized natively without a `tolist()` copy.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """
+    Deserializes JSON bytes or text.
+
+    Uses orjson when it is installed and falls back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,29 @@
+class SSEDecoder:
+    """
+    Incremental decoder for a Server-Sent Events stream.
+
+    Lines are fed one at a time (without their trailing newline). Only the `data`
+    field is kept; multi-line data is joined with newlines as per the SSE spec.
+    """
+
+    def __init__(self) -> None:
+        self._data: list[str] = []
+
+    def decode(self, line: str) -> str | None:
+        """Feeds a line and returns the event data once an event is complete."""
+        if not line:
+            return self.flush()
+        if line.startswith(":"):  # Comment / keep-alive
+            return None
+        field, _, value = line.partition(":")
+        if field == "data":
+            self._data.append(value[1:] if value.startswith(" ") else value)
+        return None
+
+    def flush(self) -> str | None:
+        """Returns the data of a pending, unterminated event, if any."""
+        if not self._data:
+            return None
+        data = "\n".join(self._data)
+        self._data = []
+        return data
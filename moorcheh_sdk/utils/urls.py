@@ -0,0 +1,13 @@
+from functools import lru_cache
+from urllib.parse import quote
+
+
+@lru_cache(maxsize=128)
+def namespace_path(namespace_name: str) -> str:
+    """
+    Returns the `/namespaces/{name}` path for a namespace.
+
+    The name is percent-encoded as a single path segment, so characters such as
+    `/`, `?` or spaces cannot change the request target.
+    """
+    return f"/namespaces/{quote(namespace_name, safe='')}"
@@ -0,0 +1,96 @@
+from collections.abc import Callable, Sequence
+
+from ..exceptions import InvalidInputError
+from .constants import NUMERIC_TYPES
+
+# Types whose empty instances are rejected by required-argument checks.
+_EMPTY_CHECKABLE = (str, list, dict, set, tuple)
+
+
+def check_required(
+    name: str,
+    value: object,
+    expected_type: type | tuple[type, ...] | None = None,
+) -> None:
+    """
+    Checks that a required argument is not None, not empty and of the expected type.
+
+    This is the per-argument check applied by `required_args`, exposed so that hot
+    paths with a fixed signature can validate without binding the call signature.
+
+    Args:
+        name: The argument name, used in the error message.
+        value: The argument value.
+        expected_type: The expected type (or tuple of types), if any.
+
+    Raises:
+        InvalidInputError: If the argument is None, empty or of the wrong type.
+    """
+    if value is None:
+        raise InvalidInputError(f"Argument '{name}' cannot be None.")
+
+    if isinstance(value, _EMPTY_CHECKABLE) and not value:
+        raise InvalidInputError(f"Argument '{name}' cannot be empty.")
+
+    if expected_type is not None and not isinstance(value, expected_type):
+        raise InvalidInputError(f"Argument '{name}' must be of type {expected_type}.")
+
+
+def required_checker(
+    name: str, expected_type: type | tuple[type, ...] | None = None
+) -> Callable[[object], None]:
+    """
+    Returns a `check_required` function specialized for one argument.
+
+    When the expected type is known, a valid value costs a single `isinstance`
+    call plus, for sized types, a truthiness test. Invalid values go through
+    `check_required`, so error messages are unchanged.
+
+    Args:
+        name: The argument name, used in error messages.
+        expected_type: The expected type (or tuple of types), if any.
+    """
+    if expected_type is None or isinstance(None, expected_type):
+
+        def check_generic(value: object) -> None:
+            check_required(name, value, expected_type)
+
+        return check_generic
+
+    expected = expected_type if isinstance(expected_type, tuple) else (expected_type,)
+    always_sized = all(issubclass(t, _EMPTY_CHECKABLE) for t in expected)
+    never_sized = not any(
+        issubclass(t, _EMPTY_CHECKABLE)
+        or any(issubclass(e, t) for e in _EMPTY_CHECKABLE)
+        for t in expected
+    )
+
+    def check_typed(value: object) -> None:
+        if isinstance(value, expected_type):
+            if never_sized or value:
+                return
+            if always_sized or isinstance(value, _EMPTY_CHECKABLE):
+                raise InvalidInputError(f"Argument '{name}' cannot be empty.")
+            return
+        # Wrong type: defer to the generic check for the exact error message.
+        check_required(name, value, expected_type)
+
+    return check_typed
+
+
+def all_instances(values: Sequence[object], types: tuple[type, ...]) -> bool:
+    """
+    Returns True if every element of `values` is an instance of `types`.
+
+    The element types are collected with `map` and `set`, which run in C, so
+    values of exactly the listed types need no per-element bytecode. Subclasses
+    (such as bool or NumPy scalars) fall back to an `isinstance` check.
+    """
+    if set(map(type, values)).issubset(types):
+        return True
+    return all(isinstance(value, types) for value in values)
+
+
+def is_numeric_vector(values: Sequence[object]) -> bool:
+    """Returns True if every element of `values` is an int or a float."""
+    return all_instances(values, NUMERIC_TYPES)
@@ -1,54 +1,96 @@
-import os
-from unittest.mock import patch  # Use unittest.mock for patching os.environ
+from unittest.mock import MagicMock, patch
 
 import httpx
 import pytest
 
 from moorcheh_sdk import MoorchehClient
-from tests.constants import DUMMY_API_KEY
+from tests.constants import CLIENT_ENV_VARS, DUMMY_API_KEY
+from tests.helpers import FakeResponse
+
+# Fixtures only change CLIENT_ENV_VARS through monkeypatch, so every change is
+# undone and tests can run under pytest-xdist.
+
+# Response bodies used by mock_response: empty JSON containers keep their
+# literal encoding, any other JSON payload gets a non-empty dummy body.
+_EMPTY_JSON_CONTENT = {dict: b"{}", list: b"[]"}
+_DUMMY_JSON_CONTENT = b'{"data": "dummy"}'
 
 # --- Shared Fixtures ---
 
 
+@pytest.fixture(scope="session")
+def _httpx_client_spec_mock():
+    """Builds the spec'd httpx.Client mock once per session; specs are costly."""
+    return MagicMock(spec_set=httpx.Client)
+
+
 @pytest.fixture(scope="function")
-def mock_httpx_client(mocker):
+def mock_httpx_client(_httpx_client_spec_mock):
     """Fixture to mock the internal httpx.Client."""
     # Mock the httpx.Client instance created within MoorchehClient.__init__
-    mock_client_instance = mocker.MagicMock(spec=httpx.Client)
+    mock_client_instance = _httpx_client_spec_mock
+    mock_client_instance.reset_mock(return_value=True, side_effect=True)
     # Mock the request method on the instance
-    mock_client_instance.request = mocker.MagicMock()
+    mock_client_instance.request = MagicMock()
     # Mock the close method
-    mock_client_instance.close = mocker.MagicMock()
+    mock_client_instance.close = MagicMock()
     # Patch httpx.Client to return our mock instance when called
-    mocker.patch("httpx.Client", return_value=mock_client_instance)
-    return mock_client_instance
+    with patch("httpx.Client", return_value=mock_client_instance):
+        yield mock_client_instance
 
 
 @pytest.fixture(scope="function")
-def client(mock_httpx_client):
-    """Fixture to provide a MoorchehClient instance with a mocked httpx client."""
-    # Ensure the environment variable isn't interfering if not passed directly
-    with patch.dict(os.environ, {}, clear=True):
-        # Use context manager to ensure close is called if needed, though we mock it
-        with MoorchehClient(api_key=DUMMY_API_KEY) as instance:
-            # Attach the mock client instance for easier access in tests
-            instance._mock_httpx_instance = mock_httpx_client
-            yield instance  # Provide the instance to the test
+def clean_env(monkeypatch):
+    """Fixture that unsets the client environment variables for one test."""
+    # monkeypatch restores only the variables it touched.
+    for name in CLIENT_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture(scope="session")
+def _shared_client(_httpx_client_spec_mock):
+    """Builds one MoorchehClient per session around the shared httpx.Client mock."""
+    # Environment variables and httpx.Client only matter during construction.
+    with pytest.MonkeyPatch.context() as mp:
+        for name in CLIENT_ENV_VARS:
+            mp.delenv(name, raising=False)
+        mp.setattr(httpx, "Client", MagicMock(return_value=_httpx_client_spec_mock))
+        instance = MoorchehClient(api_key=DUMMY_API_KEY)
+    # Attach the mock client instance for easier access in tests
+    instance._mock_httpx_instance = _httpx_client_spec_mock
+    with instance:
+        yield instance
     # __exit__ will call close on the client, which calls close on the mock
 
 
 @pytest.fixture(scope="function")
-def client_no_env_key():
+def client(_shared_client, mock_httpx_client):
+    """Fixture to provide a MoorchehClient instance with a mocked httpx client."""
+    # mock_httpx_client resets the shared mock and gives it fresh request/close
+    # mocks. The client's caches are disabled by default, and tests that need
+    # one install it with monkeypatch, so no other state carries over.
+    return _shared_client
+
+
+@pytest.fixture(scope="function")
+def client_no_env_key(clean_env):
     """Fixture to test client initialization without API key."""
     # Ensure MOORCHEH_API_KEY is not set in the environment for this test
-    with patch.dict(os.environ, {}, clear=True):
-        yield  # Allow the test to run
-    # Environment is restored automatically after 'yield'
+    yield  # Allow the test to run
+
+
+@pytest.fixture(scope="module")
+def sample_pdf(tmp_path_factory):
+    """Fixture providing a small PDF file, written once per module."""
+    path = tmp_path_factory.mktemp("uploads") / "test.pdf"
+    path.write_bytes(b"content")
+    return path
 
 
 @pytest.fixture
-def mock_response(mocker):
-    """Helper to create a mock httpx.Response."""
+def mock_response():
+    """Helper to create a lightweight stand-in for httpx.Response."""
 
     def _mock_response(
         status_code,
@@ -57,46 +99,37 @@ def mock_response(mocker):
         content_type="application/json",
         headers=None,
     ):
-        response = mocker.MagicMock(spec=httpx.Response)
-        response.status_code = status_code
-        response.headers = headers or {"content-type": content_type}
-        if json_data is not None:
-            response.json.return_value = json_data
-            # Simulate empty content if json_data is empty dict/list
-            response.content = (
-                b"{}"
-                if isinstance(json_data, dict) and not json_data
-                else (
-                    b"[]"
-                    if isinstance(json_data, list) and not json_data
-                    else b'{"data": "dummy"}'
-                )
-            )
-        else:
-            response.json.side_effect = Exception(
-                "Cannot decode JSON"
-            )  # Make sure .json() fails if no JSON
-            response.content = b""  # Default empty content
-
-        response.text = (
+        text = (
             text_data if text_data is not None else str(json_data) if json_data else ""
         )
-        if response.content == b"" and response.text:
-            response.content = response.text.encode("utf-8")
-
-        # Mock raise_for_status to raise appropriate error only if status >= 400
-        def raise_for_status_side_effect(*args, **kwargs):
-            if status_code >= 400:
-                raise httpx.HTTPStatusError(
-                    message=f"Mock Error {status_code}",
-                    request=mocker.MagicMock(),
-                    response=response,
-                )
-
-        response.raise_for_status = mocker.MagicMock(
-            side_effect=raise_for_status_side_effect
+        if json_data is None:
+            # json() fails when there is no JSON; the body is the raw text
+            content = text.encode("utf-8")
+        elif json_data:
+            content = _DUMMY_JSON_CONTENT
+        else:
+            # Simulate empty content if json_data is empty dict/list
+            content = _EMPTY_JSON_CONTENT.get(type(json_data), _DUMMY_JSON_CONTENT)
+
+        # raise_for_status raises HTTPStatusError only if status >= 400
+        return FakeResponse(
+            status_code,
+            json_data,
+            text,
+            headers or {"content-type": content_type},
+            content,
         )
 
-        return response
-
     return _mock_response
+
+
+@pytest.fixture
+def error_response(client, mock_response):
+    """Helper to make the client's requests return an error response."""
+
+    def _error_response(status_code, error_text):
+        client._mock_httpx_instance.request.return_value = mock_response(
+            status_code, text_data=error_text
+        )
+
+    return _error_response
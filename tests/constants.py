@@ -7,4 +7,9 @@ TEST_DOC_ID_1 = "doc-abc"
 TEST_DOC_ID_2 = 123
 TEST_VEC_ID_1 = "vec-xyz"
 TEST_VEC_ID_2 = 456
-SDK_VERSION = "1.1.0"
+
+# Environment variables read by the clients.
+CLIENT_ENV_VARS = ("MOORCHEH_API_KEY", "MOORCHEH_BASE_URL")
+
+# Headers of a streamed (Server-Sent Events) answer response.
+SSE_HEADERS = {"content-type": "text/event-stream"}
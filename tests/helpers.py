@@ -0,0 +1,75 @@
+import json
+from typing import Any
+
+import httpx
+
+# Request attached to the HTTPStatusError raised by FakeResponse; built once.
+_ERROR_REQUEST = httpx.Request("GET", "https://api.moorcheh.ai")
+
+
+class FakeResponse:
+    """
+    Lightweight stand-in for httpx.Response.
+
+    Only the attributes the client reads are provided, and `__slots__` keeps
+    instances small, which makes it much cheaper to construct than a MagicMock
+    in tests that need many responses.
+    """
+
+    __slots__ = ("status_code", "_json", "text", "content", "headers")
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        json_data: Any = None,
+        text: str = "",
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self._json = json_data
+        self.text = text
+        if content is None:
+            content = json.dumps(json_data).encode() if json_data is not None else b""
+        self.content = content
+        self.headers = headers or {"content-type": "application/json"}
+
+    def json(self) -> Any:
+        if self._json is None:
+            raise ValueError("Cannot decode JSON")
+        return self._json
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise httpx.HTTPStatusError(
+                f"HTTP {self.status_code}",
+                request=_ERROR_REQUEST,
+                response=self,  # type: ignore[arg-type]
+            )
+
+
+def fast_response(
+    status_code: int = 200,
+    json_data: Any = None,
+    text: str = "",
+    headers: dict[str, str] | None = None,
+) -> FakeResponse:
+    """Builds a FakeResponse with the given status, JSON body, text and headers."""
+    return FakeResponse(status_code, json_data, text, headers)
+
+
+class AmbiguousTruth:
+    """
+    Value whose truth and equality checks raise, like a NumPy array.
+
+    Used to check that validators reject such values by type before testing
+    them for emptiness.
+    """
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __bool__(self) -> bool:
+        raise ValueError("The truth value of this object is ambiguous")
+
+    def __eq__(self, other: object) -> bool:
+        raise ValueError("The truth value of this object is ambiguous")
@@ -1,15 +1,19 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from moorcheh_sdk import (
     APIError,
     InvalidInputError,
 )
+from moorcheh_sdk.utils.cache import TTLCache
 from tests.constants import (
+    SSE_HEADERS,
     TEST_NAMESPACE,
 )
 
 
-def test_get_generative_answer_success(client, mocker, mock_response):
+def test_get_generative_answer_success(client, mock_response):
     """Test successful call to get_generative_answer."""
     query = "What is Moorcheh?"
     model = "anthropic.claude-v2:1"
@@ -44,7 +48,7 @@ def test_get_generative_answer_success(client, mocker, mock_response):
     assert result == expected_response
 
 
-def test_generate_answer_with_prompts(client, mocker, mock_response):
+def test_generate_answer_with_prompts(client, mock_response):
     """Test get_generative_answer with header and footer prompts."""
     query = "What is Moorcheh?"
     header = "You are a helpful assistant."
@@ -118,17 +122,35 @@ def test_get_generative_answer_invalid_input_client_side(
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_get_generative_answer_server_error(client, mocker, mock_response):
+@pytest.mark.parametrize("method", ["generate", "stream"])
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"namespace": TEST_NAMESPACE}, "missing a required argument: 'query'"),
+        (
+            {"query": "q", "namespace": TEST_NAMESPACE, "top": 3},
+            "unexpected keyword argument 'top'",
+        ),
+    ],
+    ids=["missing_query", "unknown_kwarg"],
+)
+def test_answer_malformed_call_raises_invalid_input(client, method, kwargs, msg):
+    """Test that a call that does not match the signature raises InvalidInputError."""
+    with pytest.raises(InvalidInputError, match=msg):
+        getattr(client.answer, method)(**kwargs)
+    client._mock_httpx_instance.request.assert_not_called()
+
+
+def test_get_generative_answer_server_error(client, error_response):
     """Test get_generative_answer with a 500 server error."""
-    mock_resp = mock_response(500, text_data="Upstream LLM provider failed")
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(500, "Upstream LLM provider failed")
 
     with pytest.raises(APIError, match="API Error: Upstream LLM provider failed"):
         client.answer.generate(namespace=TEST_NAMESPACE, query="test")
     assert client._mock_httpx_instance.request.call_count == 4
 
 
-def test_empty_namespace(client, mocker, mock_response):
+def test_empty_namespace(client, mock_response):
     """Test empty namespace to trigger direct AI mode."""
     query = "What is Moorcheh?"
     mock_resp = mock_response(
@@ -151,7 +173,7 @@ def test_empty_namespace(client, mocker, mock_response):
     assert result["answer"] == "Moorcheh is a semantic search engine."
 
 
-def test_structured_response(client, mocker, mock_response):
+def test_structured_response(client, mock_response):
     """Test structured_response is accepted."""
     query = "What is Moorcheh?"
     structured = {"schema": {"type": "object"}}
@@ -181,7 +203,7 @@ def test_structured_response(client, mocker, mock_response):
     assert result["answer"] == "Moorcheh is a semantic search engine."
 
 
-def test_structured_response_with_empty_namespace(client, mocker, mock_response):
+def test_structured_response_with_empty_namespace(client, mock_response):
     """Test structured_response is accepted and sent with empty namespace."""
     query = "What is Moorcheh?"
     structured = {"schema": {"type": "object"}}
@@ -214,3 +236,159 @@ def test_structured_response_invalid_type(client):
         client.answer.generate(
             namespace="", query="test", structured_response=[1, 2, 3]
         )
+
+
+def test_generate_answer_deterministic_request_is_cached(
+    client, mock_response, monkeypatch
+):
+    """Test identical temperature-0 requests are served from the exact-match cache."""
+    monkeypatch.setattr(client, "_answer_cache", TTLCache(maxsize=8, ttl=60.0))
+    mock_resp = mock_response(200, json_data={"answer": "Cached answer."})
+    client._mock_httpx_instance.request.return_value = mock_resp
+
+    first = client.answer.generate(namespace=TEST_NAMESPACE, query="q", temperature=0)
+    first["answer"] = "mutated"
+    second = client.answer.generate(namespace=TEST_NAMESPACE, query="q", temperature=0)
+
+    client._mock_httpx_instance.request.assert_called_once()
+    assert second == {"answer": "Cached answer."}
+
+
+def test_generate_answer_is_not_cached_by_default(client, mock_response):
+    """Test the answer cache is opt-in, so identical requests always hit the API."""
+    mock_resp = mock_response(200, json_data={"answer": "Fresh answer."})
+    client._mock_httpx_instance.request.return_value = mock_resp
+
+    client.answer.generate(namespace=TEST_NAMESPACE, query="q", temperature=0)
+    client.answer.generate(namespace=TEST_NAMESPACE, query="q", temperature=0)
+
+    assert client._mock_httpx_instance.request.call_count == 2
+
+
+def test_generate_answer_non_deterministic_request_is_not_cached(
+    client, mock_response, monkeypatch
+):
+    """Test requests with a nonzero temperature always hit the API."""
+    monkeypatch.setattr(client, "_answer_cache", TTLCache(maxsize=8, ttl=60.0))
+    mock_resp = mock_response(200, json_data={"answer": "Fresh answer."})
+    client._mock_httpx_instance.request.return_value = mock_resp
+
+    client.answer.generate(namespace=TEST_NAMESPACE, query="q", temperature=0.5)
+    client.answer.generate(namespace=TEST_NAMESPACE, query="q", temperature=0.5)
+
+    assert client._mock_httpx_instance.request.call_count == 2
+
+
+def test_generate_many_returns_answers_in_order(client, mock_response):
+    """Test generate_many sends every request and preserves input order."""
+
+    def respond(method, url, json, params):
+        return mock_response(200, json_data={"answer": json["query"]})
+
+    client._mock_httpx_instance.request.side_effect = respond
+
+    results = client.answer.generate_many(
+        [{"query": f"q{i}", "namespace": TEST_NAMESPACE} for i in range(5)]
+    )
+
+    assert [r["answer"] for r in results] == [f"q{i}" for i in range(5)]
+    assert client._mock_httpx_instance.request.call_count == 5
+
+
+def test_generate_many_validates_before_sending(client):
+    """Test an invalid request aborts the batch before any request is sent."""
+    with pytest.raises(InvalidInputError, match="'top_k' must be a positive"):
+        client.answer.generate_many(
+            [
+                {"query": "ok", "namespace": TEST_NAMESPACE},
+                {"query": "bad", "namespace": TEST_NAMESPACE, "top_k": 0},
+            ]
+        )
+    client._mock_httpx_instance.request.assert_not_called()
+
+
+def test_stream_answer_yields_deltas_then_final(client):
+    """Test stream yields incremental deltas followed by the complete answer."""
+    stream_resp = MagicMock(status_code=200, headers=SSE_HEADERS)
+    stream_resp.iter_lines.return_value = [
+        'data: {"delta": "Moor"}',
+        "",
+        ": keep-alive",
+        'data: {"delta": "cheh"}',
+        "",
+        'data: {"answer": "Moorcheh", "model": "m"}',
+        "",
+        "data: [DONE]",
+        "",
+    ]
+    client._mock_httpx_instance.send.return_value = stream_resp
+
+    chunks = list(client.answer.stream(namespace=TEST_NAMESPACE, query="q"))
+
+    assert chunks == [
+        {"delta": "Moor", "done": False},
+        {"delta": "cheh", "done": False},
+        {"answer": "Moorcheh", "model": "m", "done": True},
+    ]
+    _, kwargs = client._mock_httpx_instance.build_request.call_args
+    assert kwargs["json"]["stream"] is True
+    assert kwargs["headers"] == {"Accept": "text/event-stream"}
+    stream_resp.close.assert_called_once()
+
+
+def test_stream_answer_error_status(client):
+    """Test stream maps an error status to the SDK exception hierarchy."""
+    stream_resp = MagicMock(status_code=400, text="bad query")
+    client._mock_httpx_instance.send.return_value = stream_resp
+
+    with pytest.raises(InvalidInputError, match="Bad Request: bad query"):
+        list(client.answer.stream(namespace=TEST_NAMESPACE, query="q"))
+
+
+def test_stream_answer_falls_back_to_json_response(client):
+    """Test a non-streamed JSON response is yielded as the single final chunk."""
+    answer = {"answer": "Moorcheh", "model": "m"}
+    json_resp = MagicMock(
+        status_code=200,
+        headers={"content-type": "application/json"},
+        content=b'{"answer": "Moorcheh", "model": "m"}',
+    )
+    json_resp.json.return_value = answer
+    client._mock_httpx_instance.send.return_value = json_resp
+
+    chunks = list(client.answer.stream(namespace=TEST_NAMESPACE, query="q"))
+
+    assert chunks == [{"answer": "Moorcheh", "model": "m", "done": True}]
+    json_resp.iter_lines.assert_not_called()
+
+
+def test_stream_answer_retries_server_errors(client, monkeypatch):
+    """Test stream retries a 5xx status like generate before reading the body."""
+    monkeypatch.setattr("moorcheh_sdk._base_client.time.sleep", lambda _: None)
+    error_resp = MagicMock(status_code=503, headers={})
+    stream_resp = MagicMock(status_code=200, headers=SSE_HEADERS)
+    stream_resp.iter_lines.return_value = ['data: {"answer": "ok"}', ""]
+    client._mock_httpx_instance.send.side_effect = [error_resp, stream_resp]
+
+    chunks = list(client.answer.stream(namespace=TEST_NAMESPACE, query="q"))
+
+    assert chunks == [{"answer": "ok", "done": True}]
+    assert client._mock_httpx_instance.send.call_count == 2
+    error_resp.close.assert_called_once()
+
+
+def test_generate_batch_applies_shared_options(client, mock_response):
+    """Test generate_batch sends one request per query with shared options."""
+    mock_resp = mock_response(200, json_data={"answer": "a"})
+    client._mock_httpx_instance.request.return_value = mock_resp
+
+    results = client.answer.generate_batch(
+        ["q1", "q2"], namespace=TEST_NAMESPACE, top_k=2, temperature=0.1
+    )
+
+    assert len(results) == 2
+    payloads = [
+        c.kwargs["json"] for c in client._mock_httpx_instance.request.call_args_list
+    ]
+    assert sorted(p["query"] for p in payloads) == ["q1", "q2"]
+    assert all(p["top_k"] == 2 and p["temperature"] == 0.1 for p in payloads)
@@ -19,33 +19,34 @@ def test_documents_upload_batching(sync_client):
     # Create 150 documents (should trigger 2 batches: 100 + 50)
     documents = [{"id": str(i), "text": f"doc {i}"} for i in range(150)]
 
-    mock_response_1 = {
-        "status": "queued",
-        "submitted_ids": [str(i) for i in range(100)],
-    }
-    mock_response_2 = {
-        "status": "queued",
-        "submitted_ids": [str(i) for i in range(100, 150)],
-    }
+    def respond(**kwargs):
+        batch = kwargs["json"]["documents"]
+        return MagicMock(
+            status_code=202,
+            json=lambda: {
+                "status": "queued",
+                "submitted_ids": [doc["id"] for doc in batch],
+            },
+        )
 
     with patch.object(sync_client, "request") as mock_request:
-        mock_request.side_effect = [
-            MagicMock(status_code=202, json=lambda: mock_response_1),
-            MagicMock(status_code=202, json=lambda: mock_response_2),
-        ]
+        mock_request.side_effect = respond
 
         response = sync_client.documents.upload(
             namespace_name="test", documents=documents
         )
 
         assert response["status"] == "queued"
-        assert len(response["submitted_ids"]) == 150
+        # Batches run concurrently, but submitted IDs keep the input order
+        assert response["submitted_ids"] == [str(i) for i in range(150)]
         assert mock_request.call_count == 2
 
         # Verify calls
-        call_args_list = mock_request.call_args_list
-        assert len(call_args_list[0].kwargs["json"]["documents"]) == 100
-        assert len(call_args_list[1].kwargs["json"]["documents"]) == 50
+        batch_sizes = sorted(
+            len(call.kwargs["json"]["documents"])
+            for call in mock_request.call_args_list
+        )
+        assert batch_sizes == [50, 100]
 
 
 @pytest.mark.asyncio
@@ -100,6 +101,37 @@ def test_vectors_upload_batching(sync_client):
         assert mock_request.call_count == 1
 
 
+def test_vectors_upload_chunks_large_lists(sync_client):
+    """Test that sync vectors upload splits lists above chunk_size and merges results."""
+    vectors = [{"id": str(i), "vector": [0.1] * 10} for i in range(150)]
+
+    def respond(**kwargs):
+        chunk = kwargs["json"]["vectors"]
+        errors = [{"id": "149", "error": "bad"}] if len(chunk) == 50 else []
+        return MagicMock(
+            status_code=201,
+            json=lambda: {
+                "status": "partial" if errors else "success",
+                "vector_ids_processed": [vec["id"] for vec in chunk if not errors],
+                "errors": errors,
+            },
+        )
+
+    with patch.object(sync_client, "request") as mock_request:
+        mock_request.side_effect = respond
+
+        response = sync_client.vectors.upload(
+            namespace_name="test", vectors=vectors, chunk_size=100
+        )
+
+        assert mock_request.call_count == 2
+        assert response == {
+            "status": "partial",
+            "vector_ids_processed": [str(i) for i in range(100)],
+            "errors": [{"id": "149", "error": "bad"}],
+        }
+
+
 @pytest.mark.asyncio
 async def test_async_vectors_upload_batching(async_client):
     vectors = [{"id": str(i), "vector": [0.1] * 10} for i in range(150)]
@@ -1,3 +1,4 @@
+import re
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,7 +15,7 @@ from tests.constants import (
 )
 
 
-def test_upload_documents_success(client, mocker, mock_response):
+def test_upload_documents_success(client, mock_response):
     """Test successful queuing of documents for upload (202 Accepted)."""
     docs = [
         {"id": TEST_DOC_ID_1, "text": "First doc"},
@@ -60,49 +61,46 @@ def test_upload_documents_invalid_input_client_side(client, invalid_docs):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_upload_documents_namespace_not_found(client, mocker, mock_response):
+def test_upload_documents_namespace_not_found(client, error_response):
     """Test uploading documents to a non-existent namespace."""
     docs = [{"id": TEST_DOC_ID_1, "text": "Test"}]
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.documents.upload(namespace_name=TEST_NAMESPACE, documents=docs)
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_delete_documents_success_200(client, mocker, mock_response):
-    """Test successful deletion of documents (200 OK)."""
-    ids_to_delete = [TEST_DOC_ID_1, TEST_DOC_ID_2]
-    expected_response = {
-        "status": "success",
-        "deleted_ids": ids_to_delete,
-        "errors": [],
-    }
-    mock_resp = mock_response(200, json_data=expected_response)
-    client._mock_httpx_instance.request.return_value = mock_resp
-
-    result = client.documents.delete(namespace_name=TEST_NAMESPACE, ids=ids_to_delete)
-
-    client._mock_httpx_instance.request.assert_called_once_with(
-        method="POST",
-        url=f"/namespaces/{TEST_NAMESPACE}/documents/delete",
-        json={"ids": ids_to_delete},
-        params=None,
-    )
-    assert result == expected_response
-
-
-def test_delete_documents_partial_success_207(client, mocker, mock_response):
-    """Test partial deletion of documents (207 Multi-Status)."""
-    ids_to_delete = [TEST_DOC_ID_1, "non-existent-id", TEST_DOC_ID_2]
-    expected_response = {
-        "status": "partial",
-        "deleted_ids": [TEST_DOC_ID_1, TEST_DOC_ID_2],
-        "errors": [{"id": "non-existent-id", "error": "ID not found"}],
-    }
-    mock_resp = mock_response(207, json_data=expected_response)
+@pytest.mark.parametrize(
+    "status_code, ids_to_delete, expected_response",
+    [
+        (
+            200,
+            [TEST_DOC_ID_1, TEST_DOC_ID_2],
+            {
+                "status": "success",
+                "deleted_ids": [TEST_DOC_ID_1, TEST_DOC_ID_2],
+                "errors": [],
+            },
+        ),
+        (
+            207,
+            [TEST_DOC_ID_1, "non-existent-id", TEST_DOC_ID_2],
+            {
+                "status": "partial",
+                "deleted_ids": [TEST_DOC_ID_1, TEST_DOC_ID_2],
+                "errors": [{"id": "non-existent-id", "error": "ID not found"}],
+            },
+        ),
+    ],
+    ids=["success_200", "partial_success_207"],
+)
+def test_delete_documents(
+    client, mock_response, status_code, ids_to_delete, expected_response
+):
+    """Test full (200 OK) and partial (207 Multi-Status) deletion of documents."""
+    mock_resp = mock_response(status_code, json_data=expected_response)
     client._mock_httpx_instance.request.return_value = mock_resp
 
     result = client.documents.delete(namespace_name=TEST_NAMESPACE, ids=ids_to_delete)
@@ -126,19 +124,18 @@ def test_delete_documents_invalid_input_client_side(client, invalid_ids):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_delete_documents_namespace_not_found(client, mocker, mock_response):
+def test_delete_documents_namespace_not_found(client, error_response):
     """Test deleting documents from a non-existent namespace."""
     ids = [TEST_DOC_ID_1]
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.documents.delete(namespace_name=TEST_NAMESPACE, ids=ids)
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_get_documents_success(client, mocker, mock_response):
+def test_get_documents_success(client, mock_response):
     """Test successful retrieval of documents."""
     ids_to_get = [TEST_DOC_ID_1, TEST_DOC_ID_2]
     expected_response = {
@@ -161,8 +158,21 @@ def test_get_documents_success(client, mocker, mock_response):
     assert result == expected_response
 
 
+def test_get_documents_quotes_namespace_in_path(client, mock_response):
+    """Test that the namespace is URL-encoded as a single path segment."""
+    client._mock_httpx_instance.request.return_value = mock_response(
+        200, json_data={"documents": []}
+    )
+
+    client.documents.get(namespace_name="team a/docs", ids=[TEST_DOC_ID_1])
+
+    _, kwargs = client._mock_httpx_instance.request.call_args
+    assert kwargs["url"] == "/namespaces/team%20a%2Fdocs/documents/get"
+
+
 @pytest.mark.parametrize(
-    "invalid_ids", [None, [], ["id1", ""], ["id1", None], [123, {}], "not a list"]
+    "invalid_ids",
+    [None, [], ["id1", ""], ["id1", None], [123, {}], "not a list", [1, "bad id"]],
 )
 def test_get_documents_invalid_input_client_side(client, invalid_ids):
     """Test client-side validation for get_documents IDs."""
@@ -171,20 +181,19 @@ def test_get_documents_invalid_input_client_side(client, invalid_ids):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_get_documents_namespace_not_found(client, mocker, mock_response):
+def test_get_documents_namespace_not_found(client, error_response):
     """Test getting documents from a non-existent namespace."""
     ids = [TEST_DOC_ID_1]
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.documents.get(namespace_name=TEST_NAMESPACE, ids=ids)
     client._mock_httpx_instance.request.assert_called_once()
 
 
 # File Upload Tests
-def test_upload_file_success(client, mocker, mock_response, tmp_path):
+def test_upload_file_success(client, mock_response, tmp_path):
     """Test successful file upload."""
     # Create a temporary PDF file
     test_file = tmp_path / "test_document.pdf"
@@ -200,7 +209,7 @@ def test_upload_file_success(client, mocker, mock_response, tmp_path):
         "message": "File uploaded successfully",
         "namespace": TEST_NAMESPACE,
         "fileName": "test_document.pdf",
-        "fileSize": len(test_file.read_bytes()),
+        "fileSize": len(b"PDF content here"),
     }
     client._mock_httpx_instance.request.side_effect = [
         mock_response(200, json_data=upload_url_data),
@@ -222,7 +231,7 @@ def test_upload_file_success(client, mocker, mock_response, tmp_path):
     assert result == expected_response
 
 
-def test_upload_file_with_path_object(client, mocker, mock_response, tmp_path):
+def test_upload_file_with_path_object(client, mock_response, tmp_path):
     """Test file upload using Path object."""
     test_file = tmp_path / "document.txt"
     test_file.write_text("Text content")
@@ -237,7 +246,7 @@ def test_upload_file_with_path_object(client, mocker, mock_response, tmp_path):
         "message": "File uploaded successfully",
         "namespace": TEST_NAMESPACE,
         "fileName": "document.txt",
-        "fileSize": len(test_file.read_bytes()),
+        "fileSize": len(b"Text content"),
     }
     client._mock_httpx_instance.request.side_effect = [
         mock_response(200, json_data=upload_url_data),
@@ -252,7 +261,7 @@ def test_upload_file_with_path_object(client, mocker, mock_response, tmp_path):
     assert client._mock_httpx_instance.request.call_count == 2
 
 
-def test_upload_file_with_file_like_object(client, mocker, mock_response, tmp_path):
+def test_upload_file_with_file_like_object(client, mock_response, tmp_path):
     """Test file upload using file-like object."""
     test_file = tmp_path / "data.json"
     test_file.write_text('{"key": "value"}')
@@ -274,7 +283,7 @@ def test_upload_file_with_file_like_object(client, mocker, mock_response, tmp_pa
             "message": "File uploaded successfully",
             "namespace": TEST_NAMESPACE,
             "fileName": f.name,
-            "fileSize": len(test_file.read_bytes()),
+            "fileSize": len(b'{"key": "value"}'),
         }
         result = client.documents.upload_file(
             namespace_name=TEST_NAMESPACE, file_path=f
@@ -284,6 +293,37 @@ def test_upload_file_with_file_like_object(client, mocker, mock_response, tmp_pa
     assert client._mock_httpx_instance.request.call_count == 2
 
 
+class _UnsizedStream:
+    """File-like object whose size cannot be determined (no tell/seek)."""
+
+    name = "notes.txt"
+
+    def read(self, size=-1):
+        return b""
+
+
+def test_upload_file_with_unsized_stream_logs(client, mock_response, caplog):
+    """Test uploading a stream of unknown size logs the upload without errors."""
+    client._mock_httpx_instance.request.side_effect = [
+        mock_response(
+            200,
+            json_data={
+                "uploadUrl": "https://example.com/upload",
+                "contentType": "text/plain",
+            },
+        ),
+        mock_response(200, text_data=""),
+    ]
+
+    with caplog.at_level("INFO", logger="moorcheh_sdk.resources.documents"):
+        result = client.documents.upload_file(
+            namespace_name=TEST_NAMESPACE, file_path=_UnsizedStream()
+        )
+
+    assert result["fileSize"] == 0
+    assert "Attempting to upload file 'notes.txt' (None bytes)" in caplog.text
+
+
 def test_upload_file_not_found(client):
     """Test file upload with non-existent file."""
     with pytest.raises(InvalidInputError, match="File not found"):
@@ -313,9 +353,7 @@ def test_upload_file_invalid_extension(client, tmp_path, file_extension):
     "file_extension",
     [".pdf", ".docx", ".xlsx", ".json", ".txt", ".csv", ".md"],
 )
-def test_upload_file_valid_extensions(
-    client, mocker, mock_response, tmp_path, file_extension
-):
+def test_upload_file_valid_extensions(client, mock_response, tmp_path, file_extension):
     """Test file upload with all valid file extensions."""
     test_file = tmp_path / f"test{file_extension}"
     test_file.write_bytes(b"content")
@@ -329,7 +367,7 @@ def test_upload_file_valid_extensions(
         "message": "File uploaded successfully",
         "namespace": TEST_NAMESPACE,
         "fileName": f"test{file_extension}",
-        "fileSize": len(test_file.read_bytes()),
+        "fileSize": len(b"content"),
     }
     client._mock_httpx_instance.request.side_effect = [
         mock_response(200, json_data=upload_url_data),
@@ -381,18 +419,14 @@ def test_upload_file_invalid_file_like_object_type(client):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_upload_file_namespace_not_found(client, mocker, mock_response, tmp_path):
+def test_upload_file_namespace_not_found(client, error_response, sample_pdf):
     """Test file upload to non-existent namespace."""
-    test_file = tmp_path / "test.pdf"
-    test_file.write_bytes(b"content")
-
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.documents.upload_file(
-            namespace_name=TEST_NAMESPACE, file_path=str(test_file)
+            namespace_name=TEST_NAMESPACE, file_path=str(sample_pdf)
         )
     client._mock_httpx_instance.request.assert_called_once()
     assert (
@@ -401,18 +435,14 @@ def test_upload_file_namespace_not_found(client, mocker, mock_response, tmp_path
     )
 
 
-def test_upload_file_authentication_error(client, mocker, mock_response, tmp_path):
+def test_upload_file_authentication_error(client, error_response, sample_pdf):
     """Test file upload with authentication error."""
-    test_file = tmp_path / "test.pdf"
-    test_file.write_bytes(b"content")
-
     error_text = "Unauthorized: API key is required"
-    mock_resp = mock_response(401, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(401, error_text)
 
-    with pytest.raises(AuthenticationError, match=error_text):
+    with pytest.raises(AuthenticationError, match=re.escape(error_text)):
         client.documents.upload_file(
-            namespace_name=TEST_NAMESPACE, file_path=str(test_file)
+            namespace_name=TEST_NAMESPACE, file_path=str(sample_pdf)
         )
     client._mock_httpx_instance.request.assert_called_once()
     assert (
@@ -421,20 +451,16 @@ def test_upload_file_authentication_error(client, mocker, mock_response, tmp_pat
     )
 
 
-def test_upload_file_api_error(client, mocker, mock_response, tmp_path):
+def test_upload_file_api_error(client, error_response, sample_pdf):
     """Test file upload with API error (500)."""
-    test_file = tmp_path / "test.pdf"
-    test_file.write_bytes(b"content")
-
     error_text = "Internal server error"
-    mock_resp = mock_response(500, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(500, error_text)
 
     from moorcheh_sdk import APIError
 
-    with pytest.raises(APIError, match=error_text):
+    with pytest.raises(APIError, match=re.escape(error_text)):
         client.documents.upload_file(
-            namespace_name=TEST_NAMESPACE, file_path=str(test_file)
+            namespace_name=TEST_NAMESPACE, file_path=str(sample_pdf)
         )
     # The client retries on 500 errors, so it will be called multiple times
     assert client._mock_httpx_instance.request.call_count >= 1
@@ -444,18 +470,14 @@ def test_upload_file_api_error(client, mocker, mock_response, tmp_path):
     )
 
 
-def test_upload_file_invalid_input_error(client, mocker, mock_response, tmp_path):
+def test_upload_file_invalid_input_error(client, error_response, sample_pdf):
     """Test file upload with API returning 400 Bad Request."""
-    test_file = tmp_path / "test.pdf"
-    test_file.write_bytes(b"content")
-
     error_text = "No file was uploaded"
-    mock_resp = mock_response(400, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(400, error_text)
 
-    with pytest.raises(InvalidInputError, match=error_text):
+    with pytest.raises(InvalidInputError, match=re.escape(error_text)):
         client.documents.upload_file(
-            namespace_name=TEST_NAMESPACE, file_path=str(test_file)
+            namespace_name=TEST_NAMESPACE, file_path=str(sample_pdf)
         )
     client._mock_httpx_instance.request.assert_called_once()
     assert (
@@ -464,7 +486,7 @@ def test_upload_file_invalid_input_error(client, mocker, mock_response, tmp_path
     )
 
 
-def test_delete_files_success_200(client, mocker, mock_response):
+def test_delete_files_success_200(client, mock_response):
     """Test successful deletion of files."""
     file_names = ["document.pdf", "report.docx"]
     expected_response = {
@@ -500,7 +522,7 @@ def test_delete_files_success_200(client, mocker, mock_response):
     assert result == expected_response
 
 
-def test_delete_files_partial_success_207(client, mocker, mock_response):
+def test_delete_files_partial_success_207(client, mock_response):
     """Test partial deletion of files (207 Multi-Status)."""
     file_names = ["document.pdf", "missing.pdf"]
     expected_response = {
@@ -549,14 +571,13 @@ def test_delete_files_invalid_input_client_side(client, invalid_file_names):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_delete_files_namespace_not_found(client, mocker, mock_response):
+def test_delete_files_namespace_not_found(client, error_response):
     """Test deleting files from a non-existent namespace."""
     file_names = ["document.pdf"]
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.documents.delete_files(
             namespace_name=TEST_NAMESPACE, file_names=file_names
         )
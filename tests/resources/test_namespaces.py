@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 from moorcheh_sdk import (
@@ -7,13 +9,14 @@ from moorcheh_sdk import (
     InvalidInputError,
     NamespaceNotFound,
 )
+from moorcheh_sdk.utils.cache import TTLCache
 from tests.constants import (
     TEST_NAMESPACE,
     TEST_VECTOR_DIM,
 )
 
 
-def test_create_namespace_success_text(client, mocker, mock_response):
+def test_create_namespace_success_text(client, mock_response):
     """Test successful creation of a text namespace."""
     mock_resp = mock_response(
         201,
@@ -37,10 +40,10 @@ def test_create_namespace_success_text(client, mocker, mock_response):
         },
         params=None,
     )
-    assert result == mock_resp.json.return_value
+    assert result == mock_resp.json()
 
 
-def test_create_namespace_success_vector(client, mocker, mock_response):
+def test_create_namespace_success_vector(client, mock_response):
     """Test successful creation of a vector namespace."""
     mock_resp = mock_response(
         201,
@@ -67,16 +70,15 @@ def test_create_namespace_success_vector(client, mocker, mock_response):
         },
         params=None,
     )
-    assert result == mock_resp.json.return_value
+    assert result == mock_resp.json()
 
 
-def test_create_namespace_conflict(client, mocker, mock_response):
+def test_create_namespace_conflict(client, error_response):
     """Test creating a namespace that already exists (409 Conflict)."""
     error_text = f"Conflict: Namespace '{TEST_NAMESPACE}' already exists."
-    mock_resp = mock_response(409, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(409, error_text)
 
-    with pytest.raises(ConflictError, match=error_text):
+    with pytest.raises(ConflictError, match=re.escape(error_text)):
         client.namespaces.create(namespace_name=TEST_NAMESPACE, type="text")
     client._mock_httpx_instance.request.assert_called_once()
 
@@ -125,18 +127,17 @@ def test_create_namespace_invalid_input_client_side(
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_create_namespace_invalid_input_server_side(client, mocker, mock_response):
+def test_create_namespace_invalid_input_server_side(client, error_response):
     """Test handling of 400 Bad Request from the server."""
     error_text = "Bad Request: Invalid characters in namespace name."
-    mock_resp = mock_response(400, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(400, error_text)
 
-    with pytest.raises(InvalidInputError, match=error_text):
+    with pytest.raises(InvalidInputError, match=re.escape(error_text)):
         client.namespaces.create(namespace_name="invalid-name-$%^", type="text")
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_list_namespaces_success(client, mocker, mock_response):
+def test_list_namespaces_success(client, mock_response):
     """Test successfully listing namespaces."""
     expected_response = {
         "namespaces": [
@@ -161,7 +162,7 @@ def test_list_namespaces_success(client, mocker, mock_response):
     assert result == expected_response
 
 
-def test_list_namespaces_success_empty(client, mocker, mock_response):
+def test_list_namespaces_success_empty(client, mock_response):
     """Test successfully listing when no namespaces exist."""
     expected_response = {"namespaces": [], "execution_time": 0.02}
     mock_resp = mock_response(200, json_data=expected_response)
@@ -175,28 +176,26 @@ def test_list_namespaces_success_empty(client, mocker, mock_response):
     assert result == expected_response
 
 
-def test_list_namespaces_api_error(client, mocker, mock_response):
+def test_list_namespaces_api_error(client, error_response):
     """Test handling of a 500 server error during list_namespaces."""
-    mock_resp = mock_response(500, text_data="Internal Server Error")
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(500, "Internal Server Error")
 
     with pytest.raises(APIError, match="API Error: Internal Server Error"):
         client.namespaces.list()
     assert client._mock_httpx_instance.request.call_count == 4
 
 
-def test_list_namespaces_auth_error(client, mocker, mock_response):
+def test_list_namespaces_auth_error(client, error_response):
     """Test handling of a 401/403 error during list_namespaces."""
     error_text = "Forbidden/Unauthorized: Invalid API Key"
-    mock_resp = mock_response(403, text_data="Invalid API Key")
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(403, "Invalid API Key")
 
-    with pytest.raises(AuthenticationError, match=error_text):
+    with pytest.raises(AuthenticationError, match=re.escape(error_text)):
         client.namespaces.list()
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_list_namespaces_unexpected_format(client, mocker, mock_response):
+def test_list_namespaces_unexpected_format(client, mock_response):
     """Test handling of unexpected response format (e.g., not a dict)."""
     mock_resp = mock_response(200, text_data="Just a string response")  # Not JSON
     client._mock_httpx_instance.request.return_value = mock_resp
@@ -206,7 +205,7 @@ def test_list_namespaces_unexpected_format(client, mocker, mock_response):
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_list_namespaces_missing_key(client, mocker, mock_response):
+def test_list_namespaces_missing_key(client, mock_response):
     """Test handling of valid JSON but missing 'namespaces' key."""
     mock_resp = mock_response(
         200, json_data={"some_other_key": []}
@@ -221,7 +220,25 @@ def test_list_namespaces_missing_key(client, mocker, mock_response):
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_delete_namespace_success(client, mocker, mock_response):
+def test_list_namespaces_cached_until_namespace_changes(
+    client, mock_response, monkeypatch
+):
+    """Test list() reuses a cached result until a namespace is deleted."""
+    monkeypatch.setattr(client, "_namespace_list_cache", TTLCache(maxsize=1, ttl=60.0))
+    client._mock_httpx_instance.request.return_value = mock_response(
+        200, json_data={"namespaces": [], "execution_time": 0.01}
+    )
+
+    client.namespaces.list()
+    client.namespaces.list()
+    assert client._mock_httpx_instance.request.call_count == 1
+
+    client.namespaces.delete(TEST_NAMESPACE)
+    client.namespaces.list()
+    assert client._mock_httpx_instance.request.call_count == 3
+
+
+def test_delete_namespace_success(client, mock_response):
     """Test successful deletion of a namespace (expecting 200 OK)."""
     # API returns 200 with a body now
     mock_resp = mock_response(
@@ -239,13 +256,12 @@ def test_delete_namespace_success(client, mocker, mock_response):
     assert result is None  # Method returns None
 
 
-def test_delete_namespace_not_found(client, mocker, mock_response):
+def test_delete_namespace_not_found(client, error_response):
     """Test deleting a namespace that does not exist (404 Not Found)."""
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.namespaces.delete(TEST_NAMESPACE)
     client._mock_httpx_instance.request.assert_called_once()
 
@@ -1,17 +1,21 @@
+import re
+
 import pytest
 
 from moorcheh_sdk import (
     APIError,
     InvalidInputError,
 )
+from moorcheh_sdk.utils.cache import TTLCache
 from tests.constants import (
     TEST_NAMESPACE,
     TEST_NAMESPACE_2,
     TEST_VECTOR_DIM,
 )
+from tests.helpers import AmbiguousTruth
 
 
-def test_search_success_text(client, mocker, mock_response):
+def test_search_success_text(client, mock_response):
     """Test successful text search."""
     query = "semantic search"
     namespaces = [TEST_NAMESPACE]
@@ -48,7 +52,7 @@ def test_search_success_text(client, mocker, mock_response):
     assert result == expected_response
 
 
-def test_search_success_vector_with_threshold(client, mocker, mock_response):
+def test_search_success_vector_with_threshold(client, mock_response):
     """Test successful vector search with threshold."""
     query = [0.1] * TEST_VECTOR_DIM
     namespaces = [TEST_NAMESPACE, TEST_NAMESPACE_2]
@@ -91,6 +95,7 @@ def test_search_success_vector_with_threshold(client, mocker, mock_response):
         (None, "q", 10, None, False),  # None namespaces
         (["ns1", ""], "q", 10, None, False),  # Empty string in namespaces
         (["ns1", 123], "q", 10, None, False),  # Non-string in namespaces
+        (["ns1", AmbiguousTruth()], "q", 10, None, False),  # Array-like item
         (["ns1"], "", 10, None, False),  # Empty query
         (["ns1"], None, 10, None, False),  # None query
         (["ns1"], "q", 0, None, False),  # Zero top_k
@@ -117,13 +122,12 @@ def test_search_invalid_input_client_side(
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_search_namespace_not_found(client, mocker, mock_response):
+def test_search_namespace_not_found(client, error_response):
     """Test search with a non-existent namespace."""
     query = "test"
     namespaces = ["non-existent-ns"]
     error_text = "Namespace 'non-existent-ns' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
     """
     Note: The _request method maps 404 to NamespaceNotFound specifically for /namespaces/{name} endpoints.
@@ -138,15 +142,14 @@ def test_search_namespace_not_found(client, mocker, mock_response):
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_search_invalid_input_server_side(client, mocker, mock_response):
+def test_search_invalid_input_server_side(client, error_response):
     """Test search with invalid input rejected by server (400)."""
     query = "test"
     namespaces = [TEST_NAMESPACE]
     error_text = "Bad Request: Query type mismatch for namespace type."
-    mock_resp = mock_response(400, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(400, error_text)
 
-    with pytest.raises(InvalidInputError, match=error_text):
+    with pytest.raises(InvalidInputError, match=re.escape(error_text)):
         client.similarity_search.query(namespaces=namespaces, query=query)
     client._mock_httpx_instance.request.assert_called_once()
 
@@ -168,7 +171,7 @@ def test_search_vector_non_numeric_raises(client):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_search_threshold_ignored_without_kiosk(client, mocker, mock_response):
+def test_search_threshold_ignored_without_kiosk(client, mock_response):
     """Test that threshold is ignored when kiosk_mode is False."""
     query = "test"
     namespaces = [TEST_NAMESPACE]
@@ -190,3 +193,30 @@ def test_search_threshold_ignored_without_kiosk(client, mocker, mock_response):
     payload = call_args.kwargs["json"]
     assert "threshold" not in payload
     assert payload["kiosk_mode"] is False
+
+
+def test_search_is_not_cached_by_default(client, mock_response):
+    """Test identical searches hit the API when the search cache is disabled."""
+    mock_resp = mock_response(200, json_data={"results": [], "execution_time": 0.1})
+    client._mock_httpx_instance.request.return_value = mock_resp
+
+    client.similarity_search.query(namespaces=[TEST_NAMESPACE], query="q")
+    client.similarity_search.query(namespaces=[TEST_NAMESPACE], query="q")
+
+    assert client._mock_httpx_instance.request.call_count == 2
+
+
+def test_search_cache_serves_identical_requests(client, mock_response, monkeypatch):
+    """Test identical searches are served from the exact-match cache when enabled."""
+    monkeypatch.setattr(client, "_search_cache", TTLCache(maxsize=8, ttl=60.0))
+    expected_response = {"results": [{"id": "doc1", "score": 0.9}]}
+    mock_resp = mock_response(200, json_data=expected_response)
+    client._mock_httpx_instance.request.return_value = mock_resp
+
+    first = client.similarity_search.query(namespaces=[TEST_NAMESPACE], query="q")
+    first["results"].clear()
+    second = client.similarity_search.query(namespaces=[TEST_NAMESPACE], query="q")
+    client.similarity_search.query(namespaces=[TEST_NAMESPACE], query="q", top_k=3)
+
+    assert client._mock_httpx_instance.request.call_count == 2
+    assert second == {"results": [{"id": "doc1", "score": 0.9}]}
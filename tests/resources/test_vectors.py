@@ -1,3 +1,5 @@
+import re
+
 import pytest
 
 from moorcheh_sdk import (
@@ -10,9 +12,10 @@ from tests.constants import (
     TEST_VEC_ID_2,
     TEST_VECTOR_DIM,
 )
+from tests.helpers import AmbiguousTruth
 
 
-def test_upload_vectors_success_201(client, mocker, mock_response):
+def test_upload_vectors_success_201(client, mock_response):
     """Test successful upload of all vectors (201 Created)."""
     vectors = [
         {"id": TEST_VEC_ID_1, "vector": [0.1] * TEST_VECTOR_DIM, "metadata": {"k": "v"}}
@@ -36,7 +39,7 @@ def test_upload_vectors_success_201(client, mocker, mock_response):
     assert result == expected_response
 
 
-def test_upload_vectors_partial_success_207(client, mocker, mock_response):
+def test_upload_vectors_partial_success_207(client, mock_response):
     """Test partial success upload of vectors (207 Multi-Status)."""
     vectors = [
         {"id": TEST_VEC_ID_1, "vector": [0.1] * TEST_VECTOR_DIM},
@@ -86,49 +89,46 @@ def test_upload_vectors_invalid_input_client_side(client, invalid_vectors):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_upload_vectors_namespace_not_found(client, mocker, mock_response):
+def test_upload_vectors_namespace_not_found(client, error_response):
     """Test uploading vectors to a non-existent namespace."""
     vectors = [{"id": TEST_VEC_ID_1, "vector": [0.1] * TEST_VECTOR_DIM}]
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.vectors.upload(namespace_name=TEST_NAMESPACE, vectors=vectors)
     client._mock_httpx_instance.request.assert_called_once()
 
 
-def test_delete_vectors_success_200(client, mocker, mock_response):
-    """Test successful deletion of vectors (200 OK)."""
-    ids_to_delete = [TEST_VEC_ID_1, TEST_VEC_ID_2]
-    expected_response = {
-        "status": "success",
-        "deleted_ids": ids_to_delete,
-        "errors": [],
-    }
-    mock_resp = mock_response(200, json_data=expected_response)
-    client._mock_httpx_instance.request.return_value = mock_resp
-
-    result = client.vectors.delete(namespace_name=TEST_NAMESPACE, ids=ids_to_delete)
-
-    client._mock_httpx_instance.request.assert_called_once_with(
-        method="POST",
-        url=f"/namespaces/{TEST_NAMESPACE}/vectors/delete",
-        json={"ids": ids_to_delete},
-        params=None,
-    )
-    assert result == expected_response
-
-
-def test_delete_vectors_partial_success_207(client, mocker, mock_response):
-    """Test partial deletion of vectors (207 Multi-Status)."""
-    ids_to_delete = [TEST_VEC_ID_1, "non-existent-id", TEST_VEC_ID_2]
-    expected_response = {
-        "status": "partial",
-        "deleted_ids": [TEST_VEC_ID_1, TEST_VEC_ID_2],
-        "errors": [{"id": "non-existent-id", "error": "ID not found"}],
-    }
-    mock_resp = mock_response(207, json_data=expected_response)
+@pytest.mark.parametrize(
+    "status_code, ids_to_delete, expected_response",
+    [
+        (
+            200,
+            [TEST_VEC_ID_1, TEST_VEC_ID_2],
+            {
+                "status": "success",
+                "deleted_ids": [TEST_VEC_ID_1, TEST_VEC_ID_2],
+                "errors": [],
+            },
+        ),
+        (
+            207,
+            [TEST_VEC_ID_1, "non-existent-id", TEST_VEC_ID_2],
+            {
+                "status": "partial",
+                "deleted_ids": [TEST_VEC_ID_1, TEST_VEC_ID_2],
+                "errors": [{"id": "non-existent-id", "error": "ID not found"}],
+            },
+        ),
+    ],
+    ids=["success_200", "partial_success_207"],
+)
+def test_delete_vectors(
+    client, mock_response, status_code, ids_to_delete, expected_response
+):
+    """Test full (200 OK) and partial (207 Multi-Status) deletion of vectors."""
+    mock_resp = mock_response(status_code, json_data=expected_response)
     client._mock_httpx_instance.request.return_value = mock_resp
 
     result = client.vectors.delete(namespace_name=TEST_NAMESPACE, ids=ids_to_delete)
@@ -143,7 +143,16 @@ def test_delete_vectors_partial_success_207(client, mocker, mock_response):
 
 
 @pytest.mark.parametrize(
-    "invalid_ids", [None, [], ["id1", ""], ["id1", None], [123, {}], "not a list"]
+    "invalid_ids",
+    [
+        None,
+        [],
+        ["id1", ""],
+        ["id1", None],
+        [123, {}],
+        ["id1", AmbiguousTruth()],
+        "not a list",
+    ],
 )
 def test_delete_vectors_invalid_input_client_side(client, invalid_ids):
     """Test client-side validation for delete_vectors IDs."""
@@ -152,13 +161,12 @@ def test_delete_vectors_invalid_input_client_side(client, invalid_ids):
     client._mock_httpx_instance.request.assert_not_called()
 
 
-def test_delete_vectors_namespace_not_found(client, mocker, mock_response):
+def test_delete_vectors_namespace_not_found(client, error_response):
     """Test deleting vectors from a non-existent namespace."""
     ids = [TEST_VEC_ID_1]
     error_text = f"Namespace '{TEST_NAMESPACE}' not found."
-    mock_resp = mock_response(404, text_data=error_text)
-    client._mock_httpx_instance.request.return_value = mock_resp
+    error_response(404, error_text)
 
-    with pytest.raises(NamespaceNotFound, match=error_text):
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
         client.vectors.delete(namespace_name=TEST_NAMESPACE, ids=ids)
     client._mock_httpx_instance.request.assert_called_once()
@@ -1,8 +1,14 @@
+import asyncio
+import re
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from moorcheh_sdk import (
+    APIError,
     AsyncMoorchehClient,
     AuthenticationError,
     InvalidInputError,
@@ -13,11 +19,35 @@ from moorcheh_sdk.resources.documents import AsyncDocuments
 from moorcheh_sdk.resources.namespaces import AsyncNamespaces
 from moorcheh_sdk.resources.search import AsyncSearch
 from moorcheh_sdk.resources.vectors import AsyncVectors
+from tests.constants import CLIENT_ENV_VARS, SSE_HEADERS
+from tests.helpers import fast_response
+
+
+@pytest.fixture(scope="module")
+def _shared_client():
+    # One client serves the whole module; its transport is patched with a
+    # single AsyncMock that is reset between tests, and the client is closed
+    # once the module is done.
+    with pytest.MonkeyPatch.context() as mp:
+        for name in CLIENT_ENV_VARS:
+            mp.delenv(name, raising=False)
+        client = AsyncMoorchehClient(api_key="test_key")
+    with patch.object(client, "request", AsyncMock()):
+        yield client
+    asyncio.run(client.close())
+
+
+@pytest.fixture
+def client(_shared_client):
+    # The client's caches are disabled by default, so the mocked transport is
+    # the only state a test can leave behind.
+    _shared_client.request.reset_mock(return_value=True, side_effect=True)
+    return _shared_client
 
 
 @pytest.fixture
-def client():
-    return AsyncMoorchehClient(api_key="test_key")
+def mock_request(client):
+    return client.request
 
 
 @pytest.mark.asyncio
@@ -32,7 +62,7 @@ async def test_client_initialization(client):
 
 
 @pytest.mark.asyncio
-async def test_namespaces_list(client):
+async def test_namespaces_list(client, mock_request):
     mock_response = {
         "namespaces": [
             {
@@ -45,121 +75,286 @@ async def test_namespaces_list(client):
         "execution_time": 0.1,
     }
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200, json=lambda: mock_response
-        )
+    mock_request.return_value = fast_response(200, mock_response)
 
-        response = await client.namespaces.list()
+    response = await client.namespaces.list()
 
-        assert response == mock_response
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["method"] == "GET"
-        assert kwargs["path"] == "/namespaces"
+    assert response == mock_response
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert kwargs["method"] == "GET"
+    assert kwargs["path"] == "/namespaces"
 
 
 @pytest.mark.asyncio
-async def test_documents_upload(client):
+async def test_documents_upload(client, mock_request):
     documents = [{"id": "1", "text": "hello"}]
     mock_response = {"status": "queued", "submitted_ids": ["1"]}
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=202, json=lambda: mock_response
-        )
+    mock_request.return_value = fast_response(202, mock_response)
 
-        response = await client.documents.upload(
-            namespace_name="test", documents=documents
-        )
+    response = await client.documents.upload(namespace_name="test", documents=documents)
 
-        assert response == mock_response
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["method"] == "POST"
-        assert kwargs["path"] == "/namespaces/test/documents"
-        assert kwargs["json"] == {"documents": documents}
+    assert response == mock_response
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert kwargs["method"] == "POST"
+    assert kwargs["path"] == "/namespaces/test/documents"
+    assert kwargs["json"] == {"documents": documents}
 
 
 @pytest.mark.asyncio
-async def test_search_query(client):
+async def test_search_query(client, mock_request):
     mock_response = {"results": [], "execution_time": 0.1}
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200, json=lambda: mock_response
-        )
+    mock_request.return_value = fast_response(200, mock_response)
 
-        response = await client.similarity_search.query(
-            namespaces=["test"], query="hello"
-        )
+    response = await client.similarity_search.query(namespaces=["test"], query="hello")
 
-        assert response == mock_response
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["method"] == "POST"
-        assert kwargs["path"] == "/search"
-        assert kwargs["json"] == {
-            "namespaces": ["test"],
-            "query": "hello",
-            "top_k": 10,
-            "kiosk_mode": False,
-        }
+    assert response == mock_response
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert kwargs["method"] == "POST"
+    assert kwargs["path"] == "/search"
+    assert kwargs["json"] == {
+        "namespaces": ["test"],
+        "query": "hello",
+        "top_k": 10,
+        "kiosk_mode": False,
+    }
 
 
 @pytest.mark.asyncio
-async def test_search_query_with_threshold(client):
+async def test_search_query_with_threshold(client, mock_request):
     mock_response = {"results": [], "execution_time": 0.1}
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200, json=lambda: mock_response
-        )
+    mock_request.return_value = fast_response(200, mock_response)
+
+    response = await client.similarity_search.query(
+        namespaces=["test"], query="hello", threshold=0.5, kiosk_mode=True
+    )
+
+    assert response == mock_response
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert kwargs["json"]["threshold"] == 0.5
+    assert kwargs["json"]["kiosk_mode"] is True
+
 
-        response = await client.similarity_search.query(
-            namespaces=["test"], query="hello", threshold=0.5, kiosk_mode=True
+@pytest.mark.asyncio
+async def test_search_query_fanout_merges_by_score(client, mock_request):
+    scores = {"ns1": [0.9, 0.2], "ns2": [0.5, 0.8]}
+
+    async def respond(**kwargs):
+        (namespace,) = kwargs["json"]["namespaces"]
+        results = [
+            {"id": f"{namespace}-{i}", "score": score}
+            for i, score in enumerate(scores[namespace])
+        ]
+        execution_time = 0.3 if namespace == "ns2" else 0.1
+        return fast_response(
+            200, {"results": results, "execution_time": execution_time}
         )
 
-        assert response == mock_response
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["json"]["threshold"] == 0.5
-        assert kwargs["json"]["kiosk_mode"] is True
+    mock_request.side_effect = respond
+
+    response = await client.similarity_search.query(
+        namespaces=["ns1", "ns2"], query="hello", top_k=3, fanout=True
+    )
+
+    assert mock_request.call_count == 2
+    assert [result["id"] for result in response["results"]] == [
+        "ns1-0",
+        "ns2-1",
+        "ns2-0",
+    ]
+    assert response["execution_time"] == 0.3
+
+
+@pytest.mark.asyncio
+async def test_search_query_fanout_cancels_other_namespaces_on_failure(
+    client, mock_request
+):
+    cancelled = []
+
+    async def respond(**kwargs):
+        (namespace,) = kwargs["json"]["namespaces"]
+        if namespace == "missing":
+            return httpx.Response(
+                404,
+                text="Namespace 'missing' not found.",
+                request=httpx.Request("POST", "https://api.moorcheh.ai/v1/search"),
+            )
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(namespace)
+            raise
+        return fast_response(200, {"results": [], "execution_time": 0.1})
+
+    mock_request.side_effect = respond
+
+    with pytest.raises(APIError, match="Namespace 'missing' not found"):
+        await client.similarity_search.query(
+            namespaces=["ns1", "missing", "ns2"], query="hello", fanout=True
+        )
+    assert sorted(cancelled) == ["ns1", "ns2"]
 
 
 @pytest.mark.asyncio
-async def test_answer_generate(client):
+async def test_answer_generate(client, mock_request):
     mock_response = {"answer": "world", "sources": [], "execution_time": 0.1}
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200, json=lambda: mock_response
-        )
+    mock_request.return_value = fast_response(200, mock_response)
 
-        response = await client.answer.generate(namespace="test", query="hello")
+    response = await client.answer.generate(namespace="test", query="hello")
 
-        assert response == mock_response
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["method"] == "POST"
-        assert kwargs["path"] == "/answer"
-        assert kwargs["json"] == {
-            "namespace": "test",
-            "query": "hello",
-            "top_k": 5,
-            "type": "text",
-            "aiModel": "anthropic.claude-sonnet-4-6",
-            "chatHistory": [],
-            "temperature": 0.7,
-            "headerPrompt": "",
-            "footerPrompt": "",
-            "kiosk_mode": False,
-        }
+    assert response == mock_response
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert kwargs["method"] == "POST"
+    assert kwargs["path"] == "/answer"
+    assert kwargs["json"] == {
+        "namespace": "test",
+        "query": "hello",
+        "top_k": 5,
+        "type": "text",
+        "aiModel": "anthropic.claude-sonnet-4-6",
+        "chatHistory": [],
+        "temperature": 0.7,
+        "headerPrompt": "",
+        "footerPrompt": "",
+        "kiosk_mode": False,
+    }
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "kwargs, msg",
+    [
+        ({"namespace": "test"}, "missing a required argument: 'query'"),
+        (
+            {"query": "q", "namespace": "test", "top": 3},
+            "unexpected keyword argument 'top'",
+        ),
+    ],
+    ids=["missing_query", "unknown_kwarg"],
+)
+async def test_answer_malformed_call_raises_invalid_input(
+    client, mock_request, kwargs, msg
+):
+    with pytest.raises(InvalidInputError, match=msg):
+        await client.answer.generate(**kwargs)
+    with pytest.raises(InvalidInputError, match=msg):
+        client.answer.stream(**kwargs)
+    mock_request.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_answer_generate_many(client, mock_request):
+    async def respond(**kwargs):
+        return fast_response(200, {"answer": kwargs["json"]["query"]})
+
+    mock_request.side_effect = respond
+
+    response = await client.answer.generate_many(
+        [{"query": f"q{i}", "namespace": "test"} for i in range(3)]
+    )
+
+    assert [r["answer"] for r in response] == ["q0", "q1", "q2"]
+    assert mock_request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_answer_stream(client):
+    async def lines():
+        for line in ['data: {"delta": "wor"}', "", 'data: {"delta": "ld"}', ""]:
+            yield line
+
+    stream_response = MagicMock(
+        status_code=200,
+        headers=SSE_HEADERS,
+        aclose=AsyncMock(),
+    )
+    stream_response.aiter_lines = lines
+
+    with patch.object(client._client, "send", AsyncMock(return_value=stream_response)):
+        chunks = [c async for c in client.answer.stream(namespace="test", query="q")]
+
+    assert chunks == [
+        {"delta": "wor", "done": False},
+        {"delta": "ld", "done": False},
+        {"answer": "world", "done": True},
+    ]
+    stream_response.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_answer_stream_falls_back_to_json_response(client):
+    json_response = MagicMock(
+        status_code=200,
+        headers={"content-type": "application/json"},
+        content=b'{"answer": "world"}',
+        aread=AsyncMock(),
+        aclose=AsyncMock(),
+    )
+    json_response.json.return_value = {"answer": "world"}
+
+    with patch.object(client._client, "send", AsyncMock(return_value=json_response)):
+        chunks = [c async for c in client.answer.stream(namespace="test", query="q")]
+
+    assert chunks == [{"answer": "world", "done": True}]
+    json_response.aread.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_answer_coalesces_identical_inflight_requests(client, mock_request):
+    async def respond(**kwargs):
+        await asyncio.sleep(0.01)
+        return fast_response(200, {"answer": "shared"})
+
+    mock_request.side_effect = respond
+
+    query = {"query": "q", "namespace": "test", "temperature": 0}
+    first, second = await client.answer.generate_many([query, dict(query)])
+
+    assert first == second == {"answer": "shared"}
+    assert first is not second
+    mock_request.assert_called_once()
+    assert client._answer_inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_answer_coalescing_survives_owner_cancellation(client, mock_request):
+    sent = asyncio.Event()
+    calls = 0
+
+    async def respond(**kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            sent.set()
+            await asyncio.sleep(10)  # The owner is cancelled while waiting here
+        return fast_response(200, {"answer": "retried"})
+
+    mock_request.side_effect = respond
+
+    query = {"query": "q", "namespace": "test", "temperature": 0}
+    owner = asyncio.create_task(client.answer.generate(**query))
+    await sent.wait()
+    waiter = asyncio.create_task(client.answer.generate(**query))
+    await asyncio.sleep(0)  # Let the waiter join the in-flight request
+    owner.cancel()
+
+    assert await waiter == {"answer": "retried"}
+    assert owner.cancelled()
+    assert mock_request.call_count == 2
+    assert client._answer_inflight == {}
 
 
 # File Upload Tests (Async)
 @pytest.mark.asyncio
-async def test_upload_file_success(client, tmp_path):
+async def test_upload_file_success(client, mock_request, tmp_path):
     """Test successful async file upload."""
     test_file = tmp_path / "test_document.pdf"
     test_file.write_bytes(b"PDF content here")
@@ -173,38 +368,32 @@ async def test_upload_file_success(client, tmp_path):
         "message": "File uploaded successfully",
         "namespace": "test",
         "fileName": "test_document.pdf",
-        "fileSize": len(test_file.read_bytes()),
+        "fileSize": len(b"PDF content here"),
     }
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.side_effect = [
-            MagicMock(
-                status_code=200,
-                json=lambda: upload_url_data,
-                content=b"{}",
-                headers={"content-type": "application/json"},
-            ),
-            MagicMock(status_code=200, text=""),
-        ]
+    mock_request.side_effect = [
+        fast_response(200, upload_url_data),
+        fast_response(200),
+    ]
 
-        response = await client.documents.upload_file(
-            namespace_name="test", file_path=str(test_file)
-        )
+    response = await client.documents.upload_file(
+        namespace_name="test", file_path=str(test_file)
+    )
 
-        assert response == expected_response
-        assert mock_request.call_count == 2
-        first_call = mock_request.call_args_list[0]
-        assert first_call.kwargs["method"] == "POST"
-        assert first_call.kwargs["path"] == "/namespaces/test/upload-url"
-        assert first_call.kwargs["json"] == {"fileName": "test_document.pdf"}
+    assert response == expected_response
+    assert mock_request.call_count == 2
+    first_call = mock_request.call_args_list[0]
+    assert first_call.kwargs["method"] == "POST"
+    assert first_call.kwargs["path"] == "/namespaces/test/upload-url"
+    assert first_call.kwargs["json"] == {"fileName": "test_document.pdf"}
 
-        second_call = mock_request.call_args_list[1]
-        assert second_call.kwargs["method"] == "PUT"
-        assert second_call.kwargs["path"] == upload_url_data["uploadUrl"]
+    second_call = mock_request.call_args_list[1]
+    assert second_call.kwargs["method"] == "PUT"
+    assert second_call.kwargs["path"] == upload_url_data["uploadUrl"]
 
 
 @pytest.mark.asyncio
-async def test_upload_file_with_path_object(client, tmp_path):
+async def test_upload_file_with_path_object(client, mock_request, tmp_path):
     """Test async file upload using Path object."""
     test_file = tmp_path / "document.txt"
     test_file.write_text("Text content")
@@ -218,30 +407,24 @@ async def test_upload_file_with_path_object(client, tmp_path):
         "message": "File uploaded successfully",
         "namespace": "test",
         "fileName": "document.txt",
-        "fileSize": len(test_file.read_bytes()),
+        "fileSize": len(b"Text content"),
     }
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.side_effect = [
-            MagicMock(
-                status_code=200,
-                json=lambda: upload_url_data,
-                content=b"{}",
-                headers={"content-type": "application/json"},
-            ),
-            MagicMock(status_code=200, text=""),
-        ]
+    mock_request.side_effect = [
+        fast_response(200, upload_url_data),
+        fast_response(200),
+    ]
 
-        response = await client.documents.upload_file(
-            namespace_name="test", file_path=test_file
-        )
+    response = await client.documents.upload_file(
+        namespace_name="test", file_path=test_file
+    )
 
-        assert response == expected_response
-        assert mock_request.call_count == 2
+    assert response == expected_response
+    assert mock_request.call_count == 2
 
 
 @pytest.mark.asyncio
-async def test_upload_file_with_file_like_object(client, tmp_path):
+async def test_upload_file_with_file_like_object(client, mock_request, tmp_path):
     """Test async file upload using file-like object."""
     test_file = tmp_path / "data.json"
     test_file.write_text('{"key": "value"}')
@@ -251,31 +434,25 @@ async def test_upload_file_with_file_like_object(client, tmp_path):
         "contentType": "application/json",
     }
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.side_effect = [
-            MagicMock(
-                status_code=200,
-                json=lambda: upload_url_data,
-                content=b"{}",
-                headers={"content-type": "application/json"},
-            ),
-            MagicMock(status_code=200, text=""),
-        ]
+    mock_request.side_effect = [
+        fast_response(200, upload_url_data),
+        fast_response(200),
+    ]
 
-        with open(test_file, "rb") as f:
-            expected_response = {
-                "success": True,
-                "message": "File uploaded successfully",
-                "namespace": "test",
-                "fileName": f.name,
-                "fileSize": len(test_file.read_bytes()),
-            }
-            response = await client.documents.upload_file(
-                namespace_name="test", file_path=f
-            )
+    with open(test_file, "rb") as f:
+        expected_response = {
+            "success": True,
+            "message": "File uploaded successfully",
+            "namespace": "test",
+            "fileName": f.name,
+            "fileSize": len(b'{"key": "value"}'),
+        }
+        response = await client.documents.upload_file(
+            namespace_name="test", file_path=f
+        )
 
-        assert response == expected_response
-        assert mock_request.call_count == 2
+    assert response == expected_response
+    assert mock_request.call_count == 2
 
 
 @pytest.mark.asyncio
@@ -308,7 +485,9 @@ async def test_upload_file_invalid_extension(client, tmp_path, file_extension):
     "file_extension",
     [".pdf", ".docx", ".xlsx", ".json", ".txt", ".csv", ".md"],
 )
-async def test_upload_file_valid_extensions(client, tmp_path, file_extension):
+async def test_upload_file_valid_extensions(
+    client, mock_request, tmp_path, file_extension
+):
     """Test async file upload with all valid file extensions."""
     test_file = tmp_path / f"test{file_extension}"
     test_file.write_bytes(b"content")
@@ -322,38 +501,34 @@ async def test_upload_file_valid_extensions(client, tmp_path, file_extension):
         "message": "File uploaded successfully",
         "namespace": "test",
         "fileName": f"test{file_extension}",
-        "fileSize": len(test_file.read_bytes()),
+        "fileSize": len(b"content"),
     }
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.side_effect = [
-            MagicMock(
-                status_code=200,
-                json=lambda: upload_url_data,
-                content=b"{}",
-                headers={"content-type": "application/json"},
-            ),
-            MagicMock(status_code=200, text=""),
-        ]
+    mock_request.side_effect = [
+        fast_response(200, upload_url_data),
+        fast_response(200),
+    ]
 
-        response = await client.documents.upload_file(
-            namespace_name="test", file_path=str(test_file)
-        )
+    response = await client.documents.upload_file(
+        namespace_name="test", file_path=str(test_file)
+    )
 
-        assert response == expected_response
-        assert mock_request.call_count == 2
+    assert response == expected_response
+    assert mock_request.call_count == 2
 
 
 @pytest.mark.asyncio
 async def test_upload_file_too_large(client, tmp_path):
     """Test async file upload with file exceeding 5GB limit."""
-    # Create a file larger than 5GB
+    # The file only has to exist; its reported size comes from the stat stub.
+    # (Newer Pythons check existence via os.path.exists, not Path.stat.)
     test_file = tmp_path / "large_file.pdf"
     test_file.write_bytes(b"x")
-    # Write 6GB of data
     too_large_size = 6 * 1024 * 1024 * 1024
 
-    with patch("pathlib.Path.stat", return_value=MagicMock(st_size=too_large_size)):
+    with patch.object(
+        Path, "stat", return_value=SimpleNamespace(st_size=too_large_size)
+    ):
         with pytest.raises(InvalidInputError, match="exceeds maximum allowed size"):
             await client.documents.upload_file(
                 namespace_name="test", file_path=str(test_file)
@@ -361,85 +536,34 @@ async def test_upload_file_too_large(client, tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_upload_file_namespace_not_found(client, tmp_path):
-    """Test async file upload to non-existent namespace."""
-    test_file = tmp_path / "test.pdf"
-    test_file.write_bytes(b"content")
-
-    error_text = "Namespace 'test' not found."
-
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_response_obj = MagicMock()
-        mock_response_obj.status_code = 404
-        mock_response_obj.text = error_text
-        mock_response_obj.json.side_effect = Exception("Cannot decode JSON")
-        mock_request.return_value = mock_response_obj
-
-        with pytest.raises(NamespaceNotFound, match=error_text):
-            await client.documents.upload_file(
-                namespace_name="test", file_path=str(test_file)
-            )
-        mock_request.assert_called_once()
-        assert mock_request.call_args.kwargs["path"] == "/namespaces/test/upload-url"
-
-
-@pytest.mark.asyncio
-async def test_upload_file_authentication_error(client, tmp_path):
-    """Test async file upload with authentication error."""
-    test_file = tmp_path / "test.pdf"
-    test_file.write_bytes(b"content")
-
-    error_text = "Unauthorized: API key is required"
-
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_response_obj = MagicMock()
-        mock_response_obj.status_code = 401
-        mock_response_obj.text = error_text
-        mock_response_obj.json.side_effect = Exception("Cannot decode JSON")
-        mock_request.return_value = mock_response_obj
-
-        with pytest.raises(AuthenticationError, match=error_text):
-            await client.documents.upload_file(
-                namespace_name="test", file_path=str(test_file)
-            )
-        mock_request.assert_called_once()
-        assert mock_request.call_args.kwargs["path"] == "/namespaces/test/upload-url"
-
-
-@pytest.mark.asyncio
-async def test_upload_file_api_error(client, tmp_path):
-    """Test async file upload with API error (500)."""
-    test_file = tmp_path / "test.pdf"
-    test_file.write_bytes(b"content")
-
-    error_text = "Internal server error"
-
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        import httpx
-
-        mock_response_obj = MagicMock()
-        mock_response_obj.status_code = 500
-        mock_response_obj.text = error_text
-        mock_response_obj.json.side_effect = Exception("Cannot decode JSON")
-        # raise_for_status should raise httpx.HTTPStatusError
-        mock_response_obj.raise_for_status.side_effect = httpx.HTTPStatusError(
-            message="HTTP 500",
-            request=MagicMock(),
-            response=mock_response_obj,
+@pytest.mark.parametrize(
+    "status_code, error_cls, error_text",
+    [
+        (404, NamespaceNotFound, "Namespace 'test' not found."),
+        (401, AuthenticationError, "Unauthorized: API key is required"),
+        (500, APIError, "Internal server error"),
+    ],
+)
+async def test_upload_file_error_responses(
+    client, mock_request, sample_pdf, status_code, error_cls, error_text
+):
+    """Test that async file upload maps upload-url error responses to exceptions."""
+    mock_request.return_value = httpx.Response(
+        status_code,
+        text=error_text,
+        request=httpx.Request("POST", "https://api.moorcheh.ai/v1"),
+    )
+
+    with pytest.raises(error_cls, match=re.escape(error_text)):
+        await client.documents.upload_file(
+            namespace_name="test", file_path=str(sample_pdf)
         )
-        mock_request.return_value = mock_response_obj
-
-        from moorcheh_sdk import APIError
-
-        with pytest.raises(APIError, match=error_text):
-            await client.documents.upload_file(
-                namespace_name="test", file_path=str(test_file)
-            )
-        assert mock_request.call_args.kwargs["path"] == "/namespaces/test/upload-url"
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["path"] == "/namespaces/test/upload-url"
 
 
 @pytest.mark.asyncio
-async def test_delete_files_success(client):
+async def test_delete_files_success(client, mock_request):
     """Test successful async deletion of files."""
     file_names = ["document.pdf", "report.docx"]
     expected_response = {
@@ -460,25 +584,22 @@ async def test_delete_files_success(client):
         ],
     }
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=200, json=lambda: expected_response
-        )
+    mock_request.return_value = fast_response(200, expected_response)
 
-        response = await client.documents.delete_files(
-            namespace_name="test", file_names=file_names
-        )
+    response = await client.documents.delete_files(
+        namespace_name="test", file_names=file_names
+    )
 
-        assert response == expected_response
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["method"] == "DELETE"
-        assert kwargs["path"] == "/namespaces/test/delete-file"
-        assert kwargs["json"] == {"fileNames": file_names}
+    assert response == expected_response
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert kwargs["method"] == "DELETE"
+    assert kwargs["path"] == "/namespaces/test/delete-file"
+    assert kwargs["json"] == {"fileNames": file_names}
 
 
 @pytest.mark.asyncio
-async def test_delete_files_partial_success_207(client):
+async def test_delete_files_partial_success_207(client, mock_request):
     """Test partial async deletion of files (207 Multi-Status)."""
     file_names = ["document.pdf", "missing.pdf"]
     expected_response = {
@@ -499,21 +620,18 @@ async def test_delete_files_partial_success_207(client):
         ],
     }
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_request.return_value = MagicMock(
-            status_code=207, json=lambda: expected_response
-        )
+    mock_request.return_value = fast_response(207, expected_response)
 
-        response = await client.documents.delete_files(
-            namespace_name="test", file_names=file_names
-        )
+    response = await client.documents.delete_files(
+        namespace_name="test", file_names=file_names
+    )
 
-        assert response == expected_response
-        mock_request.assert_called_once()
-        args, kwargs = mock_request.call_args
-        assert kwargs["method"] == "DELETE"
-        assert kwargs["path"] == "/namespaces/test/delete-file"
-        assert kwargs["json"] == {"fileNames": file_names}
+    assert response == expected_response
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert kwargs["method"] == "DELETE"
+    assert kwargs["path"] == "/namespaces/test/delete-file"
+    assert kwargs["json"] == {"fileNames": file_names}
 
 
 @pytest.mark.parametrize(
@@ -521,32 +639,28 @@ async def test_delete_files_partial_success_207(client):
     [None, [], ["id1", ""], ["id1", None], [123, {}], "not a list"],
 )
 @pytest.mark.asyncio
-async def test_delete_files_invalid_input_client_side(client, invalid_file_names):
+async def test_delete_files_invalid_input_client_side(
+    client, mock_request, invalid_file_names
+):
     """Test client-side validation for async delete_files."""
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        with pytest.raises(InvalidInputError):
-            await client.documents.delete_files(
-                namespace_name="test", file_names=invalid_file_names
-            )
-        mock_request.assert_not_called()
+    with pytest.raises(InvalidInputError):
+        await client.documents.delete_files(
+            namespace_name="test", file_names=invalid_file_names
+        )
+    mock_request.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_delete_files_namespace_not_found(client):
+async def test_delete_files_namespace_not_found(client, mock_request):
     """Test async delete_files against a non-existent namespace."""
     file_names = ["document.pdf"]
     error_text = "Namespace 'test' not found."
 
-    with patch.object(client, "request", new_callable=AsyncMock) as mock_request:
-        mock_response_obj = MagicMock()
-        mock_response_obj.status_code = 404
-        mock_response_obj.text = error_text
-        mock_response_obj.json.side_effect = Exception("Cannot decode JSON")
-        mock_request.return_value = mock_response_obj
+    mock_request.return_value = fast_response(404, text=error_text)
 
-        with pytest.raises(NamespaceNotFound, match=error_text):
-            await client.documents.delete_files(
-                namespace_name="test", file_names=file_names
-            )
-        mock_request.assert_called_once()
-        assert mock_request.call_args.kwargs["path"] == "/namespaces/test/delete-file"
+    with pytest.raises(NamespaceNotFound, match=re.escape(error_text)):
+        await client.documents.delete_files(
+            namespace_name="test", file_names=file_names
+        )
+    mock_request.assert_called_once()
+    assert mock_request.call_args.kwargs["path"] == "/namespaces/test/delete-file"
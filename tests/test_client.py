@@ -1,5 +1,5 @@
-import os
-from unittest.mock import patch
+import re
+from unittest.mock import ANY, MagicMock, patch
 
 import httpx
 import pytest
@@ -10,43 +10,55 @@ from moorcheh_sdk import (
     MoorchehError,
     __version__,
 )
+from moorcheh_sdk._base_client import DEFAULT_CONNECTION_LIMITS
+from moorcheh_sdk.utils.constants import DEFAULT_MAX_CONCURRENCY
 from tests.constants import (
     DEFAULT_BASE_URL,
     DUMMY_API_KEY,
+    SSE_HEADERS,
 )
 
+# Request attached to the httpx exceptions raised by the mocked transport.
+_REQUEST = httpx.Request("GET", DEFAULT_BASE_URL)
 
-def test_client_initialization_success_with_key(mock_httpx_client):
+
+def test_client_initialization_success_with_key(clean_env, mock_httpx_client):
     """Test successful client initialization when API key is provided."""
-    with patch.dict(os.environ, {}, clear=True):  # Isolate from env vars
-        client_instance = MoorchehClient(
-            api_key=DUMMY_API_KEY, base_url="http://test.url"
-        )
-        assert client_instance.api_key == DUMMY_API_KEY
-        assert client_instance.base_url == "http://test.url"
-
-        httpx.Client.assert_called_once_with(
-            base_url="http://test.url",
-            headers={
-                "x-api-key": DUMMY_API_KEY,
-                "Accept": "application/json",
-                "User-Agent": f"moorcheh-python-sdk/{__version__}",
-            },
-            timeout=30.0,  # Default timeout
-        )
-        client_instance.close()  # Explicitly close to avoid resource warnings
+    client_instance = MoorchehClient(api_key=DUMMY_API_KEY, base_url="http://test.url")
+    assert client_instance.api_key == DUMMY_API_KEY
+    assert client_instance.base_url == "http://test.url"
+
+    httpx.Client.assert_called_once_with(
+        base_url="http://test.url",
+        headers={
+            "x-api-key": DUMMY_API_KEY,
+            "Accept": "application/json",
+            "User-Agent": f"moorcheh-python-sdk/{__version__}",
+        },
+        timeout=30.0,  # Default timeout
+        limits=DEFAULT_CONNECTION_LIMITS,
+        http2=False,
+        verify=ANY,
+    )
+
+
+def test_default_batch_concurrency_fits_keepalive_pool():
+    """Test that default batch concurrency does not outgrow the keep-alive pool."""
+    assert (
+        DEFAULT_MAX_CONCURRENCY <= DEFAULT_CONNECTION_LIMITS.max_keepalive_connections
+    )
 
 
-def test_client_initialization_success_with_env_var(mock_httpx_client):
+def test_client_initialization_success_with_env_var(clean_env, mock_httpx_client):
     """Test successful client initialization using environment variable."""
     test_env_key = "key_from_env"
-    with patch.dict(os.environ, {"MOORCHEH_API_KEY": test_env_key}, clear=True):
-        with MoorchehClient() as client_instance:
-            assert client_instance.api_key == test_env_key
-            assert client_instance.base_url == DEFAULT_BASE_URL
-            httpx.Client.assert_called_once()
-            call_args, call_kwargs = httpx.Client.call_args
-            assert call_kwargs["headers"]["x-api-key"] == test_env_key
+    clean_env.setenv("MOORCHEH_API_KEY", test_env_key)
+    client_instance = MoorchehClient()
+    assert client_instance.api_key == test_env_key
+    assert client_instance.base_url == DEFAULT_BASE_URL
+    httpx.Client.assert_called_once()
+    call_args, call_kwargs = httpx.Client.call_args
+    assert call_kwargs["headers"]["x-api-key"] == test_env_key
 
 
 def test_client_initialization_failure_no_key(client_no_env_key):
@@ -55,90 +67,131 @@ def test_client_initialization_failure_no_key(client_no_env_key):
         MoorchehClient()
 
 
-def test_client_initialization_uses_env_base_url(mock_httpx_client):
+def test_client_initialization_uses_env_base_url(clean_env, mock_httpx_client):
     """Test client initialization uses MOORCHEH_BASE_URL environment variable."""
     test_env_url = "http://env.url"
-    with patch.dict(
-        os.environ,
-        {"MOORCHEH_API_KEY": DUMMY_API_KEY, "MOORCHEH_BASE_URL": test_env_url},
-        clear=True,
-    ):
-        with MoorchehClient() as client_instance:
-            assert client_instance.base_url == test_env_url
-            httpx.Client.assert_called_once()
-            call_args, call_kwargs = httpx.Client.call_args
-            assert call_kwargs["base_url"] == test_env_url
-
-
-def test_client_initialization_base_url_priority(mock_httpx_client):
+    clean_env.setenv("MOORCHEH_API_KEY", DUMMY_API_KEY)
+    clean_env.setenv("MOORCHEH_BASE_URL", test_env_url)
+    client_instance = MoorchehClient()
+    assert client_instance.base_url == test_env_url
+    httpx.Client.assert_called_once()
+    call_args, call_kwargs = httpx.Client.call_args
+    assert call_kwargs["base_url"] == test_env_url
+
+
+def test_client_initialization_base_url_priority(clean_env, mock_httpx_client):
     """Test constructor base_url overrides environment variable."""
     constructor_url = "http://constructor.url"
     env_url = "http://env.url"
-    with patch.dict(
-        os.environ,
-        {"MOORCHEH_API_KEY": DUMMY_API_KEY, "MOORCHEH_BASE_URL": env_url},
-        clear=True,
-    ):
-        with MoorchehClient(base_url=constructor_url) as client_instance:
-            assert client_instance.base_url == constructor_url  # Constructor wins
-            httpx.Client.assert_called_once()
-            call_args, call_kwargs = httpx.Client.call_args
-            assert call_kwargs["base_url"] == constructor_url
-
-
-def test_request_timeout(client, mocker):
-    """Test handling of httpx.TimeoutException."""
-    client._mock_httpx_instance.request.side_effect = httpx.TimeoutException(
-        "Request timed out", request=mocker.MagicMock()
-    )
+    clean_env.setenv("MOORCHEH_API_KEY", DUMMY_API_KEY)
+    clean_env.setenv("MOORCHEH_BASE_URL", env_url)
+    client_instance = MoorchehClient(base_url=constructor_url)
+    assert client_instance.base_url == constructor_url  # Constructor wins
+    httpx.Client.assert_called_once()
+    call_args, call_kwargs = httpx.Client.call_args
+    assert call_kwargs["base_url"] == constructor_url
+
+
+@pytest.mark.parametrize(
+    "side_effect, match, expected_calls",
+    [
+        # Timeouts are retried: initial call + 3 retries
+        (
+            httpx.TimeoutException("Request timed out", request=_REQUEST),
+            "Request timed out after 30.0 seconds.",
+            4,
+        ),
+        (
+            httpx.RequestError("Network error occurred", request=_REQUEST),
+            "Network or request error: Network error occurred",
+            1,
+        ),
+        # Unexpected non-httpx errors are wrapped as well
+        (
+            ValueError("Something completely unexpected happened"),
+            "An unexpected error occurred: Something completely unexpected happened",
+            1,
+        ),
+    ],
+    ids=["timeout", "network_error", "unexpected_error"],
+)
+def test_request_transport_errors(client, side_effect, match, expected_calls):
+    """Test that errors raised by the transport surface as MoorchehError."""
+    client._mock_httpx_instance.request.side_effect = side_effect
 
-    with pytest.raises(MoorchehError, match="Request timed out after 30.0 seconds."):
+    with pytest.raises(MoorchehError, match=re.escape(match)):
         client.namespaces.list()
-    assert client._mock_httpx_instance.request.call_count == 4
+    assert client._mock_httpx_instance.request.call_count == expected_calls
 
 
-def test_request_network_error(client, mocker):
-    """Test handling of httpx.RequestError."""
-    error_msg = "Network error occurred"
-    client._mock_httpx_instance.request.side_effect = httpx.RequestError(
-        error_msg, request=mocker.MagicMock()
+@pytest.mark.parametrize(
+    "use_context_manager", [True, False], ids=["context_manager", "explicit_close"]
+)
+def test_client_close(clean_env, mock_httpx_client, use_context_manager):
+    """Test that leaving the context manager or calling close() closes the httpx client."""
+    client_instance = MoorchehClient(api_key=DUMMY_API_KEY)
+    if use_context_manager:
+        with client_instance as entered:
+            assert entered is client_instance
+            mock_httpx_client.close.assert_not_called()
+    else:
+        client_instance.close()
+    mock_httpx_client.close.assert_called_once()
+
+
+def test_client_fast_json_uses_orjson(clean_env, mock_httpx_client, mock_response):
+    """Test that fast_json sends pre-encoded bytes and decodes with orjson."""
+    pytest.importorskip("orjson")
+    with MoorchehClient(api_key=DUMMY_API_KEY, fast_json=True) as client_instance:
+        # Only the raw body is set, so response.json() would raise if called.
+        mock_resp = mock_response(200, text_data='{"data": "dummy"}')
+        mock_httpx_client.request.return_value = mock_resp
+
+        result = client_instance._request(
+            "POST", "/search", json_data={"query": "q"}, expected_status=200
+        )
+
+        mock_httpx_client.request.assert_called_once_with(
+            method="POST",
+            url="/search",
+            json=None,
+            params=None,
+            content=b'{"query":"q"}',
+            headers={"Content-Type": "application/json"},
+        )
+        assert result == {"data": "dummy"}
+
+
+def test_client_fast_json_encodes_stream_body(clean_env, mock_httpx_client):
+    """Test that fast_json also pre-encodes the body of streaming requests."""
+    pytest.importorskip("orjson")
+    client_instance = MoorchehClient(api_key=DUMMY_API_KEY, fast_json=True)
+    stream_resp = MagicMock(status_code=200, headers=SSE_HEADERS)
+    stream_resp.iter_lines.return_value = ["data: hi", ""]
+    mock_httpx_client.send.return_value = stream_resp
+
+    assert list(client_instance._request_stream("POST", "/answer", {"q": 1})) == ["hi"]
+
+    mock_httpx_client.build_request.assert_called_once_with(
+        method="POST",
+        url="/answer",
+        json=None,
+        headers={"Accept": "text/event-stream", "Content-Type": "application/json"},
+        content=b'{"q":1}',
     )
 
-    with pytest.raises(MoorchehError, match=f"Network or request error: {error_msg}"):
-        client.namespaces.list()
-    client._mock_httpx_instance.request.assert_called_once()
 
+@pytest.mark.parametrize("has_h2", [True, False])
+def test_client_http2_requires_h2(clean_env, mock_httpx_client, has_h2):
+    """Test that http2 is enabled only when the h2 package is available."""
+    with patch("moorcheh_sdk._base_client.HAS_H2", has_h2):
+        MoorchehClient(api_key=DUMMY_API_KEY, http2=True)
 
-def test_request_unexpected_error(client, mocker):
-    """Test handling of unexpected non-httpx errors during request."""
-    error_msg = "Something completely unexpected happened"
-    client._mock_httpx_instance.request.side_effect = ValueError(
-        error_msg
-    )  # Example unexpected error
+    _, kwargs = httpx.Client.call_args
+    assert kwargs["http2"] is has_h2
 
-    with pytest.raises(
-        MoorchehError, match=f"An unexpected error occurred: {error_msg}"
-    ):
-        client.namespaces.list()
-    client._mock_httpx_instance.request.assert_called_once()
-
-
-def test_client_context_manager(mock_httpx_client, mocker, mock_response):
-    """Test that the client's close method is called when used as a context manager."""
-    with patch.dict(os.environ, {}, clear=True):
-        with MoorchehClient(api_key=DUMMY_API_KEY) as client_instance:
-            assert isinstance(client_instance, MoorchehClient)
-            mock_resp = mock_response(200, json_data={"namespaces": []})
-            mock_httpx_client.request.return_value = mock_resp
-            client_instance.namespaces.list()
-        mock_httpx_client.close.assert_called_once()
-
-
-def test_client_explicit_close(mock_httpx_client):
-    """
-    Test that calling client.close() explicitly calls the underlying client's close.
-    """
-    with patch.dict(os.environ, {}, clear=True):  # Isolate from env vars
-        client_instance = MoorchehClient(api_key=DUMMY_API_KEY)
-        client_instance.close()
-        mock_httpx_client.close.assert_called_once()
+
+def test_resource_repr_does_not_format_client(client):
+    """Test that resource repr only identifies the client and has no __dict__."""
+    assert repr(client.answer) == f"Answer(client=<MoorchehClient at {id(client):#x}>)"
+    assert not hasattr(client.answer, "__dict__")
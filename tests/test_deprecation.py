@@ -4,7 +4,7 @@ from moorcheh_sdk import MoorchehClient
 from tests.constants import DUMMY_API_KEY
 
 
-def test_deprecated_methods(mock_httpx_client, mocker, mock_response):
+def test_deprecated_methods(mock_httpx_client, mock_response):
     """Test that deprecated methods issue a warning and call the new resource methods."""
     with MoorchehClient(api_key=DUMMY_API_KEY) as client:
         client._mock_httpx_instance = mock_httpx_client
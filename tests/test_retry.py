@@ -3,7 +3,7 @@ import pytest
 from moorcheh_sdk import MoorchehError
 
 
-def test_retry_on_500(client, mocker, mock_response):
+def test_retry_on_500(client, mock_response):
     """Test that the client retries on 500 errors."""
     # Mock responses: 500, 500, 200
     mock_resp_500 = mock_response(500, text_data="Internal Server Error")
@@ -21,10 +21,9 @@ def test_retry_on_500(client, mocker, mock_response):
     assert response == {"namespaces": ["test-namespace"]}
 
 
-def test_retry_max_retries_exceeded(client, mocker, mock_response):
+def test_retry_max_retries_exceeded(client, error_response):
     """Test that the client stops retrying after max_retries."""
-    mock_resp_500 = mock_response(500, text_data="Internal Server Error")
-    client._mock_httpx_instance.request.return_value = mock_resp_500
+    error_response(500, "Internal Server Error")
 
     # Default max_retries is 3
     with pytest.raises(MoorchehError):
@@ -34,7 +33,7 @@ def test_retry_max_retries_exceeded(client, mocker, mock_response):
     assert client._mock_httpx_instance.request.call_count == 4
 
 
-def test_retry_on_429_with_retry_after(client, mocker, mock_response):
+def test_retry_on_429_with_retry_after(client, mock_response):
     """Test retry on 429 with Retry-After header."""
     mock_resp_429 = mock_response(429, text_data="Too Many Requests")
     mock_resp_429.headers["Retry-After"] = "0.1"
@@ -48,10 +47,9 @@ def test_retry_on_429_with_retry_after(client, mocker, mock_response):
     assert response == {"namespaces": ["test-namespace"]}
 
 
-def test_no_retry_on_400(client, mocker, mock_response):
+def test_no_retry_on_400(client, error_response):
     """Test that 400 errors are NOT retried."""
-    mock_resp_400 = mock_response(400, text_data="Bad Request")
-    client._mock_httpx_instance.request.return_value = mock_resp_400
+    error_response(400, "Bad Request")
 
     from moorcheh_sdk import InvalidInputError
 
@@ -0,0 +1,39 @@
+from unittest.mock import patch
+
+from moorcheh_sdk.utils.cache import TTLCache, payload_cache_key
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the oldest untouched entry is evicted when full."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries():
+    """Test that entries older than the TTL are dropped."""
+    with patch("moorcheh_sdk.utils.cache.time.monotonic") as monotonic:
+        monotonic.return_value = 100.0
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        monotonic.return_value = 110.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+def test_ttl_cache_disabled_with_zero_maxsize():
+    """Test that a zero-capacity cache never stores entries."""
+    cache: TTLCache[str, int] = TTLCache(maxsize=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_payload_cache_key_is_order_independent():
+    """Test that key order does not affect the computed cache key."""
+    assert payload_cache_key({"a": 1, "b": 2}) == payload_cache_key({"b": 2, "a": 1})
+    assert payload_cache_key({"a": object()}) is None
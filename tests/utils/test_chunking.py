@@ -0,0 +1,20 @@
+from moorcheh_sdk.utils.batching import chunk_iterable
+
+
+def test_chunk_iterable_slices_lists():
+    """Test that lists are split into slices of the requested size."""
+    items = list(range(7))
+
+    assert list(chunk_iterable(items, 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+def test_chunk_iterable_consumes_generators():
+    """Test that non-list iterables are chunked lazily."""
+    items = (i for i in range(5))
+
+    assert list(chunk_iterable(items, 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_chunk_iterable_empty():
+    """Test that an empty input yields no chunks."""
+    assert list(chunk_iterable([], 3)) == []
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+import pytest
+
+from moorcheh_sdk.utils.concurrency import gather_bounded, map_concurrently
+
+
+def test_map_concurrently_keeps_input_order():
+    """Test that results come back in input order."""
+    assert map_concurrently(lambda x: x * 2, [3, 1, 2], 2) == [6, 2, 4]
+
+
+def test_map_concurrently_cancels_unstarted_calls_on_failure():
+    """Test that a failure cancels the queued calls and raises that failure."""
+    started = []
+
+    def func(item):
+        started.append(item)
+        if item == 0:
+            raise ValueError("batch 0 failed")
+        time.sleep(0.05)
+        return item
+
+    with pytest.raises(ValueError, match="batch 0 failed"):
+        map_concurrently(func, list(range(20)), 2)
+    assert len(started) < 20
+
+
+@pytest.mark.asyncio
+async def test_gather_bounded_cancels_pending_calls_on_failure():
+    """Test that a failure cancels in-flight and queued calls before raising."""
+    started = []
+    cancelled = []
+
+    async def func(item):
+        started.append(item)
+        if item == 1:
+            raise ValueError("batch 1 failed")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+        return item
+
+    with pytest.raises(ValueError, match="batch 1 failed"):
+        await gather_bounded(func, list(range(6)), 3)
+    # Item 3 takes the slot freed by the failure; items 4 and 5 never start.
+    assert sorted(started) == [0, 1, 2, 3]
+    assert sorted(cancelled) == [0, 2, 3]
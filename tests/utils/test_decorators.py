@@ -82,3 +82,31 @@ def test_required_args_list_validation():
         InvalidInputError, match="Argument 'items' must be of type <class 'list'>."
     ):
         func("not a list")
+
+
+def test_required_args_checks_defaulted_arguments():
+    """Test that a required argument left at a None default is rejected."""
+
+    @required_args(["name"], types={"name": str})
+    def func(name=None):
+        return name
+
+    assert func("ok") == "ok"
+
+    with pytest.raises(InvalidInputError, match="Argument 'name' cannot be None."):
+        func()
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda obj: obj.method(1, "test", None, "extra"),
+        lambda obj: obj.method(1, "test", d="unknown"),
+        lambda obj: obj.method(1, "test", a=2),
+        lambda obj: obj.method(b="test"),
+    ],
+)
+def test_required_args_malformed_calls(call):
+    """Test that calls that do not match the signature raise InvalidInputError."""
+    with pytest.raises(InvalidInputError):
+        call(TestClass())
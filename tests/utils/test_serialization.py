@@ -0,0 +1,23 @@
+import pytest
+
+from moorcheh_sdk.utils.serialization import json_dumps, json_loads
+
+
+def test_json_dumps_is_compact_and_round_trips():
+    """Test that payloads are encoded compactly and decode to the same value."""
+    payload = {"b": [1, 2.5], "a": "é"}
+
+    encoded = json_dumps(payload, sort_keys=True)
+
+    assert encoded == '{"a":"é","b":[1,2.5]}'.encode()
+    assert json_loads(encoded) == payload
+
+
+def test_json_dumps_serializes_numpy_arrays():
+    """Test that NumPy vectors are encoded without converting them to lists."""
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("orjson")
+
+    encoded = json_dumps({"vector": np.array([0.5, 1.0], dtype=np.float32)})
+
+    assert json_loads(encoded) == {"vector": [0.5, 1.0]}
@@ -0,0 +1,17 @@
+from moorcheh_sdk.utils.sse import SSEDecoder
+
+
+def test_sse_decoder_joins_multiline_data_and_skips_comments():
+    """Test that data lines are joined and comments/other fields are ignored."""
+    decoder = SSEDecoder()
+    lines = [": ping", "event: message", "data: first", "data:second", ""]
+    events = [e for e in (decoder.decode(line) for line in lines) if e is not None]
+    assert events == ["first\nsecond"]
+
+
+def test_sse_decoder_flush_returns_unterminated_event():
+    """Test that flush returns data not followed by a blank line."""
+    decoder = SSEDecoder()
+    assert decoder.decode("data: tail") is None
+    assert decoder.flush() == "tail"
+    assert decoder.flush() is None
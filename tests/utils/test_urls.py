@@ -0,0 +1,11 @@
+from moorcheh_sdk.utils.urls import namespace_path
+
+
+def test_namespace_path_plain_name():
+    """Test that URL-safe names are used as is."""
+    assert namespace_path("my-namespace_1") == "/namespaces/my-namespace_1"
+
+
+def test_namespace_path_quotes_reserved_characters():
+    """Test that reserved characters are encoded within a single segment."""
+    assert namespace_path("a b/c?d") == "/namespaces/a%20b%2Fc%3Fd"
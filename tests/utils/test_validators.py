@@ -0,0 +1,71 @@
+import pytest
+
+from moorcheh_sdk.exceptions import InvalidInputError
+from moorcheh_sdk.utils.validators import (
+    all_instances,
+    check_required,
+    is_numeric_vector,
+    required_checker,
+)
+
+
+@pytest.mark.parametrize(
+    "value, expected_type, msg",
+    [
+        (None, str, "Argument 'x' cannot be None."),
+        ("", str, "Argument 'x' cannot be empty."),
+        ([], list, "Argument 'x' cannot be empty."),
+        (1, str, "Argument 'x' must be of type <class 'str'>."),
+    ],
+)
+def test_check_required_invalid(value, expected_type, msg):
+    """Test that invalid values raise InvalidInputError with the decorator's messages."""
+    with pytest.raises(InvalidInputError, match=msg):
+        check_required("x", value, expected_type)
+
+
+def test_check_required_valid():
+    """Test that valid values pass, including falsy non-collection values."""
+    check_required("x", "value", str)
+    check_required("x", 0, int)
+    check_required("x", [1], None)
+
+
+@pytest.mark.parametrize(
+    "expected_type", [str, list, (str, list), int, (int, str), object, None]
+)
+@pytest.mark.parametrize("value", [None, "", [], {}, 0, "a", [1], 1.5])
+def test_required_checker_matches_check_required(value, expected_type):
+    """Test that the specialized checker raises exactly what check_required raises."""
+    try:
+        check_required("x", value, expected_type)
+    except InvalidInputError as e:
+        with pytest.raises(InvalidInputError) as exc_info:
+            required_checker("x", expected_type)(value)
+        assert str(exc_info.value) == str(e)
+    else:
+        required_checker("x", expected_type)(value)
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([0.1, 2, -3.5], True),
+        ([True, 1.0], True),
+        ([0.1, "0.2"], False),
+        ([0.1, None], False),
+    ],
+)
+def test_is_numeric_vector(values, expected):
+    """Test that only int/float elements (including subclasses) are accepted."""
+    assert is_numeric_vector(values) is expected
+
+
+def test_all_instances_accepts_subclasses():
+    """Test that subclasses pass through the isinstance fallback."""
+
+    class Name(str):
+        pass
+
+    assert all_instances(["a", Name("b")], (str,)) is True
+    assert all_instances(["a", 1], (str,)) is False